@@ -0,0 +1,60 @@
+"""벤치마크 공통 설정.
+
+각 벤치마크는 BENCH_ROUNDS번 실행한 소요 시간의 중앙값을 thresholds.json의
+기준(초)과 비교한다. 느린 CI 머신에서는 BENCH_FACTOR로 기준을 늘린다.
+
+    python -m pytest benchmarks -q -s
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.crawlers.base import start_run
+
+from .make_fixtures import FIXTURE_TODAY, FIXTURES
+
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "5"))
+BENCH_FACTOR = float(os.getenv("BENCH_FACTOR", "1.0"))
+
+with open(os.path.join(os.path.dirname(__file__), "thresholds.json"), encoding="utf-8") as f:
+    THRESHOLDS: dict[str, float] = json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def replay_fixtures():
+    """모든 크롤러가 픽스처로 응답받고, '오늘'은 픽스처 기준일로 고정."""
+    start_run(FIXTURE_TODAY)
+    with (
+        patch("src.crawlers.base.REPLAY_DIR", FIXTURES),
+        patch("src.crawlers.naver_news.NAVER_CLIENT_ID", "bench"),
+        patch("src.crawlers.naver_news.NAVER_CLIENT_SECRET", "bench"),
+    ):
+        yield
+    start_run()
+
+
+@pytest.fixture
+def bench():
+    """bench(name, fn): fn을 반복 실행해 중앙값이 기준 안인지 확인하고 마지막 결과를 반환."""
+
+    def run(name, fn):
+        times = []
+        result = None
+        for _ in range(BENCH_ROUNDS):
+            started = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - started)
+        median = statistics.median(times)
+        limit = THRESHOLDS[name] * BENCH_FACTOR
+        print(f"\n[bench] {name}: 중앙값 {median * 1000:.1f}ms (최소 {min(times) * 1000:.1f}ms, 기준 {limit * 1000:.0f}ms)")
+        assert median <= limit, f"{name}: {median:.3f}s > {limit:.3f}s"
+        return result
+
+    return run
@@ -0,0 +1,159 @@
+"""벤치마크용 합성 픽스처 생성.
+
+실제 사이트 구조(각 크롤러 모듈 docstring 참고)를 흉내 낸 목록 페이지와 네이버
+API 응답을 src.replay 픽스처 형식으로 저장한다. 실제 응답으로 바꾸려면
+네트워크가 되는 곳에서 `python -m src.replay record benchmarks/fixtures`를 실행한다.
+
+    python -m benchmarks.make_fixtures
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import requests
+
+from src.config import MAX_PAGES, SEARCH_KEYWORDS
+from src.crawlers import bizinfo, kised, kstartup, mss, naver_news
+from src.replay import FIXTURE_VERSION, save_fixture
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE_TODAY = date(2026, 10, 15)  # 벤치마크 실행 시 기준 '오늘'
+PAGES = MAX_PAGES
+PER_PAGE = 15
+
+_HTML_HEADERS = {"Content-Type": "text/html; charset=utf-8"}
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+_TOPICS = [
+    "예비창업패키지 예비창업자 모집",
+    "초기창업패키지 창업기업 모집",
+    "창업도약패키지 대기업 협업 프로그램",
+    "스마트공장 구축 지원사업",
+    "수출바우처 참여기업 모집",
+    "글로벌 액셀러레이팅 지원사업",
+    "TIPS 프로그램 창업팀 모집",
+    "청년창업사관학교 입교생 모집",
+    "R&D 바우처 사업 공고",
+    "소상공인 디지털 전환 지원",
+]
+
+_CHROME = "<html><head><title>목록</title></head><body>" + "".join(
+    f'<div class="gnb"><ul>{"".join(f"<li><a href=/m{i}_{j}>메뉴 {j}</a></li>" for j in range(12))}</ul></div>'
+    for i in range(6)
+)
+
+
+def _day(page: int, i: int) -> date:
+    return FIXTURE_TODAY - timedelta(days=1 + ((page - 1) * PER_PAGE + i) // 2)
+
+
+def _title(page: int, i: int) -> str:
+    return f"2026년 {_TOPICS[(page * PER_PAGE + i) % len(_TOPICS)]} ({page}-{i})"
+
+
+def _url(base: str, params: dict | None) -> str:
+    return requests.Request("GET", base, params=params or None).prepare().url
+
+
+def _kstartup(page: int) -> str:
+    items = []
+    for i in range(PER_PAGE):
+        sn = 180000 - (page - 1) * PER_PAGE - i
+        d = _day(page, i)
+        items.append(
+            f"""<li><div class="top"><span class="flag">공고</span></div>
+<div class="middle"><a href="javascript:go_view({sn});"><div class="tit_wrap"><p class="tit">{_title(page, i)}</p></div></a></div>
+<div class="bottom"><span class="list">창업진흥원</span><span class="list">등록일자 {d.isoformat()}</span>
+<span class="list">마감일자 {(d + timedelta(days=30)).isoformat()}</span></div></li>"""
+        )
+    return f'{_CHROME}<div id="bizPbancList"><ul>{"".join(items)}</ul></div></body></html>'
+
+
+def _kised(page: int) -> str:
+    items = []
+    for i in range(PER_PAGE):
+        sn = 180000 - (page - 1) * PER_PAGE - i
+        d = _day(page, i)
+        items.append(
+            f"""<li><a href="https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?schM=view&amp;pbancSn={sn}">
+<b class="ls_tit">{_title(page, i)}</b></a>
+<dl class="clearfix"><dt>기관명</dt><dd>창업진흥원</dd><dt>마감일자</dt><dd>{(d + timedelta(days=30)).isoformat()}</dd></dl>
+<span class="state">진행중</span></li>"""
+        )
+    return f'{_CHROME}<ul class="lstyle_list">{"".join(items)}</ul></body></html>'
+
+
+def _table(rows: list[str], cls: str) -> str:
+    return f'{_CHROME}<div class="board_list"><table class="{cls}"><tbody>{"".join(rows)}</tbody></table></div></body></html>'
+
+
+def _mss(page: int) -> str:
+    rows = []
+    for i in range(PER_PAGE):
+        idx = 1060000 - (page - 1) * PER_PAGE - i
+        rows.append(
+            f"""<tr><td>{idx}</td><td class="subject"><a href="#" onclick="fn_detail('86', '{idx}'); return false;">
+중기부, {_title(page, i)} 발표</a></td><td>대변인실</td><td>{_day(page, i).strftime("%Y.%m.%d")}</td><td>123</td></tr>"""
+        )
+    return _table(rows, "boardList")
+
+
+def _bizinfo(page: int) -> str:
+    rows = []
+    for i in range(PER_PAGE):
+        pid = f"PBLN_{100000000000 - (page - 1) * PER_PAGE - i:015d}"
+        rows.append(
+            f"""<tr><td>{(page - 1) * PER_PAGE + i + 1}</td><td>기술</td>
+<td class="txt_l"><a href="/web/lay1/bbs/S1T122C128/AS/74/view.do?pblancId={pid}">{_title(page, i)}</a></td>
+<td>{_day(page, i).isoformat()} ~ {(_day(page, i) + timedelta(days=30)).isoformat()}</td><td>중소벤처기업부</td></tr>"""
+        )
+    return _table(rows, "tbl_type1")
+
+
+def _naver(keyword: str, start: int, count: int) -> bytes:
+    kid = SEARCH_KEYWORDS.index(keyword)
+    items = []
+    for i in range(count):
+        n = start + i
+        pub = datetime.combine(FIXTURE_TODAY, datetime.min.time(), timezone(timedelta(hours=9))) - timedelta(hours=n)
+        items.append(
+            {
+                "title": f"<b>{keyword}</b> 관련 {_TOPICS[n % len(_TOPICS)]} 소식 {n}",
+                "originallink": f"https://news.example.com/{kid}/{n}?utm_source=naver",
+                "link": f"https://n.news.naver.com/mnews/article/001/{kid:04d}{n:06d}",
+                "description": "창업 지원 정책 관련 기사 본문 요약",
+                "pubDate": format_datetime(pub),
+            }
+        )
+    return json.dumps({"total": 140, "start": start, "display": count, "items": items}, ensure_ascii=False).encode()
+
+
+def main() -> None:
+    shutil.rmtree(os.path.join(FIXTURES, f"v{FIXTURE_VERSION}"), ignore_errors=True)
+
+    list_pages = [
+        (kstartup.KStartupCrawler(), _kstartup),
+        (kised.KisedCrawler(), _kised),
+        (mss.MSSCrawler(), _mss),
+        (bizinfo.BizinfoCrawler(), _bizinfo),
+    ]
+    for crawler, render in list_pages:
+        for page in range(1, PAGES + 1):
+            url, params = crawler.page_request(page)
+            save_fixture(FIXTURES, "GET", _url(url, params), 200, _HTML_HEADERS, render(page).encode(), "utf-8")
+
+    for keyword in SEARCH_KEYWORDS:
+        for start, count in ((1, 100), (101, 40)):
+            params = {"query": keyword, "display": 100, "start": start, "sort": "date"}
+            save_fixture(
+                FIXTURES, "GET", _url(naver_news.API_URL, params), 200, _JSON_HEADERS, _naver(keyword, start, count)
+            )
+
+
+if __name__ == "__main__":
+    main()
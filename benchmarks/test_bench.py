@@ -0,0 +1,33 @@
+"""크롤러별 수집 → 파싱 → 처리 → 메시지 생성, 전체 파이프라인 벤치마크."""
+
+import pytest
+
+from src.crawlers import BizinfoCrawler, KisedCrawler, KStartupCrawler, MSSCrawler, NaverNewsCrawler
+from src.history import HistoryStore
+from src.main import collect_all
+from src.notifier import _build_main_message, _build_thread_chunks
+from src.processor import process
+
+CRAWLERS = [KStartupCrawler, KisedCrawler, MSSCrawler, BizinfoCrawler, NaverNewsCrawler]
+
+
+def _digest(articles):
+    history = HistoryStore(":memory:", legacy_file=None)
+    try:
+        categorized = process(articles, history)
+        return categorized, _build_main_message(categorized), _build_thread_chunks(categorized)
+    finally:
+        history.close()
+
+
+@pytest.mark.parametrize("crawler_cls", CRAWLERS, ids=lambda c: c.name)
+def test_crawler(bench, crawler_cls):
+    categorized, main, thread = bench(crawler_cls.name, lambda: _digest(crawler_cls().crawl()))
+    assert any(categorized.values())
+    assert main and thread
+
+
+def test_pipeline(bench):
+    categorized, main, _ = bench("pipeline", lambda: _digest(collect_all()))
+    assert sum(len(v) for v in categorized.values()) > 0
+    assert main
@@ -0,0 +1,54 @@
+"""시작 시간 벤치마크: `import src.main`이 무거운 의존성을 불러오지 않는지 확인."""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 진입점을 불러오는 것만으로는 불러오면 안 되는 모듈 (실제로 쓸 때 불러온다)
+LAZY_MODULES = (
+    "bs4",
+    "lxml",
+    "selectolax",
+    "slack_sdk",
+    "dotenv",
+    "src.crawlers.kstartup",
+    "src.crawlers.mss",
+    "src.crawlers.kised",
+    "src.crawlers.bizinfo",
+    "src.crawlers.naver_news",
+    "src.notifier",
+    "src.enrich",
+)
+
+
+def _import_profile(module: str) -> dict[str, int]:
+    """-X importtime으로 module을 불러오고 모듈 이름 → 누적 시간(µs)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def test_entry_point_is_lazy():
+    profile = _import_profile("src.main")
+    slowest = sorted(profile.items(), key=lambda x: -x[1])[:5]
+    print("\n[bench] import src.main: " + ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in slowest))
+    loaded = [m for m in LAZY_MODULES if m in profile]
+    assert not loaded, f"import src.main이 불러온 모듈: {loaded}"
+
+
+def test_startup(bench):
+    bench("startup", lambda: subprocess.run([sys.executable, "-c", "import src.main"], cwd=ROOT, check=True))
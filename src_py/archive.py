@@ -0,0 +1,229 @@
+"""수집한 원본 페이지 보관소 (내용 주소 방식).
+
+받은 응답 본문을 sha256 해시를 이름으로 gzip 압축해 저장한다. 같은 본문은 실행이
+달라도 한 번만 저장되고, 가져올 때마다 manifest.jsonl에 (소스, URL, 시각, 해시,
+페이지 종류)를 한 줄씩 남긴다. 파서 버그를 나중에 그 페이지 그대로 다시 돌려 볼 수 있다.
+
+- 본문 해시가 같으면 같은 파서·같은 mark로 저장해 둔 파싱 결과를 그대로 쓴다
+  (BaseCrawler.parse_cached). 304가 아니어도, 서버가 검증자를 주지 않아도 된다.
+- 보관 기간(PAGE_ARCHIVE_DAYS)이 지난 기록과 더 이상 가리키는 기록이 없는 본문은
+  prune()으로 지운다.
+
+    python -m src.archive list [소스]               # 보관된 페이지 기록
+    python -m src.archive reparse <소스> [YYYY-MM-DD]  # 보관된 목록 페이지를 지금 파서로 다시 파싱
+    python -m src.archive prune                     # 보관 기간이 지난 항목 삭제
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from src.config import PAGE_ARCHIVE_DAYS, PAGE_ARCHIVE_DIR
+from src.fsutil import write_atomic
+
+if TYPE_CHECKING:
+    from src.crawlers.base import Article
+
+logger = logging.getLogger(__name__)
+
+PARSED_KEYS = 4  # 본문 하나에 남겨 두는 파싱 결과 수 (파서 버전·mark 조합)
+
+
+class PageArchive:
+    """<dir>/pages/<해시 앞 2자>/<해시>.gz 본문, parsed/…/<해시>.json 파싱 결과, manifest.jsonl 기록."""
+
+    def __init__(self, directory: str, retention_days: int = PAGE_ARCHIVE_DAYS) -> None:
+        self.directory = directory
+        self.retention = retention_days * 86400
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, "manifest.jsonl")
+
+    def page_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "pages", digest[:2], f"{digest}.gz")
+
+    def parsed_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "parsed", digest[:2], f"{digest}.json")
+
+    def put(
+        self,
+        source: str,
+        url: str,
+        body: bytes,
+        encoding: str | None = None,
+        now: float | None = None,
+        kind: str = "list",
+    ) -> str | None:
+        """본문을 보관하고 (이미 있으면 기록만 추가) 해시를 반환. 저장에 실패하면 None.
+
+        kind는 페이지 종류 ("list" 목록, "detail" 상세).
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        entry = {
+            "source": source,
+            "url": url,
+            "time": time.time() if now is None else now,
+            "hash": digest,
+            "size": len(body),
+            "encoding": encoding,
+            "kind": kind,
+        }
+        path = self.page_path(digest)
+        try:
+            with self._lock:
+                if not os.path.exists(path):
+                    write_atomic(path, gzip.compress(body, mtime=0))
+                with open(self.manifest_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning("원본 페이지 보관 실패: %s — %s", url, e)
+            return None
+        return digest
+
+    def body(self, digest: str) -> bytes | None:
+        try:
+            with gzip.open(self.page_path(digest), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def entries(self, source: str | None = None, since: float | None = None) -> Iterator[dict]:
+        """manifest 기록 (오래된 것부터). source·since(시각)로 거를 수 있다."""
+        try:
+            f = open(self.manifest_path, encoding="utf-8")
+        except OSError:
+            return
+        with f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 쓰다가 끊긴 줄
+                if source is not None and entry.get("source") != source:
+                    continue
+                if since is not None and entry.get("time", 0) < since:
+                    continue
+                yield entry
+
+    def _load_parsed(self, digest: str) -> dict:
+        try:
+            with open(self.parsed_path(digest), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def parsed(self, digest: str, key: str) -> dict | None:
+        """본문 해시와 key(파서·mark)로 저장해 둔 파싱 결과 {"articles", "new_mark", "reached"}."""
+        return self._load_parsed(digest).get(key)
+
+    def store_parsed(self, digest: str, key: str, record: dict) -> None:
+        try:
+            with self._lock:
+                records = self._load_parsed(digest)
+                records.pop(key, None)
+                records[key] = record
+                while len(records) > PARSED_KEYS:
+                    records.pop(next(iter(records)))
+                write_atomic(self.parsed_path(digest), json.dumps(records, ensure_ascii=False))
+        except OSError as e:
+            logger.warning("파싱 결과 보관 실패: %s — %s", digest, e)
+
+    def prune(self, now: float | None = None) -> int:
+        """보관 기간이 지난 기록과 남은 기록이 가리키지 않는 본문·파싱 결과를 지운다. 지운 본문 수를 반환."""
+        cutoff = (time.time() if now is None else now) - self.retention
+        with self._lock:
+            kept: list[str] = []
+            expired: set[str] = set()
+            live: set[str] = set()
+            for entry in self.entries():
+                if entry.get("time", 0) < cutoff:
+                    expired.add(entry["hash"])
+                else:
+                    live.add(entry["hash"])
+                    kept.append(json.dumps(entry, ensure_ascii=False) + "\n")
+            if not expired:
+                return 0
+            try:
+                write_atomic(self.manifest_path, "".join(kept))
+                removed = 0
+                for digest in expired - live:
+                    for path in (self.page_path(digest), self.parsed_path(digest)):
+                        if os.path.exists(path):
+                            os.remove(path)
+                    removed += 1
+            except OSError as e:
+                logger.warning("원본 페이지 보관소 정리 실패: %s", e)
+                return 0
+        if removed:
+            logger.info("보관 기간이 지난 원본 페이지 %d개 삭제", removed)
+        return removed
+
+
+# 모든 크롤러가 공유하는 기본 보관소 (PAGE_ARCHIVE_DIR이 비어 있으면 비활성화)
+page_archive = PageArchive(PAGE_ARCHIVE_DIR) if PAGE_ARCHIVE_DIR else None
+
+
+def reparse(archive: PageArchive, source: str, since: float | None = None) -> Iterator[Article]:
+    """보관된 source의 페이지를 지금 파서로 네트워크 없이 다시 파싱 (목록 크롤러만).
+
+    같은 본문은 한 번만 파싱하고, mark 없이 페이지 전체를 읽는다. 상세 페이지는 건너뛴다
+    (종류가 없는 예전 기록은 목록 페이지로 본다).
+    """
+    from src.crawlers import registry
+    from src.crawlers.base import ListCrawler
+    from src.crawlers.parsepool import RawPage
+
+    spec = registry.get(source)
+    crawler_cls = spec.load()
+    if not issubclass(crawler_cls, ListCrawler):
+        raise ValueError(f"{spec.name}은(는) 목록 크롤러가 아니라 다시 파싱할 수 없습니다.")
+    crawler = crawler_cls(lookback_days=10**6)
+    seen: set[str] = set()
+    for entry in archive.entries(spec.name, since):
+        if entry.get("kind", "list") != "list" or entry["hash"] in seen:
+            continue
+        seen.add(entry["hash"])
+        body = archive.body(entry["hash"])
+        if body is None:
+            continue
+        crawler._reached_mark = False
+        yield from crawler._parse_list(RawPage(body, entry.get("encoding"), entry["url"]))
+
+
+def _main(argv: list[str]) -> int:
+    if page_archive is None:
+        print("PAGE_ARCHIVE_DIR가 비어 있어 보관소가 꺼져 있습니다.", file=sys.stderr)
+        return 1
+    command, args = (argv[0], argv[1:]) if argv else ("", [])
+    if command == "list" and len(args) <= 1:
+        for entry in page_archive.entries(args[0] if args else None):
+            stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["time"]))
+            print(f"{stamp}  {entry['hash'][:12]}  {entry['size']:>8}  {entry['source']}  {entry['url']}")
+        return 0
+    if command == "reparse" and len(args) in (1, 2):
+        from datetime import datetime
+
+        since = datetime.fromisoformat(args[1]).timestamp() if len(args) == 2 else None
+        for article in reparse(page_archive, args[0], since):
+            print(json.dumps(article.to_dict(), ensure_ascii=False))
+        return 0
+    if command == "prune" and not args:
+        print(f"{page_archive.prune()}개 삭제")
+        return 0
+    print("사용법: python -m src.archive list [소스] | reparse <소스> [YYYY-MM-DD] | prune", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -1,28 +1,133 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+# .env는 있을 때만 읽는다 (CI·컨테이너는 환경 변수만 쓰므로 python-dotenv를 불러오지 않음)
+_ENV_FILES = (".env", os.path.join(os.path.dirname(__file__), "..", ".env"))
+_env_file = next((path for path in _ENV_FILES if os.path.isfile(path)), None)
+if _env_file:
+    from dotenv import load_dotenv
+
+    load_dotenv(_env_file)
 
 # Slack
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL", "")
 SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN", "")
 SLACK_CHANNEL_ID = os.getenv("SLACK_CHANNEL_ID", "")
+SLACK_CHUNK_CHARS = 12000  # 스레드 메시지 하나에 담을 최대 글자 수
+SLACK_POST_RATE = 1.0  # 채널당 초당 메시지 수 (chat.postMessage 권장 한도)
+SLACK_POST_BURST = 3  # 연달아 보낼 수 있는 메시지 수
+SLACK_MAX_RETRIES = 5  # 속도 제한·일시 오류 시 재시도 횟수
+# 여러 채널/워크스페이스로 보낼 때의 대상 목록 (JSON, src.fanout 참고)과 동시 전송 수
+SLACK_DESTINATIONS = os.getenv("SLACK_DESTINATIONS", "")
+SLACK_FANOUT_WORKERS = 4
+# 채널 참여 여부와 전송 중단 지점(이어서 보내기)을 기록하는 파일
+SLACK_STATE_FILE = os.getenv(
+    "SLACK_STATE_FILE", os.path.join(os.path.dirname(__file__), "..", "data", "slack_state.json")
+)
 
 # 네이버 검색 API
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID", "")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET", "")
 
 # 크롤링 설정
-REQUEST_TIMEOUT = 15  # seconds
-REQUEST_DELAY = 1.0  # seconds between requests
+REQUEST_TIMEOUT = 15  # seconds, 응답 읽기 타임아웃
+CONNECT_TIMEOUT = 5  # seconds, 연결 타임아웃
+HOST_TIMEOUTS = {
+    # host: 읽기 타임아웃(초), 없으면 REQUEST_TIMEOUT
+    "openapi.naver.com": 5,
+}
+HTTP_RETRIES = 3  # 연결 실패·타임아웃·429/5xx 재시도 횟수 (src.transport)
+HTTP_BACKOFF = 0.5  # seconds, 재시도 간격 = HTTP_BACKOFF * 2^(n-1) + 지터
+HTTP_BACKOFF_JITTER = 0.5  # seconds, 재시도 간격에 더하는 무작위 시간의 최대값
+HTTP_RETRY_AFTER_MAX = 30  # seconds, 서버가 Retry-After로 더 길게 요구해도 이만큼만 기다린다
+HTTP_POOL_HOSTS = 10  # 연결 풀을 유지할 호스트 수
+HTTP_POOL_SIZE = 10  # 호스트당 유지할 연결 수 (크롤러·미리 받기·상세 페이지·네이버 동시 요청)
+REQUEST_DELAY = 1.0  # seconds, 같은 호스트에 대한 요청 간격
+REQUEST_BURST = 1  # 같은 호스트에 연달아 보낼 수 있는 요청 수
+HOST_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    # host: (초당 요청 수, 버스트). 크롤러 레지스트리의 rate보다 우선
+}
+CRAWL_WORKERS = 5  # 동시에 실행할 크롤러 수
+CRAWL_DEADLINE = 180  # seconds, 소스별 최대 실행 시간
+PIPELINE_QUEUE_SIZE = 8  # 크롤러 스레드가 처리 단계보다 앞서 쌓아 둘 수 있는 배치(페이지) 수
+# 데몬 모드(src.daemon): 소스별 수집 주기(초)와 다이제스트 전송 주기(초)
+CRAWL_INTERVALS: dict[str, float] = {
+    # 소스 이름: 수집 주기(초). 없으면 크롤러 레지스트리의 interval
+}
+DEFAULT_CRAWL_INTERVAL = 24 * 3600  # 레지스트리에도 없는 소스
+DIGEST_INTERVAL = int(os.getenv("DIGEST_INTERVAL", str(7 * 24 * 3600)))
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/131.0.0.0 Safari/537.36"
 )
 
+# 응답 녹화/재생 디렉터리 (src.replay, 벤치마크·오프라인 테스트용)
+RECORD_DIR = os.getenv("CRAWL_RECORD_DIR", "")
+REPLAY_DIR = os.getenv("CRAWL_REPLAY_DIR", "")
+
+# HTML 파서 백엔드: "lxml" | "html.parser" | "selectolax" (미설치 시 html.parser)
+HTML_PARSER = os.getenv("HTML_PARSER", "lxml")
+# 목록 페이지를 파싱할 프로세스 수 (src.crawlers.parsepool). 0이면 크롤러 스레드에서 파싱
+PARSE_PROCESSES = int(os.getenv("PARSE_PROCESSES", "0"))
+
 # 필터링
 DAYS_LOOKBACK = 7  # 최근 N일 이내 게시물만 수집
+MAX_PAGES = 5  # 목록 크롤러가 넘겨 볼 최대 페이지 수
+MARK_STOP_ROWS = 3  # 이미 본 공고 번호가 이만큼 연달아 나오면 목록 파싱 중단 (상단 고정 공지 대비)
+NEARDUP_THRESHOLD = 0.6  # 제목 유사도(추정 자카드)가 이 이상이면 같은 소식으로 묶음
+NEARDUP_HISTORY_DAYS = 30  # 최근 N일 안에 전송한 항목과도 근사 중복 비교
+
+# 관련도 (src.relevance). 제목에서 찾은 용어 가중치 합 + 소스 가중치가 점수
+RELEVANCE_KEYWORDS = {
+    "창업": 3,
+    "스타트업": 3,
+    "예비창업": 2,
+    "벤처": 2,
+    "액셀러레이터": 2,
+    "TIPS": 2,
+    "초기기업": 2,
+    "사업화": 1,
+    "투자": 1,
+    "지원사업": 1,
+    "R&D": 1,
+    "기술개발": 1,
+    "모집": 1,
+}
+RELEVANCE_SYNONYMS = {
+    # 표기 → RELEVANCE_KEYWORDS의 용어
+    "startup": "스타트업",
+    "start-up": "스타트업",
+    "팁스": "TIPS",
+    "엑셀러레이터": "액셀러레이터",
+    "벤쳐": "벤처",
+    "연구개발": "R&D",
+}
+RELEVANCE_NEGATIVE = {
+    # 제외어: 점수에서 뺀다
+    "채용": 3,
+    "입찰": 3,
+    "선정결과": 2,
+    "합격자": 2,
+    "인사발령": 3,
+    "부고": 5,
+}
+RELEVANCE_SOURCE_WEIGHTS = {
+    # 창업 전용 소스와 창업 키워드로 검색한 뉴스는 기본 점수를 준다
+    "K-Startup": 2,
+    "창업진흥원": 2,
+    "네이버뉴스": 1,
+}
+RELEVANCE_MIN_SCORE = 1  # 이보다 낮은 항목은 보내지 않음
+
+# 상세 페이지 보강 (src.enrich). 새 항목의 상세 페이지에서 날짜·마감·기관·예산을 채운다
+ENRICH_DETAILS = os.getenv("ENRICH_DETAILS", "") == "1"
+ENRICH_WORKERS = 4  # 상세 페이지를 동시에 받을 워커 수
+ENRICH_PER_HOST = 2  # 호스트 하나에 동시에 보낼 상세 페이지 요청 수
+ENRICH_CACHE_DAYS = 30  # 상세 페이지 추출 결과를 다시 쓰는 기간
+
+# 네이버 검색 API 수집
+NAVER_DISPLAY = 100  # 요청당 결과 수 (API 최대 100)
+NAVER_CONCURRENCY = 4  # 동시에 진행 중인 요청 수 (초당 요청 수는 HOST_RATE_LIMITS가 제한)
 
 # 검색 키워드
 SEARCH_KEYWORDS = [
@@ -31,5 +136,32 @@ SEARCH_KEYWORDS = [
     "정부 창업 지원",
 ]
 
-# 전송 이력 파일
+# 전송 이력 (SQLite). HISTORY_FILE은 이전 JSON 형식으로, 처음 한 번만 가져온다.
+HISTORY_DB = os.path.join(os.path.dirname(__file__), "..", "data", "sent_history.db")
 HISTORY_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "sent_history.json")
+HISTORY_RETENTION_DAYS = 180  # 전송 후 N일이 지난 이력은 삭제
+
+# 조건부 요청 캐시 디렉터리 (빈 값이면 캐시 사용 안 함)
+HTTP_CACHE_DIR = os.getenv(
+    "HTTP_CACHE_DIR", os.path.join(os.path.dirname(__file__), "..", "data", "http_cache")
+)
+HTTP_CACHE_DAYS = 30  # N일 동안 쓰이지 않은 캐시 항목(목록·상세 페이지)은 삭제
+# 원본 페이지 보관소 (src.archive). 받은 본문을 해시로 중복 없이 보관 (빈 값이면 보관하지 않음)
+PAGE_ARCHIVE_DIR = os.getenv(
+    "PAGE_ARCHIVE_DIR", os.path.join(os.path.dirname(__file__), "..", "data", "page_archive")
+)
+PAGE_ARCHIVE_DAYS = 90  # 가져온 지 N일이 지난 기록은 삭제 (다른 기록이 가리키지 않는 본문도 함께)
+# 목록 페이지 레이아웃 기록 (src.crawlers.layout). 학습한 행 선택자와 구조 지문 (빈 값이면 사용 안 함)
+LAYOUT_STATE_FILE = os.getenv(
+    "LAYOUT_STATE_FILE", os.path.join(os.path.dirname(__file__), "..", "data", "layout_state.json")
+)
+LAYOUT_DRIFT_RATIO = 0.5  # 첫 페이지 행 수가 지난 실행의 이 비율 미만이거나 역수 배를 넘으면 레이아웃 변화
+LAYOUT_DRIFT_PARSED = 0.3  # 파싱 성공률이 지난 실행보다 이만큼 떨어지면 레이아웃 변화
+# 상세 페이지 추출 결과 캐시 (빈 값이면 사용 안 함)
+ENRICH_CACHE_DIR = os.getenv("ENRICH_CACHE_DIR", os.path.join(HTTP_CACHE_DIR, "details") if HTTP_CACHE_DIR else "")
+
+# 실행 지표 (src.metrics). JSON 실행 보고서와 Prometheus textfile (빈 값이면 쓰지 않음)
+METRICS_FILE = os.getenv(
+    "METRICS_FILE", os.path.join(os.path.dirname(__file__), "..", "data", "run_report.json")
+)
+METRICS_PROM_FILE = os.getenv("METRICS_PROM_FILE", "")
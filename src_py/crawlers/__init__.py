@@ -1,13 +1,30 @@
-from .kstartup import KStartupCrawler
-from .mss import MSSCrawler
-from .kised import KisedCrawler
-from .bizinfo import BizinfoCrawler
-from .naver_news import NaverNewsCrawler
-
-__all__ = [
-    "KStartupCrawler",
-    "MSSCrawler",
-    "KisedCrawler",
-    "BizinfoCrawler",
-    "NaverNewsCrawler",
-]
+"""크롤러 모음. 각 크롤러 모듈은 해당 클래스를 처음 쓸 때 불러온다 (위치는 registry)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .registry import REGISTRY
+
+if TYPE_CHECKING:
+    # 타입 검사기용 재수출. 실제 값은 __getattr__가 불러오고 __all__은 REGISTRY에서 만든다
+    from .bizinfo import BizinfoCrawler  # noqa: F401
+    from .kised import KisedCrawler  # noqa: F401
+    from .kstartup import KStartupCrawler  # noqa: F401
+    from .mss import MSSCrawler  # noqa: F401
+    from .naver_news import NaverNewsCrawler  # noqa: F401
+
+__all__ = [spec.class_name for spec in REGISTRY.values()]
+
+
+def __getattr__(name: str):
+    spec = next((s for s in REGISTRY.values() if s.class_name == name), None)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = spec.load()
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -3,21 +3,81 @@
 from __future__ import annotations
 
 import logging
-import time
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Container, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 
 import requests
 
-from src.config import REQUEST_DELAY, REQUEST_TIMEOUT, USER_AGENT
+from src import replay, transport
+from src.archive import PageArchive, page_archive
+from src.config import (
+    DAYS_LOOKBACK,
+    HTML_PARSER,
+    MARK_STOP_ROWS,
+    MAX_PAGES,
+    PARSE_PROCESSES,
+    RECORD_DIR,
+    REPLAY_DIR,
+)
+from src.httpcache import HttpCache, http_cache
+from src.metrics import metrics
+from src.ratelimit import RateLimiter, limiter
+from src.urlnorm import fingerprint
+
+from .detail import extract_details
+from .layout import LayoutStore, PageLayout, column_count, layout_store
+from .parsing import make_soup
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+_run_today: int | None = None
+
+
+def today_ordinal() -> int:
+    """이번 실행 기준 '오늘'의 날짜 서수. 실행 중에 자정이 지나도 바뀌지 않는다."""
+    global _run_today
+    if _run_today is None:
+        _run_today = date.today().toordinal()
+    return _run_today
+
+
+def today_iso() -> str:
+    """이번 실행 기준 '오늘'을 YYYY-MM-DD로 (날짜를 읽지 못한 항목의 기본값)."""
+    return date.fromordinal(today_ordinal()).isoformat()
+
+
+def start_run(today: date | None = None) -> None:
+    """새 실행을 시작할 때 기준 '오늘'을 다시 잡는다."""
+    global _run_today
+    _run_today = (today or date.today()).toordinal()
+
+
+def _ordinal(value: str) -> int | None:
+    """YYYY-MM-DD 문자열을 날짜 서수로. 비어 있거나 형식이 다르면 None."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).toordinal()
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class Article:
-    """수집된 기사/공고 데이터."""
+    """수집된 기사/공고 데이터.
+
+    date/deadline은 대입할 때 한 번만 날짜 서수(date_ord, deadline_ord)로 바꿔 두고,
+    비교와 정렬은 모두 정수로 한다.
+    """
 
     title: str
     url: str
@@ -26,30 +86,30 @@ class Article:
     category: str = ""  # 자동 분류됨
     deadline: str = ""  # YYYY-MM-DD (마감일, 공고만 해당)
     extra: dict = field(default_factory=dict)
+    date_ord: int | None = field(init=False, repr=False, compare=False)
+    deadline_ord: int | None = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name == "date":
+            object.__setattr__(self, "date_ord", _ordinal(value))
+        elif name == "deadline":
+            object.__setattr__(self, "deadline_ord", _ordinal(value))
 
     @property
     def date_obj(self) -> datetime | None:
-        try:
-            return datetime.strptime(self.date, "%Y-%m-%d")
-        except ValueError:
-            return None
+        return datetime.fromordinal(self.date_ord) if self.date_ord is not None else None
 
     @property
     def deadline_obj(self) -> datetime | None:
-        if not self.deadline:
-            return None
-        try:
-            return datetime.strptime(self.deadline, "%Y-%m-%d")
-        except ValueError:
-            return None
+        return datetime.fromordinal(self.deadline_ord) if self.deadline_ord is not None else None
 
     @property
     def d_day(self) -> int | None:
         """마감일까지 남은 일수. 음수면 마감됨."""
-        dl = self.deadline_obj
-        if dl is None:
+        if self.deadline_ord is None:
             return None
-        return (dl - datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)).days
+        return self.deadline_ord - today_ordinal()
 
     def to_dict(self) -> dict:
         return {
@@ -59,30 +119,371 @@ class Article:
             "date": self.date,
             "deadline": self.deadline,
             "category": self.category,
+            "extra": self.extra,
         }
 
+    def to_tuple(self) -> tuple:
+        """프로세스 사이에 주고받는 간결한 형태 (from_tuple로 되돌림)."""
+        return (self.title, self.url, self.source, self.date, self.category, self.deadline, self.extra)
+
+    @classmethod
+    def from_tuple(cls, row: tuple) -> Article:
+        title, url, source, date_, category, deadline, extra = row
+        return cls(title=title, url=url, source=source, date=date_, category=category, deadline=deadline, extra=extra)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Article:
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            source=data["source"],
+            date=data["date"],
+            category=data.get("category", ""),
+            deadline=data.get("deadline", ""),
+            extra=data.get("extra") or {},
+        )
+
 
 class BaseCrawler(ABC):
     """크롤러 베이스 클래스."""
 
     name: str = "base"
+    rate_limiter: RateLimiter = limiter  # 모든 크롤러가 호스트별 버킷을 공유
+    http_cache: HttpCache | None = http_cache  # None이면 조건부 요청을 쓰지 않음
+    archive: PageArchive | None = page_archive  # None이면 받은 본문을 보관하지 않음
+    parse_version: int = 1  # 파싱 로직이 바뀌면 올려서 캐시된 파싱 결과를 무효화
+    html_parser: str = HTML_PARSER  # 크롤러별 파서 백엔드 (parsing.PARSERS)
+    parse_only: str | None = None  # 필요한 서브트리만 파싱할 때의 단순 선택자 ("div#id", "ul.class")
+    detail_parse_only: str | None = None  # 상세 페이지에서 같은 용도로 쓰는 선택자
+
+    def __init__(
+        self,
+        history: Container[str] | None = None,
+        lookback_days: int = DAYS_LOOKBACK,
+        mark: int | None = None,
+    ) -> None:
+        # 세션은 크롤러마다 따로 두되 연결 풀과 재시도 정책은 모두 공유 (src.transport)
+        self.session = transport.session()
+        # 이미 전송한 URL과 조회 기간 — 페이지를 더 넘길지 판단하는 데 쓴다
+        self.history: Container[str] = history if history is not None else frozenset()
+        self.lookback_days = lookback_days
+        self.cutoff = today_ordinal() - lookback_days
+        # high-water mark: 이전 실행까지 본 가장 큰 공고 번호(또는 발행 시각). 이하는 이미 본 구간
+        self.mark = mark
+        self.new_mark = mark
+        # 마지막 수집이 끝까지 갔는지. 받지 못한 페이지가 있으면 False이고 mark를 넘기지 않는다
+        self.complete = True
+
+        # 녹화/재생 모드 (src.replay)
+        if RECORD_DIR or REPLAY_DIR:
+            replay.attach(self, record_dir=RECORD_DIR, replay_dir=REPLAY_DIR)
+
+    def refresh(self) -> None:
+        """새 수집 주기 시작 (데몬 모드). 바뀐 '오늘' 기준으로 조회 기간을 다시 계산하고 mark를 넘긴다."""
+        self.cutoff = today_ordinal() - self.lookback_days
+        self.mark = self.new_mark = self.committed_mark
+
+    @property
+    def committed_mark(self) -> int | None:
+        """저장할 high-water mark. 끝까지 보지 못한 수집이면 이전 mark를 그대로 둔다.
+
+        받지 못한 페이지보다 위쪽 번호로 mark를 올리면 다음 실행이 그 페이지의 항목을
+        이미 본 구간으로 잘라 버린다.
+        """
+        return self.new_mark if self.complete else self.mark
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": USER_AGENT})
+    def observe_mark(self, key: int | None) -> bool:
+        """항목의 mark 키를 기록하고, 이미 본 구간(key <= mark)이면 True."""
+        if key is None:
+            return False
+        if self.new_mark is None or key > self.new_mark:
+            self.new_mark = key
+        return self.mark is not None and key <= self.mark
+
+    def fetch(self, url: str, kind: str = "list", **kwargs) -> requests.Response | None:
+        """URL을 요청하고 응답을 반환한다. 실패 시 None.
+
+        HTTP 캐시가 켜져 있으면 조건부 요청을 보내고, 304이면 캐시된 본문으로
+        만든 응답(from_cache=True)을 반환한다. 보관소가 켜져 있으면 본문을 페이지
+        종류(kind: "list" 목록, "detail" 상세)와 함께 보관하고 그 해시를 content_hash로 붙인다.
+        """
+        with metrics.span("fetch", source=self.name):
+            return self._fetch(url, kind, **kwargs)
+
+    def _fetch(self, url: str, kind: str, **kwargs) -> requests.Response | None:
+        entry = None
+        cache_url = None
+        if self.http_cache is not None:
+            cache_url = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+            entry = self.http_cache.get(cache_url)
 
-    def fetch(self, url: str, **kwargs) -> requests.Response | None:
-        """URL을 요청하고 응답을 반환한다. 실패 시 None."""
         try:
-            time.sleep(REQUEST_DELAY)
-            resp = self.session.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
+            resp = self._get(url, entry, **kwargs)
+            if resp.status_code == 304 and entry is not None:
+                cached = entry.to_response(resp)
+                if cached is not None:
+                    cached.cache_url = cache_url
+                    metrics.incr("cache_hits", source=self.name)
+                    return self._archive(cached, kind)
+                # 본문이 사라진 캐시 항목 — 조건 없이 다시 받는다
+                resp = self._get(url, None, **kwargs)
             resp.raise_for_status()
-            return resp
         except requests.RequestException as e:
             logger.warning("[%s] 요청 실패: %s — %s", self.name, url, e)
+            metrics.incr("fetch_errors", source=self.name)
             return None
 
+        metrics.incr("bytes_downloaded", len(resp.content), source=self.name)
+
+        if self.http_cache is not None:
+            resp.cache_url = cache_url
+            self.http_cache.store(cache_url, resp)
+        return self._archive(resp, kind)
+
+    def _archive(self, resp: requests.Response, kind: str) -> requests.Response:
+        if self.archive is not None:
+            resp.content_hash = self.archive.put(self.name, resp.url, resp.content, resp.encoding, kind=kind)
+        return resp
+
+    def _get(self, url: str, entry, **kwargs) -> requests.Response:
+        if entry is not None:
+            kwargs["headers"] = {**entry.validators(), **kwargs.get("headers", {})}
+        waited = self.rate_limiter.acquire(url)
+        if waited:
+            metrics.observe("ratelimit_wait", waited, source=self.name)
+        metrics.incr("requests", source=self.name)
+        return self.session.get(url, timeout=transport.timeout_for(url), **kwargs)
+
+    def soup(self, resp: requests.Response):
+        """응답 본문을 크롤러에 설정된 백엔드로 파싱."""
+        return make_soup(resp.text, self.html_parser, self.parse_only)
+
+    def parse_cached(
+        self,
+        resp: requests.Response,
+        parse: Callable[[requests.Response], list[Article]],
+    ) -> list[Article]:
+        """응답을 파싱한다. 본문이 이전과 같으면 (해시 일치, 304) 저장된 파싱 결과를 그대로 쓴다.
+
+        파싱 결과는 mark에 따라 달라지므로 파서와 mark를 key로 삼고, mark 상태(new_mark,
+        이미 본 구간에 닿았는지)도 함께 저장했다가 되살린다. 보관소를 먼저 찾고, 기록이
+        없으면 (보관소를 새로 시작한 경우 등) 304 응답은 HTTP 캐시에서 찾는다.
+
+        날짜를 읽지 못해 이번 실행의 '오늘'(today_iso)로 채웠을 수 있는 결과는 저장하지
+        않는다. 다른 날 그대로 쓰면 그날의 '오늘'이 아니라 처음 파싱한 날짜가 남는다.
+        """
+        key = f"{type(self).__name__}:{self.parse_version}|{self.mark}"
+        digest = getattr(resp, "content_hash", None) if self.archive is not None else None
+        cache_url = getattr(resp, "cache_url", None) if self.http_cache is not None else None
+
+        record = self.archive.parsed(digest, key) if digest is not None else None
+        if record is None and cache_url is not None and getattr(resp, "from_cache", False):
+            entry = self.http_cache.get(cache_url)
+            record = entry.parsed(key) if entry else None
+        if record is not None:
+            logger.info("[%s] 본문 변경 없음, 이전 파싱 결과 %d건 재사용", self.name, len(record["articles"]))
+            metrics.incr("parse_cache_hits", source=self.name)
+            self.observe_mark(record["new_mark"])
+            if record["reached"]:
+                self._reached_mark = True
+            return [Article.from_dict(d) for d in record["articles"]]
+
+        with metrics.span("parse", source=self.name):
+            articles = parse(resp)
+        today = today_iso()
+        if any(a.date == today for a in articles):
+            return articles
+        record = {
+            "articles": [a.to_dict() for a in articles],
+            "new_mark": self.new_mark,
+            "reached": getattr(self, "_reached_mark", False),
+        }
+        if cache_url is not None:
+            self.http_cache.store_parsed(cache_url, key, record)
+        if digest is not None:
+            self.archive.store_parsed(digest, key, record)
+        return articles
+
+    def detail_url(self, article: Article) -> str | None:
+        """상세 페이지 보강(src.enrich)에 쓸 URL. 상세 페이지가 없는 소스는 None."""
+        return None
+
+    def parse_detail(self, resp: requests.Response) -> dict[str, str]:
+        """상세 페이지 응답에서 date/deadline/agency/budget 중 찾은 값을 추출."""
+        if resp.encoding is None or resp.encoding.lower() == "iso-8859-1":
+            resp.encoding = "utf-8"  # charset 없는 text/html의 requests 기본값 대신
+        return extract_details(make_soup(resp.text, self.html_parser, self.detail_parse_only))
+
     @abstractmethod
     def crawl(self) -> list[Article]:
         """기사 목록을 크롤링하여 반환한다."""
         ...
+
+    def iter_batches(self) -> Iterator[list[Article]]:
+        """수집 결과를 배치로 스트리밍한다 (main.stream). 기본은 crawl() 결과 전체가 한 배치."""
+        yield self.crawl()
+
+
+class ListCrawler(BaseCrawler):
+    """여러 페이지로 된 목록 게시판 크롤러.
+
+    하위 클래스는 page_request(), _rows(), _parse_row()를 구현한다. 현재 페이지를
+    파싱하는 동안 다음 페이지를 미리 받아 두고, 한 페이지 전체가 조회 기간보다
+    오래됐거나 이미 전송한 항목이면 더 넘기지 않는다.
+
+    mark_pattern이 있으면 URL의 공고 번호를 high-water mark로 쓴다. 목록은 최신
+    순이므로 이미 본 번호가 MARK_STOP_ROWS개 연달아 나오면 (상단 고정 공지는
+    번호가 작아도 건너뛰도록) 나머지 행은 파싱하지 않고 다음 페이지도 받지 않는다.
+
+    row_selectors가 있으면 _find_rows()가 지난번에 맞은 선택자부터 시도하고, 첫
+    페이지의 구조 지문을 layout_store에 기록한다 (src.crawlers.layout).
+    """
+
+    max_pages: int = MAX_PAGES
+    mark_pattern: re.Pattern | None = None  # URL에서 공고 번호(정수)를 뽑는 정규식
+    row_selectors: tuple[str, ...] = ()  # 행을 찾는 선택자 후보 (앞에서부터 시도)
+    layout_store: LayoutStore | None = layout_store  # None이면 선택자·레이아웃을 기록하지 않음
+    layout: PageLayout | None = None  # 마지막으로 파싱한 페이지의 구조 지문
+    learned_selector: str | None = None  # 파서 프로세스에서는 layout_store 대신 부른 쪽이 넘겨 준 선택자를 쓴다
+
+    def page_request(self, page: int) -> tuple[str, dict]:
+        """page번째(1부터) 목록 페이지의 (URL, 쿼리 파라미터)."""
+        raise NotImplementedError
+
+    def _rows(self, resp: requests.Response) -> list:
+        """목록 페이지 응답에서 항목 요소들을 찾는다."""
+        raise NotImplementedError
+
+    def _parse_row(self, row) -> Article | None:
+        """항목 요소 하나를 Article로."""
+        raise NotImplementedError
+
+    def _find_rows(self, soup) -> list:
+        """row_selectors 중 처음으로 행이 나오는 선택자의 결과. 지난번에 맞은 선택자를 먼저 시도."""
+        learned = self.learned_selector
+        if learned is None and self.layout_store is not None:
+            learned = self.layout_store.selector(self.name)
+        selectors = self.row_selectors
+        if learned in selectors:
+            selectors = (learned, *(s for s in selectors if s != learned))
+        for misses, sel in enumerate(selectors):
+            rows = soup.select(sel)
+            if rows:
+                if misses:
+                    metrics.incr("selector_misses", misses, source=self.name)
+                self.layout = PageLayout(sel, len(rows), column_count(rows))
+                return rows
+        return []
+
+    def mark_key(self, article: Article) -> int | None:
+        if self.mark_pattern is None:
+            return None
+        match = self.mark_pattern.search(article.url)
+        return int(match.group(1)) if match else None
+
+    def detail_url(self, article: Article) -> str | None:
+        # 공고 번호가 있는 URL만 상세 페이지다 (링크를 못 찾으면 목록 URL로 대체됨)
+        return article.url if self.mark_key(article) is not None else None
+
+    def _parse_list(self, resp: requests.Response) -> list[Article]:
+        """목록 페이지 응답에서 기사를 추출. 이미 본 구간에 닿으면 멈춘다."""
+        articles: list[Article] = []
+        known = 0
+        examined = parsed = 0
+        self.layout = None
+        rows = self._rows(resp)
+        for row in rows:
+            examined += 1
+            article = self._parse_row(row)
+            if article is None:
+                continue
+            parsed += 1
+            if self.observe_mark(self.mark_key(article)):
+                known += 1
+                if known >= MARK_STOP_ROWS:
+                    self._reached_mark = True
+                    break
+                continue
+            known = 0
+            articles.append(article)
+        if self.layout is None:
+            self.layout = PageLayout("", len(rows))
+        self.layout.parsed = parsed / examined if examined else 0.0
+        return articles
+
+    def _parse_page(self, resp: requests.Response) -> list[Article]:
+        """목록 페이지 파싱. PARSE_PROCESSES가 있으면 파서 프로세스 풀에서 (parsepool)."""
+        if PARSE_PROCESSES > 0:
+            from . import parsepool
+
+            return parsepool.parse_list(self, resp)
+        return self._parse_list(resp)
+
+    def is_fresh(self, article: Article) -> bool:
+        """아직 보지 못한 항목인지 (조회 기간 안이고 전송 이력에 없음)."""
+        return (
+            article.date_ord is not None
+            and article.date_ord > self.cutoff
+            and article.url not in self.history
+        )
+
+    def _fetch_page(self, page: int) -> requests.Response | None:
+        url, params = self.page_request(page)
+        return self.fetch(url, params=params or None)
+
+    def iter_pages(self) -> Iterator[list[Article]]:
+        """목록을 페이지 단위로 스트리밍한다."""
+        prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"prefetch-{self.name}")
+        seen: set[int] = set()
+        self._reached_mark = False
+        # mark가 있으면 첫 페이지에서 끝날 가능성이 크므로 미리 받지 않는다
+        prefetch = self.mark is None
+        self.complete = False
+        try:
+            next_page: Future | None = None
+            for page in range(1, self.max_pages + 1):
+                resp = next_page.result() if next_page else self._fetch_page(page)
+                if resp is None:
+                    logger.warning("[%s] %d페이지를 받지 못해 이번 수집은 mark를 넘기지 않습니다.", self.name, page)
+                    return
+
+                # 파싱하는 동안 다음 페이지를 미리 요청 (멈추게 되면 한 번의 요청만 버린다)
+                next_page = None
+                if prefetch and page < self.max_pages:
+                    next_page = prefetcher.submit(self._fetch_page, page + 1)
+
+                # 페이지 경계에서 밀려 다시 나온 항목은 버린다
+                self.layout = None
+                articles = [a for a in self.parse_cached(resp, self._parse_page) if fingerprint(a.url) not in seen]
+                seen.update(fingerprint(a.url) for a in articles)
+                # 첫 페이지 구조를 지난 실행과 비교 (저장된 파싱 결과를 쓴 페이지는 본문이 같으므로 건너뜀)
+                if page == 1 and self.layout is not None and self.layout_store is not None:
+                    self.layout_store.observe(self.name, self.layout)
+                yield articles
+
+                if self._reached_mark:
+                    logger.debug("[%s] %d페이지에서 이미 본 구간에 닿아 중단", self.name, page)
+                    self.complete = True
+                    return
+                if not any(self.is_fresh(a) for a in articles):
+                    logger.debug("[%s] %d페이지에서 새 항목이 없어 중단", self.name, page)
+                    self.complete = True
+                    return
+                prefetch = True
+            logger.warning("[%s] %d페이지까지 모두 새 항목이라 이번 수집은 mark를 넘기지 않습니다.", self.name, self.max_pages)
+        finally:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+
+    def iter_batches(self) -> Iterator[list[Article]]:
+        # 페이지 하나가 한 배치
+        return self.iter_pages()
+
+    def iter_articles(self) -> Iterator[Article]:
+        """목록의 기사를 하나씩 스트리밍한다."""
+        for articles in self.iter_pages():
+            yield from articles
+
+    def crawl(self) -> list[Article]:
+        articles = list(self.iter_articles())
+        logger.info("[%s] %d건 수집 완료", self.name, len(articles))
+        return articles
@@ -6,9 +6,7 @@ import logging
 import re
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
-from .base import Article, BaseCrawler
+from .base import Article, ListCrawler, today_iso
 
 logger = logging.getLogger(__name__)
 
@@ -16,43 +14,26 @@ BASE_URL = "https://www.bizinfo.go.kr"
 LIST_URL = f"{BASE_URL}/web/lay1/bbs/S1T122C128/AS/74/list.do"
 
 
-class BizinfoCrawler(BaseCrawler):
+class BizinfoCrawler(ListCrawler):
     """기업마당 지원사업 통합검색 크롤러."""
 
     name = "기업마당"
-
-    def crawl(self) -> list[Article]:
-        resp = self.fetch(LIST_URL)
-        if resp is None:
-            return []
-
+    mark_pattern = re.compile(r"pblancId=PBLN_0*(\d+)")
+    row_selectors = (
+        "table.tbl_type1 tbody tr",
+        "table.boardList tbody tr",
+        "table.bbs_list tbody tr",
+        "div.board_list table tbody tr",
+        "div.tbl_wrap table tbody tr",
+        "table tbody tr",
+    )
+
+    def page_request(self, page: int) -> tuple[str, dict]:
+        return LIST_URL, ({"cpage": str(page)} if page > 1 else {})
+
+    def _rows(self, resp) -> list:
         resp.encoding = "utf-8"
-        soup = BeautifulSoup(resp.text, "html.parser")
-        articles: list[Article] = []
-
-        rows = self._find_rows(soup)
-        for row in rows:
-            article = self._parse_row(row)
-            if article:
-                articles.append(article)
-
-        logger.info("[%s] %d건 수집 완료", self.name, len(articles))
-        return articles
-
-    def _find_rows(self, soup: BeautifulSoup) -> list:
-        selectors = [
-            "table.tbl_type1 tbody tr",
-            "table.boardList tbody tr",
-            "table.bbs_list tbody tr",
-            "div.board_list table tbody tr",
-            "div.tbl_wrap table tbody tr",
-            "table tbody tr",
-        ]
-        for sel in selectors:
-            rows = soup.select(sel)
-            if rows:
-                return rows
-        return []
+        return self._find_rows(self.soup(resp))
 
     def _parse_row(self, row) -> Article | None:
         cols = row.select("td")
@@ -101,4 +82,4 @@ class BizinfoCrawler(BaseCrawler):
                 return dt.strftime("%Y-%m-%d")
             except ValueError:
                 pass
-        return datetime.now().strftime("%Y-%m-%d")
+        return today_iso()
@@ -0,0 +1,63 @@
+"""공고 상세 페이지에서 등록일·마감일·기관·예산 추출.
+
+사이트마다 상세 페이지 구조가 다르지만 대부분 항목 이름과 값을 표(th/td)나
+정의 목록(dt/dd)으로 보여 준다. 항목 이름에 들어 있는 낱말로 어떤 값인지
+판단하고, 날짜는 YYYY-MM-DD로 맞춘다. 접수 기간처럼 범위로 적힌 마감은 끝 날짜를 쓴다.
+"""
+
+from __future__ import annotations
+
+import re
+
+# 필드 → 항목 이름에 들어 있으면 해당 필드로 보는 낱말 (앞쪽이 우선)
+DETAIL_LABELS: dict[str, tuple[str, ...]] = {
+    "date": ("등록일", "공고일", "게시일", "작성일"),
+    "deadline": ("마감", "접수기간", "신청기간", "모집기간"),
+    "agency": ("주관기관", "소관부처", "수행기관", "담당부서", "기관"),
+    "budget": ("예산", "지원규모", "사업비", "지원금"),
+}
+
+MAX_TEXT = 100  # 기관·예산 값의 최대 글자 수
+
+_DATE = re.compile(r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})")
+_SPACE = re.compile(r"\s+")
+
+
+def _dates(text: str) -> list[str]:
+    return [f"{y}-{int(m):02d}-{int(d):02d}" for y, m, d in _DATE.findall(text)]
+
+
+def _pairs(soup) -> list[tuple[str, str]]:
+    """(항목 이름, 값) 쌍을 문서 순서대로."""
+    pairs = []
+    for row in soup.select("tr"):
+        for th, td in zip(row.select("th"), row.select("td")):
+            pairs.append((th.get_text(strip=True), td.get_text(" ", strip=True)))
+    for dl in soup.select("dl"):
+        for dt, dd in zip(dl.select("dt"), dl.select("dd")):
+            pairs.append((dt.get_text(strip=True), dd.get_text(" ", strip=True)))
+    return pairs
+
+
+def _field(label: str) -> str | None:
+    label = label.replace(" ", "")
+    for name, words in DETAIL_LABELS.items():
+        if any(word in label for word in words):
+            return name
+    return None
+
+
+def extract_details(soup) -> dict[str, str]:
+    """상세 페이지에서 찾은 값만 담은 딕셔너리 (date, deadline, agency, budget)."""
+    details: dict[str, str] = {}
+    for label, value in _pairs(soup):
+        name = _field(label)
+        if name is None or name in details or not value:
+            continue
+        if name in ("date", "deadline"):
+            dates = _dates(value)
+            if dates:
+                details[name] = dates[0] if name == "date" else dates[-1]
+        else:
+            details[name] = _SPACE.sub(" ", value)[:MAX_TEXT]
+    return details
@@ -12,11 +12,8 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import datetime
 
-from bs4 import BeautifulSoup
-
-from .base import Article, BaseCrawler
+from .base import Article, ListCrawler, today_iso
 
 logger = logging.getLogger(__name__)
 
@@ -24,35 +21,27 @@ BASE_URL = "https://www.kised.or.kr"
 LIST_URL = f"{BASE_URL}/menu.es?mid=a10302000000"
 
 
-class KisedCrawler(BaseCrawler):
+class KisedCrawler(ListCrawler):
     """창업진흥원 사업공고 크롤러."""
 
     name = "창업진흥원"
+    parse_only = "ul.lstyle_list"  # 목록 영역만 파싱
+    mark_pattern = re.compile(r"pbancSn=(\d+)")
 
-    def crawl(self) -> list[Article]:
-        resp = self.fetch(LIST_URL)
-        if resp is None:
-            return []
+    def page_request(self, page: int) -> tuple[str, dict]:
+        return LIST_URL, ({"pageIndex": str(page)} if page > 1 else {})
 
+    def _rows(self, resp) -> list:
         resp.encoding = "utf-8"
-        soup = BeautifulSoup(resp.text, "html.parser")
-        articles: list[Article] = []
+        soup = self.soup(resp)
 
         # ul.lstyle_list > li
         items = soup.select("ul.lstyle_list > li")
         if not items:
             logger.warning("[%s] ul.lstyle_list를 찾을 수 없습니다.", self.name)
-            return []
-
-        for item in items:
-            article = self._parse_item(item)
-            if article:
-                articles.append(article)
-
-        logger.info("[%s] %d건 수집 완료", self.name, len(articles))
-        return articles
+        return items
 
-    def _parse_item(self, item) -> Article | None:
+    def _parse_row(self, item) -> Article | None:
         """li 요소에서 공고 정보를 추출."""
         # 제목: b.ls_tit
         tit_el = item.select_one("b.ls_tit")
@@ -74,7 +63,7 @@ class KisedCrawler(BaseCrawler):
 
         # 마감일자: dl > dd 에서 날짜 추출
         deadline = self._extract_deadline(item)
-        date = datetime.now().strftime("%Y-%m-%d")
+        date = today_iso()
 
         return Article(title=title, url=url, source=self.name, date=date, deadline=deadline)
 
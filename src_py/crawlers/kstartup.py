@@ -11,11 +11,8 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import datetime
 
-from bs4 import BeautifulSoup
-
-from .base import Article, BaseCrawler
+from .base import Article, ListCrawler, today_iso
 
 logger = logging.getLogger(__name__)
 
@@ -23,36 +20,28 @@ BASE_URL = "https://www.k-startup.go.kr"
 LIST_URL = f"{BASE_URL}/web/contents/bizpbanc-ongoing.do"
 
 
-class KStartupCrawler(BaseCrawler):
+class KStartupCrawler(ListCrawler):
     """K-Startup 진행중 사업공고 크롤러."""
 
     name = "K-Startup"
+    parse_only = "#bizPbancList"  # 목록 영역만 파싱
+    mark_pattern = re.compile(r"pbancSn=(\d+)")
 
-    def crawl(self) -> list[Article]:
-        resp = self.fetch(LIST_URL)
-        if resp is None:
-            return []
+    def page_request(self, page: int) -> tuple[str, dict]:
+        return LIST_URL, ({"page": str(page)} if page > 1 else {})
 
+    def _rows(self, resp) -> list:
         resp.encoding = "utf-8"
-        soup = BeautifulSoup(resp.text, "html.parser")
-        articles: list[Article] = []
+        soup = self.soup(resp)
 
         # div#bizPbancList > ul > li
         container = soup.select_one("#bizPbancList")
         if not container:
             logger.warning("[%s] #bizPbancList 컨테이너를 찾을 수 없습니다.", self.name)
             return []
+        return container.select("ul > li")
 
-        items = container.select("ul > li")
-        for item in items:
-            article = self._parse_item(item)
-            if article:
-                articles.append(article)
-
-        logger.info("[%s] %d건 수집 완료", self.name, len(articles))
-        return articles
-
-    def _parse_item(self, item) -> Article | None:
+    def _parse_row(self, item) -> Article | None:
         """li 요소에서 공고 정보를 추출."""
         # 제목: p.tit
         tit_el = item.select_one("p.tit")
@@ -92,5 +81,5 @@ class KStartupCrawler(BaseCrawler):
             elif "마감일자" in text:
                 deadline = match.group(1)
         if not date:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = today_iso()
         return date, deadline
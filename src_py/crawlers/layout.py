@@ -0,0 +1,113 @@
+"""목록 페이지 레이아웃 기록 (학습한 행 선택자와 구조 지문).
+
+선택자 후보를 차례로 시도하는 크롤러(row_selectors)는 빗나갈 때마다 문서 전체를
+훑는다. 소스마다 지난번에 맞은 선택자를 기억해 먼저 시도하고, 첫 페이지의 구조
+지문(선택자, 행 수, 행당 열 수, 파싱 성공률)을 지난 실행과 비교해 크게 바뀌면
+경고와 layout_drift 지표를 남긴다. 범용 선택자("table tbody tr")가 엉뚱한 표를
+잡거나 행을 하나도 못 찾는 경우를 빈 다이제스트가 나가기 전에 알 수 있다.
+
+행을 하나도 못 찾은 실행은 기준으로 삼지 않는다 (고칠 때까지 계속 경고).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass
+
+from src.config import LAYOUT_DRIFT_PARSED, LAYOUT_DRIFT_RATIO, LAYOUT_STATE_FILE
+from src.fsutil import write_atomic
+from src.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PageLayout:
+    """목록 페이지 하나의 구조 지문."""
+
+    selector: str  # 행을 찾은 선택자 (row_selectors가 없는 크롤러는 "")
+    rows: int  # 찾은 행 수
+    cols: int = 0  # 행당 열(td) 수의 중앙값
+    parsed: float = 0.0  # 살펴본 행 중 Article이 된 비율
+
+
+def column_count(rows: list) -> int:
+    counts = sorted(len(row.select("td")) for row in rows)
+    return counts[len(counts) // 2] if counts else 0
+
+
+def drift(previous: PageLayout, current: PageLayout) -> list[str]:
+    """지난 실행과 비교해 크게 바뀐 점들. 없으면 빈 목록."""
+    reasons = []
+    if current.selector != previous.selector:
+        reasons.append(f"선택자 {previous.selector or '-'} → {current.selector or '-'}")
+    if previous.rows and not (
+        previous.rows * LAYOUT_DRIFT_RATIO <= current.rows <= previous.rows / LAYOUT_DRIFT_RATIO
+    ):
+        reasons.append(f"행 {previous.rows} → {current.rows}")
+    if current.cols != previous.cols:
+        reasons.append(f"열 {previous.cols} → {current.cols}")
+    if previous.parsed - current.parsed >= LAYOUT_DRIFT_PARSED:
+        reasons.append(f"파싱 성공률 {previous.parsed:.0%} → {current.parsed:.0%}")
+    return reasons
+
+
+class LayoutStore:
+    """소스 이름 → 지난 실행의 PageLayout (JSON 파일)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._layouts: dict[str, PageLayout] | None = None
+
+    def _load(self) -> dict[str, PageLayout]:
+        if self._layouts is None:
+            layouts = {}
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    layouts = {name: PageLayout(**data) for name, data in json.load(f).items()}
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning("레이아웃 기록을 읽지 못했습니다: %s", e)
+            self._layouts = layouts
+        return self._layouts
+
+    def get(self, source: str) -> PageLayout | None:
+        with self._lock:
+            return self._load().get(source)
+
+    def selector(self, source: str) -> str | None:
+        """지난번에 행을 찾은 선택자."""
+        layout = self.get(source)
+        return layout.selector if layout is not None and layout.selector else None
+
+    def observe(self, source: str, layout: PageLayout) -> list[str]:
+        """이번 실행의 지문을 기록하고, 지난 실행과 크게 달라졌으면 경고한다. 바뀐 점을 반환."""
+        with self._lock:
+            layouts = self._load()
+            previous = layouts.get(source)
+            reasons = drift(previous, layout) if previous is not None else []
+            if layout.rows:
+                layouts[source] = layout
+                self._save()
+        if reasons:
+            logger.warning("[%s] 목록 페이지 레이아웃 변화 감지: %s", source, ", ".join(reasons))
+            metrics.incr("layout_drift", source=source)
+        elif not layout.rows:
+            logger.warning("[%s] 목록 페이지에서 행을 찾지 못했습니다.", source)
+            metrics.incr("layout_drift", source=source)
+        return reasons
+
+    def _save(self) -> None:
+        data = {name: asdict(layout) for name, layout in self._layouts.items()}
+        try:
+            write_atomic(self.path, json.dumps(data, ensure_ascii=False))
+        except OSError as e:
+            logger.warning("레이아웃 기록 저장 실패: %s", e)
+
+
+# 모든 목록 크롤러가 공유하는 기록 (LAYOUT_STATE_FILE이 비어 있으면 비활성화)
+layout_store = LayoutStore(LAYOUT_STATE_FILE) if LAYOUT_STATE_FILE else None
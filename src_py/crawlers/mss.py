@@ -6,9 +6,7 @@ import logging
 import re
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
-from .base import Article, BaseCrawler
+from .base import Article, ListCrawler, today_iso
 
 logger = logging.getLogger(__name__)
 
@@ -18,43 +16,25 @@ LIST_URL = f"{BASE_URL}/site/smba/ex/bbs/List.do"
 BOARD_ID = "86"
 
 
-class MSSCrawler(BaseCrawler):
+class MSSCrawler(ListCrawler):
     """중소벤처기업부 보도자료 크롤러."""
 
     name = "중소벤처기업부"
-
-    def crawl(self) -> list[Article]:
-        params = {"cbIdx": BOARD_ID, "pageIndex": "1"}
-        resp = self.fetch(LIST_URL, params=params)
-        if resp is None:
-            return []
-
+    mark_pattern = re.compile(r"bcIdx=(\d+)")
+    row_selectors = (
+        "table.boardList tbody tr",
+        "table.bbs_list tbody tr",
+        "div.board_list table tbody tr",
+        "table.tbl_type tbody tr",
+        "table tbody tr",
+    )
+
+    def page_request(self, page: int) -> tuple[str, dict]:
+        return LIST_URL, {"cbIdx": BOARD_ID, "pageIndex": str(page)}
+
+    def _rows(self, resp) -> list:
         resp.encoding = "utf-8"
-        soup = BeautifulSoup(resp.text, "html.parser")
-        articles: list[Article] = []
-
-        rows = self._find_rows(soup)
-        for row in rows:
-            article = self._parse_row(row)
-            if article:
-                articles.append(article)
-
-        logger.info("[%s] %d건 수집 완료", self.name, len(articles))
-        return articles
-
-    def _find_rows(self, soup: BeautifulSoup) -> list:
-        selectors = [
-            "table.boardList tbody tr",
-            "table.bbs_list tbody tr",
-            "div.board_list table tbody tr",
-            "table.tbl_type tbody tr",
-            "table tbody tr",
-        ]
-        for sel in selectors:
-            rows = soup.select(sel)
-            if rows:
-                return rows
-        return []
+        return self._find_rows(self.soup(resp))
 
     def _parse_row(self, row) -> Article | None:
         cols = row.select("td")
@@ -108,4 +88,4 @@ class MSSCrawler(BaseCrawler):
                     return dt.strftime("%Y-%m-%d")
                 except ValueError:
                     pass
-        return datetime.now().strftime("%Y-%m-%d")
+        return today_iso()
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
 import re
 from datetime import datetime
 
-from src.config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, SEARCH_KEYWORDS
+from src.config import (
+    NAVER_CLIENT_ID,
+    NAVER_CLIENT_SECRET,
+    NAVER_CONCURRENCY,
+    NAVER_DISPLAY,
+    SEARCH_KEYWORDS,
+)
+from src.metrics import metrics
+from src.urlnorm import fingerprint
 
 from .base import Article, BaseCrawler
 
 logger = logging.getLogger(__name__)
 
 API_URL = "https://openapi.naver.com/v1/search/news.json"
+MAX_START = 1000  # API가 허용하는 start 최댓값
 
 
 def _strip_html(text: str) -> str:
@@ -22,20 +32,32 @@ def _strip_html(text: str) -> str:
     return re.sub(r"<[^>]+>", "", text).strip()
 
 
-def _parse_date(date_str: str) -> str:
-    """네이버 API 날짜(RFC 2822)를 YYYY-MM-DD로 변환."""
+def _parse_pubdate(date_str: str) -> datetime | None:
     # 예: "Mon, 10 Feb 2026 09:00:00 +0900"
     try:
-        dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
-        return dt.strftime("%Y-%m-%d")
+        return datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
     except ValueError:
-        return ""
+        return None
+
+
+def _parse_date(date_str: str) -> str:
+    """네이버 API 날짜(RFC 2822)를 YYYY-MM-DD로 변환."""
+    dt = _parse_pubdate(date_str)
+    return dt.strftime("%Y-%m-%d") if dt else ""
 
 
 class NaverNewsCrawler(BaseCrawler):
-    """네이버 뉴스 검색 API를 통한 창업 관련 뉴스 수집."""
+    """네이버 뉴스 검색 API를 통한 창업 관련 뉴스 수집.
+
+    키워드마다 최신순으로 display=100씩 start를 넘기며, 페이지의 가장 오래된 기사가
+    조회 기간을 벗어나거나 이전 실행에서 본 발행 시각(high-water mark)에 닿으면
+    그 키워드는 멈춘다. 키워드들은 asyncio로 동시에 진행하고,
+    초당 요청 수는 공유 리미터(HOST_RATE_LIMITS)가 지킨다. 응답이 도착하는 대로
+    중복을 걸러낸다.
+    """
 
     name = "네이버뉴스"
+    http_cache = None  # 검색 API 결과는 매번 달라지므로 조건부 요청을 쓰지 않음
 
     def crawl(self) -> list[Article]:
         if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
@@ -49,35 +71,65 @@ class NaverNewsCrawler(BaseCrawler):
             }
         )
 
-        articles: list[Article] = []
-        seen_urls: set[str] = set()
-
-        for keyword in SEARCH_KEYWORDS:
-            params = {
-                "query": keyword,
-                "display": 10,
-                "start": 1,
-                "sort": "date",  # 최신순
-            }
-            resp = self.fetch(API_URL, params=params)
-            if resp is None:
-                continue
-
-            data = resp.json()
-            for item in data.get("items", []):
-                url = item.get("originallink") or item.get("link", "")
-                if url in seen_urls:
-                    continue
-                seen_urls.add(url)
-
-                articles.append(
-                    Article(
-                        title=_strip_html(item.get("title", "")),
-                        url=url,
-                        source=self.name,
-                        date=_parse_date(item.get("pubDate", "")),
-                    )
-                )
-
+        self.complete = True
+        articles = asyncio.run(self._crawl_async())
         logger.info("[%s] %d건 수집 완료", self.name, len(articles))
         return articles
+
+    async def _crawl_async(self) -> list[Article]:
+        articles: list[Article] = []
+        seen: set[int] = set()
+        slots = asyncio.Semaphore(NAVER_CONCURRENCY)
+
+        async def walk(keyword: str) -> None:
+            for start in range(1, MAX_START + 1, NAVER_DISPLAY):
+                params = {
+                    "query": keyword,
+                    "display": NAVER_DISPLAY,
+                    "start": start,
+                    "sort": "date",  # 최신순
+                }
+                async with slots:
+                    resp = await asyncio.to_thread(self.fetch, API_URL, params=params)
+                if resp is None:
+                    # 다른 키워드가 올린 mark가 이 키워드의 못 받은 구간을 덮지 않도록
+                    self.complete = False
+                    return
+
+                with metrics.span("parse", source=self.name):
+                    items = resp.json().get("items", [])
+                    done = self._collect(items, articles, seen)
+                if len(items) < NAVER_DISPLAY or done:
+                    return
+
+        await asyncio.gather(*(walk(keyword) for keyword in SEARCH_KEYWORDS))
+        return articles
+
+    def _collect(self, items: list[dict], articles: list[Article], seen: set[int]) -> bool:
+        """응답 항목을 중복 없이 articles에 추가. 더 오래된 페이지가 필요 없으면 True.
+
+        최신순이므로 이전 실행에서 본 발행 시각보다 오래된 항목이 나오면 나머지는 보지 않는다.
+        """
+        oldest: int | None = None
+        for item in items:
+            published = _parse_pubdate(item.get("pubDate", ""))
+            if published is not None:
+                ts = int(published.timestamp())
+                if self.observe_mark(ts) and ts < self.mark:
+                    return True
+
+            article = Article(
+                title=_strip_html(item.get("title", "")),
+                url=item.get("originallink") or item.get("link", ""),
+                source=self.name,
+                date=published.strftime("%Y-%m-%d") if published else "",
+            )
+            if article.date_ord is not None and (oldest is None or article.date_ord < oldest):
+                oldest = article.date_ord
+
+            keys = {fingerprint(u) for u in (article.url, item.get("link", "")) if u}
+            if keys & seen:
+                continue
+            seen.update(keys)
+            articles.append(article)
+        return oldest is not None and oldest <= self.cutoff
@@ -0,0 +1,143 @@
+"""목록 페이지 파싱용 프로세스 풀 (PARSE_PROCESSES > 0일 때).
+
+HTML 파싱은 CPU를 쓰고 GIL을 잡고 있어서, 크롤러 스레드를 늘려도 파싱은 한 코어에서
+차례로 돈다. 풀을 켜면 크롤러 스레드는 받은 응답 본문(bytes)만 파서 프로세스로 넘기고
+다음 요청을 기다리며, 파서 프로세스는 _parse_list를 실행해 Article 튜플을 돌려준다.
+여러 소스와 페이지의 파싱이 코어 수만큼 동시에 진행된다.
+
+크롤러는 "모듈:클래스" 이름으로 넘기므로 모듈 최상위에 정의된 클래스여야 한다.
+워커 프로세스는 크롤러 인스턴스를 만들어 두고 재사용한다. 워커의 layout_store는 시작할
+때의 사본이라 낡으므로 쓰지 않는다. 지난번에 맞은 선택자는 부른 쪽이 매번 넘겨 주고,
+페이지 구조 지문(layout)과 워커에서 기록한 지표(selector_misses 등)는 결과와 함께
+돌려받아 크롤러 스레드에서 기록한다. 풀을 쓸 수 없으면
+(시작 실패, 워커 종료, 피클 불가) 경고를 남기고 호출한 스레드에서 파싱한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from importlib import import_module
+from pickle import PicklingError
+from typing import TYPE_CHECKING
+
+from src.config import PARSE_PROCESSES
+from src.metrics import metrics
+
+from .base import Article, start_run, today_ordinal
+from .layout import PageLayout
+
+if TYPE_CHECKING:
+    import requests
+
+    from .base import ListCrawler
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+class RawPage:
+    """파서 프로세스로 보내는 응답 본문. 크롤러의 _rows가 쓰는 text/encoding만 제공한다."""
+
+    __slots__ = ("content", "encoding", "url")
+
+    def __init__(self, content: bytes, encoding: str | None, url: str = "") -> None:
+        self.content = content
+        self.encoding = encoding
+        self.url = url
+
+    @classmethod
+    def from_response(cls, resp: requests.Response) -> RawPage:
+        return cls(resp.content, resp.encoding or resp.apparent_encoding, resp.url or "")
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+# 워커 프로세스 안에서 재사용하는 크롤러 ("모듈:클래스" → 인스턴스)
+_crawlers: dict[str, ListCrawler] = {}
+
+
+def _parse_in_worker(
+    target: str,
+    html_parser: str,
+    selector: str | None,
+    mark: int | None,
+    new_mark: int | None,
+    today: int,
+    page: RawPage,
+) -> tuple[list[tuple], int | None, bool, PageLayout | None, tuple[dict, dict]]:
+    """워커 프로세스에서 실행. (Article 튜플 목록, 새 mark, 이미 본 구간에 닿았는지, 구조 지문, 지표).
+
+    워커는 여러 실행(데몬 주기)에 걸쳐 살아 있으므로 '오늘'은 부른 쪽의 값을 따른다.
+    """
+    start_run(date.fromordinal(today))
+    crawler = _crawlers.get(target)
+    if crawler is None:
+        module, _, name = target.partition(":")
+        crawler = _crawlers[target] = getattr(import_module(module), name)()
+        crawler.layout_store = None
+    crawler.html_parser = html_parser
+    crawler.learned_selector = selector
+    crawler.mark = mark
+    crawler.new_mark = new_mark
+    crawler._reached_mark = False
+    metrics.drain()
+    articles = crawler._parse_list(page)
+    return [a.to_tuple() for a in articles], crawler.new_mark, crawler._reached_mark, crawler.layout, metrics.drain()
+
+
+def pool(processes: int = PARSE_PROCESSES) -> ProcessPoolExecutor:
+    """공유 파서 풀 (처음 쓸 때 시작). 스레드가 도는 중에 fork하지 않도록 forkserver/spawn을 쓴다."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _pool = ProcessPoolExecutor(max_workers=processes, mp_context=context)
+        return _pool
+
+
+def shutdown() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+
+def parse_list(crawler: ListCrawler, resp: requests.Response) -> list[Article]:
+    """crawler._parse_list(resp)를 파서 프로세스에서 실행하고 결과와 mark 상태를 반영."""
+    cls = type(crawler)
+    target = f"{cls.__module__}:{cls.__qualname__}"
+    if "<locals>" in target:  # 워커에서 불러올 수 없는 클래스
+        return crawler._parse_list(resp)
+    try:
+        future = pool().submit(
+            _parse_in_worker,
+            target,
+            crawler.html_parser,
+            crawler.layout_store.selector(crawler.name) if crawler.layout_store is not None else None,
+            crawler.mark,
+            crawler.new_mark,
+            today_ordinal(),
+            RawPage.from_response(resp),
+        )
+        rows, new_mark, reached, layout, recorded = future.result()
+    except (BrokenProcessPool, PicklingError, AttributeError, ImportError, OSError) as e:
+        logger.warning("[%s] 파서 프로세스를 쓸 수 없어 직접 파싱합니다: %s", crawler.name, e)
+        if isinstance(e, BrokenProcessPool):
+            shutdown()
+        return crawler._parse_list(resp)
+    crawler.new_mark = new_mark
+    crawler._reached_mark = reached
+    crawler.layout = layout
+    metrics.merge(*recorded)
+    return [Article.from_tuple(row) for row in rows]
@@ -0,0 +1,128 @@
+"""HTML 파서 백엔드 선택.
+
+크롤러는 select / select_one / get_text / get 만 사용하므로, 같은 인터페이스를
+제공하는 백엔드라면 무엇이든 쓸 수 있다.
+
+- "html.parser": 표준 라이브러리 (가장 느림, 항상 사용 가능)
+- "lxml": BeautifulSoup + lxml (기본값)
+- "selectolax": lexbor 기반 C 파서. BeautifulSoup 대신 얇은 어댑터로 감싼다.
+
+parse_only에 "tag#id" / "tag.class" 형태의 단순 선택자를 주면 해당 요소의
+서브트리만 만든다 (BeautifulSoup에서는 SoupStrainer로 처리).
+선택한 백엔드가 설치되어 있지 않으면 html.parser로 대체한다.
+bs4와 selectolax는 처음 파싱할 때 불러온다 (HTML을 다루지 않는 실행은 불러오지 않음).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+PARSERS = ("html.parser", "lxml", "selectolax")
+
+_SIMPLE_SELECTOR = re.compile(r"^(?P<tag>[\w-]*)(?:#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+))?$")
+
+
+def _strainer(selector: str):
+    """"div#id", "ul.class", "table" 형태의 선택자를 SoupStrainer로 변환."""
+    from bs4 import SoupStrainer
+
+    match = _SIMPLE_SELECTOR.match(selector)
+    if not match or not any(match.groups()):
+        raise ValueError(f"지원하지 않는 parse_only 선택자: {selector!r}")
+    attrs = {}
+    if match["id"]:
+        attrs["id"] = match["id"]
+    if match["cls"]:
+        attrs["class"] = match["cls"]
+    return SoupStrainer(match["tag"] or None, attrs)
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(parser: str) -> str:
+    """사용 가능한 백엔드 이름을 반환. 없으면 html.parser로 대체."""
+    if parser == "selectolax":
+        try:
+            import selectolax.lexbor  # noqa: F401
+        except ImportError:
+            logger.warning("selectolax가 설치되어 있지 않아 html.parser를 사용합니다.")
+            return "html.parser"
+        return parser
+    if parser not in PARSERS:
+        raise ValueError(f"알 수 없는 HTML 파서: {parser!r} (사용 가능: {', '.join(PARSERS)})")
+    from bs4.builder import builder_registry
+
+    if builder_registry.lookup(parser) is None:
+        logger.warning("%s 파서가 설치되어 있지 않아 html.parser를 사용합니다.", parser)
+        return "html.parser"
+    return parser
+
+
+class LexborNode:
+    """selectolax 노드를 BeautifulSoup Tag처럼 다루기 위한 어댑터."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node) -> None:
+        self._node = node
+
+    def select(self, selector: str) -> list[LexborNode]:
+        return [LexborNode(n) for n in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> LexborNode | None:
+        node = self._node.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+    def get(self, key: str, default=None):
+        value = self._node.attributes.get(key)
+        return default if value is None else value
+
+
+class _LexborFragments:
+    """parse_only로 고른 서브트리들 안에서만 검색하는 문서 객체."""
+
+    __slots__ = ("_tree", "_roots")
+
+    def __init__(self, tree, selector: str) -> None:
+        self._tree = tree
+        self._roots = {node.mem_id for node in tree.css(selector)}
+
+    def _within(self, node) -> bool:
+        while node is not None:
+            if node.mem_id in self._roots:
+                return True
+            node = node.parent
+        return False
+
+    def select(self, selector: str) -> list[LexborNode]:
+        if not self._roots:
+            return []
+        return [LexborNode(n) for n in self._tree.css(selector) if self._within(n)]
+
+    def select_one(self, selector: str) -> LexborNode | None:
+        found = self.select(selector)
+        return found[0] if found else None
+
+
+def make_soup(markup: str | bytes, parser: str = "html.parser", parse_only: str | None = None):
+    """markup을 파싱해 select/select_one을 지원하는 문서 객체를 반환."""
+    parser = resolve_parser(parser)
+
+    if parser == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(markup)
+        if parse_only is None:
+            return LexborNode(tree.root)
+        return _LexborFragments(tree, parse_only)
+
+    from bs4 import BeautifulSoup
+
+    strainer = _strainer(parse_only) if parse_only else None
+    return BeautifulSoup(markup, parser, parse_only=strainer)
@@ -0,0 +1,96 @@
+"""크롤러 레지스트리.
+
+소스마다 크롤러 클래스의 위치와 메타데이터(호스트, 갱신 주기, 비용)를 적어 둔다.
+크롤러 모듈은 실제로 실행할 때 불러오므로, 메타데이터만 필요한 스케줄러나
+속도 제한기는 크롤러를 불러오지 않고 이 표만 읽으면 된다.
+
+새 소스는 register()로 추가한다.
+
+    register(CrawlerSpec("mysite", "내 사이트", "myplugin.crawler:MyCrawler", host="example.com"))
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from src.config import MAX_PAGES, SEARCH_KEYWORDS
+
+if TYPE_CHECKING:
+    from .base import BaseCrawler
+
+DAY = 24 * 3600
+
+
+@dataclass(frozen=True)
+class CrawlerSpec:
+    """크롤러 하나의 위치와 메타데이터."""
+
+    key: str  # CLI에서 쓰는 이름 (--sources kstartup)
+    name: str  # 소스 이름 (Article.source, 크롤러 클래스의 name)
+    target: str  # "모듈:클래스". 모듈이 "."으로 시작하면 src.crawlers 기준
+    host: str  # 요청을 보내는 호스트 (ratelimit.host_of 형식)
+    interval: float = DAY  # 기대 갱신 주기(초) — 데몬의 기본 수집 주기
+    cost: int = MAX_PAGES  # 한 번 수집할 때의 최대 요청 수
+    news: bool = False  # 마감일 없는 정보성 소스 (뉴스, 보도자료)
+    rate: tuple[float, int] | None = None  # 호스트의 (초당 요청 수, 버스트). 없으면 기본값
+
+    @property
+    def class_name(self) -> str:
+        return self.target.rpartition(":")[2]
+
+    def load(self) -> type[BaseCrawler]:
+        """크롤러 클래스를 불러온다."""
+        module, _, cls = self.target.rpartition(":")
+        return getattr(import_module(module, __package__), cls)
+
+
+REGISTRY: dict[str, CrawlerSpec] = {}
+
+
+def register(spec: CrawlerSpec) -> CrawlerSpec:
+    """소스를 추가한다 (같은 key면 교체)."""
+    REGISTRY[spec.key] = spec
+    return spec
+
+
+def get(key_or_name: str) -> CrawlerSpec:
+    """key, 소스 이름, 클래스 이름 중 무엇으로든 찾는다. 없으면 KeyError."""
+    if key_or_name in REGISTRY:
+        return REGISTRY[key_or_name]
+    for spec in REGISTRY.values():
+        if key_or_name in (spec.name, spec.class_name):
+            return spec
+    raise KeyError(key_or_name)
+
+
+def host_rates() -> dict[str, tuple[float, int]]:
+    """호스트 → (초당 요청 수, 버스트). 속도 제한기의 호스트별 기본값."""
+    return {spec.host: spec.rate for spec in REGISTRY.values() if spec.rate is not None}
+
+
+def select(include: list[str] | None = None, exclude: list[str] | None = None) -> list[CrawlerSpec]:
+    """include(없으면 전체)에서 exclude를 뺀 소스. 등록 순서를 따른다."""
+    wanted = {get(k).key for k in include} if include else set(REGISTRY)
+    wanted -= {get(k).key for k in exclude or ()}
+    return [spec for key, spec in REGISTRY.items() if key in wanted]
+
+
+for _spec in (
+    CrawlerSpec("kstartup", "K-Startup", ".kstartup:KStartupCrawler", host="k-startup.go.kr"),
+    CrawlerSpec("mss", "중소벤처기업부", ".mss:MSSCrawler", host="mss.go.kr", interval=6 * 3600, news=True),
+    CrawlerSpec("kised", "창업진흥원", ".kised:KisedCrawler", host="kised.or.kr"),
+    CrawlerSpec("bizinfo", "기업마당", ".bizinfo:BizinfoCrawler", host="bizinfo.go.kr"),
+    CrawlerSpec(
+        "naver",
+        "네이버뉴스",
+        ".naver_news:NaverNewsCrawler",
+        host="openapi.naver.com",
+        interval=3600,
+        cost=len(SEARCH_KEYWORDS) * 10,  # 키워드당 최대 10페이지 (start 1000까지)
+        news=True,
+        rate=(10.0, 10),
+    ),
+):
+    register(_spec)
@@ -0,0 +1,194 @@
+"""상주(데몬) 모드: 소스별 주기로 수집하고, 다이제스트는 따로 정한 주기로 전송.
+
+    python -m src.daemon
+
+- 소스마다 CRAWL_INTERVALS(없으면 크롤러 레지스트리의 interval) 주기로 수집한다.
+  크롤러 인스턴스를 계속 쓰므로 세션(연결)과 HTTP 캐시가 주기 사이에 유지된다.
+- 새 항목은 전송 이력 DB의 pending 테이블에 쌓아 두고, DIGEST_INTERVAL마다
+  쌓인 항목을 처리(process)해 한 번에 보낸다. 마지막 전송 시각은 DB에 남기므로
+  재시작해도 다이제스트 일정이 유지된다.
+- SIGTERM/SIGINT를 받으면 진행 중인 주기를 마치고 이력 DB를 닫은 뒤 끝난다.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import signal
+import sys
+import threading
+import time
+
+from src.config import (
+    CRAWL_DEADLINE,
+    CRAWL_INTERVALS,
+    CRAWL_WORKERS,
+    DAYS_LOOKBACK,
+    DEFAULT_CRAWL_INTERVAL,
+    DIGEST_INTERVAL,
+    ENRICH_DETAILS,
+    METRICS_FILE,
+    METRICS_PROM_FILE,
+    PARSE_PROCESSES,
+)
+from src.crawlers import registry
+from src.crawlers.base import BaseCrawler, start_run
+from src.enrich import enrich
+from src.history import HistoryStore
+from src.main import collect, load_crawlers, prune_storage
+from src.metrics import metrics
+from src.notifier import resume_slack, send_slack
+from src.processor import load_history, process
+
+logger = logging.getLogger(__name__)
+
+LAST_DIGEST_KEY = "last_digest_at"
+
+
+class KnownURLs:
+    """이미 보냈거나 전송 대기 중인 URL. 크롤러가 아는 구간에서 페이지 넘기기를 멈추는 데 쓴다."""
+
+    def __init__(self, history: HistoryStore) -> None:
+        self.history = history
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and (url in self.history or self.history.is_pending(url))
+
+
+class Daemon:
+    """소스별 수집 일정과 다이제스트 일정을 관리."""
+
+    def __init__(
+        self,
+        history: HistoryStore,
+        crawlers: list[type[BaseCrawler]] | None = None,
+        intervals: dict[str, float] | None = None,
+        digest_interval: float = DIGEST_INTERVAL,
+    ) -> None:
+        self.history = history
+        self.known = KnownURLs(history)
+        self.classes = load_crawlers(crawlers)
+        marks = history.get_marks()
+        self.crawlers = [cls(history=self.known, mark=marks.get(cls.name)) for cls in self.classes]
+        self.intervals = CRAWL_INTERVALS if intervals is None else intervals
+        self.digest_interval = digest_interval
+        self._stop = threading.Event()
+
+        # 시작하면 모든 소스를 한 번 수집하고, 다이제스트를 보낸 적이 없으면 바로 보낸다
+        self.next_crawl = [0.0] * len(self.crawlers)
+        last = self.history.get_meta(LAST_DIGEST_KEY)
+        self.next_digest = float(last) + digest_interval if last else 0.0
+
+    @property
+    def digest_lookback(self) -> int:
+        """다이제스트의 기간 필터 (일).
+
+        쌓인 항목은 수집할 때 이미 DAYS_LOOKBACK으로 걸렀으므로, 다이제스트까지 기다린
+        시간만큼 늘려야 주기 초반에 쌓인 뉴스가 오래됐다고 버려지지 않는다.
+        """
+        return DAYS_LOOKBACK + math.ceil(self.digest_interval / 86400)
+
+    def interval(self, crawler: BaseCrawler) -> float:
+        if crawler.name in self.intervals:
+            return self.intervals[crawler.name]
+        try:
+            return registry.get(crawler.name).interval
+        except KeyError:
+            return DEFAULT_CRAWL_INTERVAL
+
+    def crawl_due(self, now: float) -> int:
+        """주기가 된 소스를 병렬로 수집해 전송 대기열에 쌓고, 새로 쌓은 건수를 반환."""
+        due = [i for i, at in enumerate(self.next_crawl) if at <= now]
+        if not due:
+            return 0
+
+        start_run()
+        for i in due:
+            self.crawlers[i].refresh()
+            self.next_crawl[i] = now + self.interval(self.crawlers[i])
+
+        results = collect([self.crawlers[i] for i in due], CRAWL_WORKERS, CRAWL_DEADLINE)
+        if ENRICH_DETAILS:
+            # 대기열에 이미 있는 항목은 쌓을 때 보강했으므로 건너뛴다
+            finished = {self.crawlers[due[pos]].name: self.crawlers[due[pos]] for pos in results}
+            enrich([a for pos in sorted(results) for a in results[pos]], finished, self.known)
+        added = 0
+        for pos, i in enumerate(due):
+            crawler = self.crawlers[i]
+            if pos not in results:
+                # 시간 초과나 오류 — 워커가 아직 쓰고 있을 수 있으므로 새 인스턴스로 바꾼다
+                self.crawlers[i] = self.classes[i](history=self.known, mark=crawler.mark)
+                continue
+            count = self.history.buffer(results[pos])
+            self.history.set_marks({crawler.name: crawler.committed_mark})
+            logger.info("[%s] 새 항목 %d건을 전송 대기열에 추가", crawler.name, count)
+            added += count
+        # 데몬은 끝나지 않으므로 수집 주기마다 보관소와 캐시를 정리한다
+        prune_storage()
+        return added
+
+    def digest(self, now: float) -> bool:
+        """쌓인 항목을 처리해 전송. 보낼 것이 없거나 전송에 성공하면 True."""
+        self.next_digest = now + self.digest_interval
+        start_run()
+        self.history.evict(now)
+
+        articles = self.history.pending()
+        ok = True
+        if articles:
+            categorized = process(articles, self.history, self.digest_lookback, [cls.name for cls in self.classes])
+            ok = send_slack(categorized) if categorized else resume_slack()
+            # 처리한 항목은 전송 이력으로 옮겨졌거나 걸러졌다 (전송 실패는 delivery가 이어서 보낸다)
+            self.history.clear_pending(articles)
+        else:
+            logger.info("전송 대기 중인 소식이 없습니다.")
+            ok = resume_slack()
+
+        self.history.set_meta(LAST_DIGEST_KEY, str(now))
+        logger.info("단계별 소요 시간: %s", metrics.summary())
+        metrics.write(METRICS_FILE, METRICS_PROM_FILE)
+        metrics.reset()
+        return ok
+
+    def run_once(self, now: float | None = None) -> float:
+        """할 일을 처리하고 다음 일정까지 남은 시간(초)을 반환."""
+        now = time.time() if now is None else now
+        self.crawl_due(now)
+        if now >= self.next_digest:
+            if not self.digest(now):
+                logger.error("Slack 전송 실패!")
+        return max(0.0, min([*self.next_crawl, self.next_digest]) - time.time())
+
+    def run(self) -> None:
+        logger.info("=== Startup Policy Digest 데몬 시작 (소스 %d개) ===", len(self.crawlers))
+        while not self._stop.is_set():
+            try:
+                wait = self.run_once()
+            except Exception:
+                logger.exception("데몬 주기 실행 중 오류 발생")
+                wait = 60.0
+            self._stop.wait(wait)
+        logger.info("=== Startup Policy Digest 데몬 종료 ===")
+
+    def stop(self, *_) -> None:
+        self._stop.set()
+
+
+def main() -> int:
+    history = load_history()
+    daemon = Daemon(history)
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    try:
+        daemon.run()
+    finally:
+        history.close()
+        if PARSE_PROCESSES > 0:
+            from src.crawlers import parsepool
+
+            parsepool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
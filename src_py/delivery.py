@@ -0,0 +1,211 @@
+"""Slack 전송 엔진: 속도 제한을 지키는 분할 전송과 이어서 보내기.
+
+- 메시지는 채널당 토큰 버킷(SLACK_POST_RATE, SLACK_POST_BURST) 간격으로 보낸다.
+- 429(ratelimited)는 Retry-After만큼, 일시 오류는 지수 백오프(지터 포함)로 재시도.
+- 채널 참여 여부를 상태 파일에 기록해 conversations.join은 처음 한 번만 호출.
+- 보낼 메시지 묶음(작업)을 상태 파일에 기록하고 한 건 보낼 때마다 진행 위치를
+  갱신한다. 재시도를 다 써서 멈추면 다음 실행에서 마지막으로 성공한 메시지
+  다음부터 같은 스레드에 이어서 보낸다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import random
+import time
+
+from slack_sdk.errors import SlackApiError
+
+from src.config import SLACK_MAX_RETRIES, SLACK_POST_BURST, SLACK_POST_RATE, SLACK_STATE_FILE
+from src.fsutil import write_atomic
+from src.metrics import metrics
+from src.ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# 재시도하면 성공할 수 있는 Slack 오류
+RETRYABLE_ERRORS = {"ratelimited", "internal_error", "fatal_error", "service_unavailable", "request_timeout"}
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_MAX = 30.0  # seconds
+JOB_TTL = 30 * 86400  # 이보다 오래된 미완료 작업은 버린다 (주 1회 다이제스트 몇 번은 이어 보낼 수 있게)
+
+
+class DeliveryError(Exception):
+    """재시도로 해결되지 않아 작업을 중단한 경우."""
+
+
+def _retry_after(e: SlackApiError) -> float | None:
+    """429 응답의 Retry-After (초). 속도 제한이 아니면 None."""
+    response = e.response
+    if getattr(response, "status_code", None) != 429 and response.get("error") != "ratelimited":
+        return None
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return BACKOFF_BASE
+
+
+class SlackDelivery:
+    """한 채널로 메시지 묶음을 보낸다. 첫 메시지가 본문, 나머지는 그 스레드 답글."""
+
+    def __init__(
+        self,
+        client,
+        channel: str,
+        state_file: str = SLACK_STATE_FILE,
+        max_retries: int = SLACK_MAX_RETRIES,
+        bucket: TokenBucket | None = None,
+    ) -> None:
+        self.client = client
+        self.channel = channel
+        self.state_file = state_file
+        self.max_retries = max_retries
+        self.bucket = bucket or TokenBucket(SLACK_POST_RATE, SLACK_POST_BURST)
+        self.state = self._load()
+
+    def _load(self) -> dict:
+        state: dict = {"joined": [], "jobs": []}
+        if not self.state_file:
+            return state
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Slack 상태 파일을 읽지 못했습니다: %s", e)
+        return state
+
+    def _save(self) -> None:
+        if not self.state_file:
+            return
+        write_atomic(self.state_file, json.dumps(self.state, ensure_ascii=False))
+
+    def _call(self, method: str, **kwargs):
+        """Slack API 호출. 속도 제한과 일시 오류는 재시도하고, 그 밖의 오류는 그대로 올린다."""
+        func = getattr(self.client, method)
+        name = method.replace("_", ".", 1)
+        for attempt in range(self.max_retries + 1):
+            if method == "chat_postMessage":
+                wait = self.bucket.reserve()
+                if wait > 0:
+                    time.sleep(wait)
+            try:
+                with metrics.span("slack_api", method=name):
+                    return func(**kwargs)
+            except SlackApiError as e:
+                delay = _retry_after(e)
+                if delay is None:
+                    if e.response.get("error") not in RETRYABLE_ERRORS:
+                        raise
+                    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+                error = e
+            except OSError as e:  # 연결 실패, 타임아웃
+                delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+                error = e
+
+            if attempt == self.max_retries:
+                break
+            logger.warning("Slack %s 실패 (%s), %.1f초 후 재시도 (%d/%d)", name, error, delay, attempt + 1, self.max_retries)
+            metrics.incr("slack_retries", method=name)
+            time.sleep(delay)
+        raise DeliveryError(f"Slack {name} 재시도 {self.max_retries}회 초과: {error}")
+
+    def ensure_joined(self, channel: str | None = None, force: bool = False) -> None:
+        """봇이 채널에 참여하지 않았으면 참여. 이미 참여한 채널은 기록해 두고 건너뛴다."""
+        channel = channel or self.channel
+        if not force and channel in self.state["joined"]:
+            return
+        try:
+            self._call("conversations_join", channel=channel)
+        except SlackApiError:
+            return  # 권한이 없으면 무시 (이미 참여 중이면 전송은 된다)
+        if channel not in self.state["joined"]:
+            self.state["joined"].append(channel)
+            self._save()
+
+    def _post(self, channel: str, message: dict, thread_ts: str | None) -> str:
+        kwargs = {"channel": channel, "unfurl_links": False, "unfurl_media": False, **message}
+        if thread_ts:
+            kwargs["thread_ts"] = thread_ts
+        try:
+            return self._call("chat_postMessage", **kwargs)["ts"]
+        except SlackApiError as e:
+            if e.response.get("error") != "not_in_channel":
+                raise
+            # 채널에서 내보내진 경우 — 다시 참여하고 한 번 더 시도
+            if channel in self.state["joined"]:
+                self.state["joined"].remove(channel)
+            self.ensure_joined(channel, force=True)
+            return self._call("chat_postMessage", **kwargs)["ts"]
+
+    def deliver(self, messages: list[dict]) -> bool:
+        """messages를 작업으로 기록하고, 밀린 작업부터 차례로 보낸다. 모두 보냈으면 True.
+
+        각 메시지는 chat.postMessage 인자(text, blocks) 딕셔너리다.
+        """
+        job_id = self.job_id(messages)
+        self._expire()
+        if not any(j["id"] == job_id for j in self.state["jobs"]):
+            self.state["jobs"].append(
+                {"id": job_id, "channel": self.channel, "messages": messages, "sent": 0, "thread_ts": None, "created": time.time()}
+            )
+        self._save()
+        return self.resume()
+
+    def job_id(self, messages: list[dict]) -> str:
+        return hashlib.sha1(json.dumps([self.channel, messages], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def discard(self, messages: list[dict]) -> None:
+        """messages 작업을 기록에서 지운다 (다른 수단으로 대신 보낸 경우 — 다음 실행에서 다시 보내지 않도록)."""
+        job_id = self.job_id(messages)
+        jobs = [j for j in self.state["jobs"] if j["id"] != job_id]
+        if len(jobs) < len(self.state["jobs"]):
+            self.state["jobs"] = jobs
+            self._save()
+
+    @property
+    def pending(self) -> int:
+        """상태 파일에 남아 있는 미완료 작업 수."""
+        return len(self.state["jobs"])
+
+    def _expire(self) -> None:
+        now = time.time()
+        jobs = [j for j in self.state["jobs"] if now - j["created"] < JOB_TTL]
+        if len(jobs) < len(self.state["jobs"]):
+            logger.warning("오래된 미완료 Slack 전송 %d건을 버립니다.", len(self.state["jobs"]) - len(jobs))
+            self.state["jobs"] = jobs
+            self._save()
+
+    def resume(self) -> bool:
+        """밀린 작업을 차례로 보낸다. 모두 보냈으면(남은 작업이 없으면) True."""
+        self._expire()
+        while self.state["jobs"]:
+            job = self.state["jobs"][0]
+            try:
+                self._run(job)
+            except DeliveryError as e:
+                logger.error("%s — 다음 실행에서 %d번째 메시지부터 이어서 보냅니다.", e, job["sent"] + 1)
+                return False
+            except SlackApiError:
+                # 재시도해도 안 되는 오류 (권한, 채널 없음 등) — 작업을 버린다
+                self.state["jobs"].pop(0)
+                self._save()
+                raise
+            self.state["jobs"].pop(0)
+            self._save()
+        return True
+
+    def _run(self, job: dict) -> None:
+        if job["sent"]:
+            logger.info("중단된 Slack 전송을 %d번째 메시지부터 이어서 보냅니다.", job["sent"] + 1)
+        for message in job["messages"][job["sent"] :]:
+            ts = self._post(job["channel"], message, job["thread_ts"])
+            if job["thread_ts"] is None:
+                job["thread_ts"] = ts
+            job["sent"] += 1
+            self._save()
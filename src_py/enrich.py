@@ -0,0 +1,171 @@
+"""상세 페이지 보강 (ENRICH_DETAILS=1).
+
+목록 페이지에는 제목과 날짜 정도만 있다. 창업진흥원은 목록에 등록일이 없어
+오늘 날짜를 쓰고, 중소벤처기업부·기업마당도 날짜를 읽지 못하면 오늘로 둔다.
+이 단계는 아직 보내지 않은 새 항목의 상세 페이지만 받아 실제 등록일·마감일을
+고치고, 기관(agency)·예산(budget)을 Article.extra에 채운다.
+
+- 대상: 크롤러가 상세 URL을 알려 주고 전송 이력에 없는 항목 (같은 공고는 한 번만).
+  추가 요청 수는 목록 크기가 아니라 새 항목 수에 비례한다.
+- 워커 ENRICH_WORKERS개로 받되 호스트마다 동시에 ENRICH_PER_HOST개까지만 요청한다.
+  요청 간격은 크롤러의 호스트별 RateLimiter가 그대로 지킨다.
+- 추출 결과는 URL별로 ENRICH_CACHE_DIR에 저장해 ENRICH_CACHE_DAYS 동안 다시 받지 않고,
+  그 기간이 지난 파일은 prune()으로 지운다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Container
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from src.config import ENRICH_CACHE_DAYS, ENRICH_CACHE_DIR, ENRICH_PER_HOST, ENRICH_WORKERS
+from src.crawlers.base import Article, BaseCrawler
+from src.fsutil import write_atomic
+from src.metrics import metrics
+from src.urlnorm import fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class DetailCache:
+    """URL → 상세 페이지 추출 결과. 파서가 바뀌었거나 기간이 지난 항목은 쓰지 않는다."""
+
+    def __init__(self, directory: str, ttl: float = ENRICH_CACHE_DAYS * 86400) -> None:
+        self.directory = directory
+        self.ttl = ttl
+
+    def path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json")
+
+    def get(self, url: str, parser: str, now: float | None = None) -> dict[str, str] | None:
+        try:
+            with open(self.path(url), encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        now = time.time() if now is None else now
+        if record.get("parser") != parser or now - record.get("fetched_at", 0) >= self.ttl:
+            return None
+        return record.get("details")
+
+    def put(self, url: str, parser: str, details: dict[str, str], now: float | None = None) -> None:
+        record = {
+            "url": url,
+            "parser": parser,
+            "fetched_at": time.time() if now is None else now,
+            "details": details,
+        }
+        try:
+            write_atomic(self.path(url), json.dumps(record, ensure_ascii=False))
+        except OSError as e:
+            logger.warning("상세 페이지 캐시 저장 실패: %s — %s", url, e)
+
+    def prune(self, now: float | None = None) -> int:
+        """기간이 지난 추출 결과 파일을 지운다. 지운 파일 수를 반환."""
+        cutoff = (time.time() if now is None else now) - self.ttl
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        removed = 0
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                if not name.endswith(".json") or os.path.getmtime(path) >= cutoff:
+                    continue
+                os.remove(path)
+            except OSError:
+                continue
+            removed += 1
+        if removed:
+            logger.info("기간이 지난 상세 페이지 캐시 %d개 삭제", removed)
+        return removed
+
+
+# 기본 캐시 (ENRICH_CACHE_DIR이 비어 있으면 비활성화)
+detail_cache = DetailCache(ENRICH_CACHE_DIR) if ENRICH_CACHE_DIR else None
+
+
+def apply_details(article: Article, details: dict[str, str]) -> None:
+    """추출한 값으로 날짜·마감일을 고치고 기관·예산을 extra에 넣는다."""
+    if details.get("date"):
+        article.date = details["date"]
+    if details.get("deadline"):
+        article.deadline = details["deadline"]
+    for name in ("agency", "budget"):
+        if details.get(name):
+            article.extra[name] = details[name]
+
+
+def enrich(
+    articles: list[Article],
+    crawlers: dict[str, BaseCrawler],
+    history: Container[str] | None = None,
+    max_workers: int = ENRICH_WORKERS,
+    per_host: int = ENRICH_PER_HOST,
+    cache: DetailCache | None = detail_cache,
+) -> int:
+    """새 항목의 상세 페이지로 articles를 제자리에서 보강하고, 보강한 건수를 반환.
+
+    crawlers는 소스 이름 → 그 소스의 크롤러 (상세 URL 판단, 요청, 파싱에 쓴다).
+    """
+    history = history if history is not None else frozenset()
+    targets: list[tuple[BaseCrawler, Article, str]] = []
+    seen: set[int] = set()
+    for article in articles:
+        crawler = crawlers.get(article.source)
+        url = crawler.detail_url(article) if crawler is not None else None
+        if not url or article.url in history:
+            continue
+        fp = fingerprint(article.url)
+        if fp in seen:
+            continue
+        seen.add(fp)
+        targets.append((crawler, article, url))
+    if not targets:
+        return 0
+
+    hosts = {url: urlsplit(url).hostname or "" for _, _, url in targets}
+    slots = {host: threading.BoundedSemaphore(max(1, per_host)) for host in hosts.values()}
+
+    def work(target: tuple[BaseCrawler, Article, str]) -> dict[str, str] | None:
+        crawler, _, url = target
+        parser = f"{type(crawler).__name__}:{crawler.parse_version}"
+        try:
+            if cache is not None:
+                details = cache.get(url, parser)
+                if details is not None:
+                    metrics.incr("detail_cache_hits", source=crawler.name)
+                    return details
+            with slots[hosts[url]]:
+                resp = crawler.fetch(url, kind="detail")
+            if resp is None:
+                return None
+            with metrics.span("parse", source=crawler.name, kind="detail"):
+                details = crawler.parse_detail(resp)
+        except Exception:
+            logger.exception("[%s] 상세 페이지 처리 중 오류: %s", crawler.name, url)
+            return None
+        if cache is not None:
+            cache.put(url, parser, details)
+        return details
+
+    workers = max(1, min(max_workers, len(targets)))
+    with metrics.span("enrich"), ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+        results = list(executor.map(work, targets))
+
+    enriched = 0
+    for (crawler, article, _), details in zip(targets, results):
+        if details:
+            apply_details(article, details)
+            metrics.incr("enriched", source=crawler.name)
+            enriched += 1
+    logger.info("상세 페이지 보강: 대상 %d건 중 %d건", len(targets), enriched)
+    return enriched
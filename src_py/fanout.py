@@ -0,0 +1,113 @@
+"""여러 전송 대상(채널/워크스페이스)으로 다이제스트를 동시에 보낸다.
+
+SLACK_DESTINATIONS(JSON 목록)로 대상을 정한다. 비어 있으면 기존 단일 설정
+(SLACK_BOT_TOKEN + SLACK_CHANNEL_ID, 없으면 SLACK_WEBHOOK_URL)을 대상 하나로 쓴다.
+
+    [
+      {"name": "team-a", "token": "xoxb-...", "channel": "C123"},
+      {"name": "news", "webhook": "https://hooks.slack.com/...", "categories": ["news"]}
+    ]
+
+categories에는 urgent / new / news(또는 카테고리 이름)를 쓰고, 생략하면 전체를
+보낸다. 대상마다 독립된 워커에서 보내므로 느리거나 실패하는 대상이 다른 대상을
+막지 않는다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from src.config import SLACK_FANOUT_WORKERS
+from src.metrics import metrics
+from src.processor import CAT_NEW, CAT_NEWS, CAT_URGENT
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_KEYS = {"urgent": CAT_URGENT, "new": CAT_NEW, "news": CAT_NEWS}
+
+
+@dataclass(frozen=True)
+class Destination:
+    """전송 대상 하나. token+channel이 있으면 봇, 없으면 webhook (봇 실패 시 폴백도 webhook)."""
+
+    name: str
+    token: str = ""
+    channel: str = ""
+    webhook: str = ""
+    categories: tuple[str, ...] = ()  # 비어 있으면 전체
+
+    @property
+    def uses_bot(self) -> bool:
+        return bool(self.token and self.channel)
+
+
+def parse_destinations(raw: str) -> list[Destination]:
+    """SLACK_DESTINATIONS JSON을 읽는다. 잘못된 항목은 로그를 남기고 건너뛴다."""
+    try:
+        entries = json.loads(raw)
+    except json.JSONDecodeError as e:
+        logger.error("SLACK_DESTINATIONS를 읽지 못했습니다: %s", e)
+        return []
+    if not isinstance(entries, list):
+        logger.error("SLACK_DESTINATIONS는 JSON 목록이어야 합니다.")
+        return []
+
+    destinations: list[Destination] = []
+    names: set[str] = set()
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            logger.error("SLACK_DESTINATIONS[%d]: 객체가 아닙니다.", i)
+            continue
+        name = str(entry.get("name") or f"dest{i + 1}")
+        if name in names:
+            logger.error("SLACK_DESTINATIONS[%d]: 이름 '%s'이 중복됩니다.", i, name)
+            continue
+        categories = []
+        for category in entry.get("categories") or ():
+            category = CATEGORY_KEYS.get(category, category)
+            if category not in CATEGORY_KEYS.values():
+                logger.warning("[%s] 알 수 없는 카테고리 '%s'를 무시합니다.", name, category)
+                continue
+            categories.append(category)
+        dest = Destination(
+            name=name,
+            token=entry.get("token", ""),
+            channel=entry.get("channel", ""),
+            webhook=entry.get("webhook", ""),
+            categories=tuple(categories),
+        )
+        if not (dest.uses_bot or dest.webhook):
+            logger.error("[%s] token+channel 또는 webhook이 필요합니다.", name)
+            continue
+        names.add(name)
+        destinations.append(dest)
+    return destinations
+
+
+def fan_out(
+    destinations: list[Destination],
+    send: Callable[[Destination], bool],
+    max_workers: int = SLACK_FANOUT_WORKERS,
+) -> dict[str, bool]:
+    """대상마다 send를 동시에 실행하고 대상 이름 → 성공 여부를 반환 (대상 순서 유지)."""
+    if not destinations:
+        return {}
+
+    def run(dest: Destination) -> bool:
+        try:
+            with metrics.span("deliver", destination=dest.name):
+                ok = send(dest)
+        except Exception:
+            logger.exception("[%s] 전송 중 오류 발생", dest.name)
+            ok = False
+        metrics.incr("deliveries", destination=dest.name, ok=ok)
+        return ok
+
+    workers = max(1, min(max_workers, len(destinations)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fanout") as executor:
+        results = list(executor.map(run, destinations))
+    return {dest.name: ok for dest, ok in zip(destinations, results)}
@@ -0,0 +1,28 @@
+"""상태·캐시 파일 쓰기 도우미."""
+
+from __future__ import annotations
+
+import os
+import threading
+
+
+def write_atomic(path: str, data: bytes | str) -> None:
+    """임시 파일에 다 쓴 뒤 os.replace로 바꿔 넣는다. 쓰다가 끊겨도 이전 내용이 남는다.
+
+    상위 디렉터리가 없으면 만들고, str은 UTF-8로 쓴다. 임시 파일 이름에 프로세스·스레드를
+    넣으므로 여러 스레드가 같은 파일을 써도 서로의 임시 파일을 덮지 않는다.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
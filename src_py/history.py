@@ -0,0 +1,232 @@
+"""전송 이력 저장소 (SQLite, WAL 모드).
+
+정규화한 URL의 지문(urlnorm.fingerprint)마다 전송 시각, 소스, 카테고리를
+기록한다. 열 때 키 전체를 메모리 집합으로 읽어 두므로 중복 확인은 O(1)이고, 새 항목은 추가된 행만 쓰기 때문에 이력이
+수십만 건으로 늘어나도 저장 비용이 커지지 않는다. 보존 기간이 지난 항목은
+전송 시각 기준으로 지운다. 근사 중복 탐지를 위해 제목과 MinHash 서명도 함께
+저장한다.
+
+데몬 모드(src.daemon)에서는 수집한 새 항목을 다음 다이제스트까지 pending 테이블에
+쌓아 두고, 다이제스트 일정 같은 실행 상태는 meta 테이블에 둔다. 소스별
+high-water mark(이미 본 가장 큰 공고 번호나 발행 시각)는 marks 테이블에 둔다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+
+from src.config import HISTORY_DB, HISTORY_FILE, HISTORY_RETENTION_DAYS
+from src.crawlers.base import Article
+from src.neardup import signature
+from src.urlnorm import fingerprint
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sent (
+    fp INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    sent_at INTEGER NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    sig BLOB
+);
+CREATE INDEX IF NOT EXISTS sent_sent_at ON sent (sent_at);
+CREATE TABLE IF NOT EXISTS pending (
+    fp INTEGER NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    article TEXT NOT NULL,
+    added_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS marks (
+    source TEXT PRIMARY KEY,
+    mark INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+"""
+
+
+class HistoryStore:
+    """전송 이력. `url in store`로 전송 여부를 확인한다."""
+
+    def __init__(
+        self,
+        path: str = HISTORY_DB,
+        retention_days: int = HISTORY_RETENTION_DAYS,
+        legacy_file: str | None = HISTORY_FILE,
+    ) -> None:
+        self.path = path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+                if legacy_file:
+                    self._import_legacy(legacy_file)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self.evict()
+        self._keys = {row[0] for row in self._conn.execute("SELECT fp FROM sent")}
+        self._pending = {row[0] for row in self._conn.execute("SELECT fp FROM pending")}
+
+    def _import_legacy(self, legacy_file: str) -> None:
+        """이전 JSON URL 목록을 가져온다. 전송 시각을 모르므로 지금으로 기록."""
+        if not os.path.exists(legacy_file):
+            return
+        try:
+            with open(legacy_file, encoding="utf-8") as f:
+                urls = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        now = int(time.time())
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO sent (fp, url, sent_at) VALUES (?, ?, ?)",
+            [(fingerprint(url), url, now) for url in urls],
+        )
+        logger.info("기존 전송 이력 %d건을 가져왔습니다.", len(urls))
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and fingerprint(url) in self._keys
+
+    def has_fingerprint(self, fp: int) -> bool:
+        return fp in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(
+        self,
+        articles: Iterable[Article],
+        sent_at: float | None = None,
+        signatures: dict[int, array] | None = None,
+    ) -> None:
+        """전송한 기사를 기록. signatures(지문 → 서명)에 없는 서명은 새로 계산한다."""
+        ts = int(sent_at if sent_at is not None else time.time())
+        signatures = signatures or {}
+        rows = []
+        for a in articles:
+            fp = fingerprint(a.url)
+            sig = signatures.get(fp)
+            if sig is None:
+                sig = signature(a.title)
+            rows.append((fp, a.url, a.source, a.category, ts, a.title, sig.tobytes()))
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sent (fp, url, source, category, sent_at, title, sig)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._keys.update(row[0] for row in rows)
+
+    def recent_signatures(self, days: int, now: float | None = None) -> Iterator[tuple[int, str, str, array]]:
+        """최근 days일 안에 전송한 항목의 (지문, 소스, 제목, 서명)."""
+        since = int((now if now is not None else time.time()) - days * 86400)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fp, source, title, sig FROM sent WHERE sent_at >= ? AND sig IS NOT NULL",
+                (since,),
+            ).fetchall()
+        for fp, source, title, blob in rows:
+            yield fp, source, title, array("I", blob)
+
+    def evict(self, now: float | None = None) -> int:
+        """보존 기간이 지난 항목을 삭제하고 삭제 건수를 반환."""
+        if self.retention_days <= 0:
+            return 0
+        cutoff = int((now if now is not None else time.time()) - self.retention_days * 86400)
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM sent WHERE sent_at < ?", (cutoff,)).rowcount
+        if removed:
+            logger.info("보존 기간(%d일)이 지난 전송 이력 %d건 삭제", self.retention_days, removed)
+            if hasattr(self, "_keys"):
+                self._keys = {row[0] for row in self._conn.execute("SELECT fp FROM sent")}
+        return removed
+
+    def is_pending(self, url: str) -> bool:
+        return fingerprint(url) in self._pending
+
+    def buffer(self, articles: Iterable[Article], added_at: float | None = None) -> int:
+        """다음 다이제스트로 보낼 항목을 쌓아 둔다. 이미 보냈거나 쌓인 항목은 건너뛰고, 새로 쌓은 건수를 반환."""
+        ts = int(added_at if added_at is not None else time.time())
+        rows = {}
+        for a in articles:
+            fp = fingerprint(a.url)
+            if fp not in self._keys and fp not in self._pending and fp not in rows:
+                rows[fp] = (fp, a.source, json.dumps(a.to_dict(), ensure_ascii=False), ts)
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO pending (fp, source, article, added_at) VALUES (?, ?, ?, ?)", rows.values()
+            )
+            self._pending.update(rows)
+        return len(rows)
+
+    def pending(self) -> list[Article]:
+        """쌓인 항목 (쌓은 순서)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT article FROM pending ORDER BY added_at, rowid").fetchall()
+        return [Article.from_dict(json.loads(row[0])) for row in rows]
+
+    def clear_pending(self, articles: Iterable[Article]) -> None:
+        fps = [(fingerprint(a.url),) for a in articles]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM pending WHERE fp = ?", fps)
+            self._pending.difference_update(fp for (fp,) in fps)
+
+    def get_meta(self, key: str, default: str | None = None) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_marks(self) -> dict[str, int]:
+        """소스 이름 → high-water mark."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT source, mark FROM marks").fetchall())
+
+    def set_marks(self, marks: dict[str, int | None], updated_at: float | None = None) -> None:
+        """mark를 기록. 기존 값보다 작은 값으로는 되돌리지 않는다."""
+        ts = int(updated_at if updated_at is not None else time.time())
+        rows = [(source, mark, ts) for source, mark in marks.items() if mark is not None]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO marks (source, mark, updated_at) VALUES (?, ?, ?)"
+                " ON CONFLICT (source) DO UPDATE SET mark = max(mark, excluded.mark), updated_at = excluded.updated_at",
+                rows,
+            )
+
+    def close(self) -> None:
+        """WAL을 본 파일에 합치고 닫는다 (아티팩트로 .db 파일 하나만 올리면 되도록)."""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
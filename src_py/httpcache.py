@@ -0,0 +1,173 @@
+"""조건부 요청(ETag / Last-Modified)용 디스크 HTTP 캐시.
+
+URL마다 검증자(ETag, Last-Modified), 응답 본문, 그리고 그 본문을 파싱한 Article
+목록을 저장한다. 다음 실행에서 서버가 304를 돌려주면 본문을 다시 받지 않고,
+파싱 결과가 남아 있으면 파싱도 건너뛴다. HTTP_CACHE_DAYS 동안 쓰이지 않은 항목은
+prune()으로 지운다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import requests
+
+from src.config import HTTP_CACHE_DAYS, HTTP_CACHE_DIR
+from src.fsutil import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    """캐시된 응답 하나."""
+
+    def __init__(self, cache: HttpCache, key: str, meta: dict) -> None:
+        self.cache = cache
+        self.key = key
+        self.meta = meta
+
+    @property
+    def url(self) -> str:
+        return self.meta.get("url", "")
+
+    def validators(self) -> dict[str, str]:
+        """다음 요청에 붙일 조건부 헤더."""
+        headers = {}
+        if self.meta.get("etag"):
+            headers["If-None-Match"] = self.meta["etag"]
+        if self.meta.get("last_modified"):
+            headers["If-Modified-Since"] = self.meta["last_modified"]
+        return headers
+
+    def body(self) -> bytes | None:
+        try:
+            with open(self.cache.body_path(self.key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def to_response(self, not_modified: requests.Response) -> requests.Response | None:
+        """304 응답을 캐시된 본문을 담은 200 응답으로 바꾼다."""
+        body = self.body()
+        if body is None:
+            return None
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = body
+        resp.url = not_modified.url
+        resp.request = not_modified.request
+        resp.headers.update(not_modified.headers)
+        resp.encoding = self.meta.get("encoding")
+        resp.from_cache = True
+        self.touch()
+        return resp
+
+    def touch(self) -> None:
+        """304로 다시 쓴 항목을 최근에 쓴 것으로 표시 (prune 기준)."""
+        try:
+            os.utime(self.cache.meta_path(self.key))
+        except OSError:
+            pass
+
+    def parsed(self, key: str) -> dict | None:
+        """같은 key(파서·mark)로 저장해 둔 파싱 결과 {"articles", "new_mark", "reached"}. 없으면 None."""
+        if self.meta.get("parser") != key:
+            return None
+        return self.meta.get("parsed")
+
+
+class HttpCache:
+    """URL을 sha256으로 해시한 파일 이름으로 저장하는 디스크 캐시."""
+
+    def __init__(self, directory: str, retention_days: int = HTTP_CACHE_DAYS) -> None:
+        self.directory = directory
+        self.retention = retention_days * 86400
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def meta_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def body_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.body")
+
+    def get(self, url: str) -> CacheEntry | None:
+        key = self.key_for(url)
+        try:
+            with open(self.meta_path(key), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return CacheEntry(self, key, meta)
+
+    def store(self, url: str, resp: requests.Response) -> None:
+        """검증자가 있는 응답만 저장. 이전 파싱 결과는 버린다."""
+        etag = resp.headers.get("ETag", "")
+        last_modified = resp.headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+
+        key = self.key_for(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": resp.encoding,
+        }
+        try:
+            with self._lock:
+                write_atomic(self.body_path(key), resp.content)
+                write_atomic(self.meta_path(key), json.dumps(meta, ensure_ascii=False))
+        except OSError as e:
+            logger.warning("HTTP 캐시 저장 실패: %s — %s", url, e)
+
+    def store_parsed(self, url: str, key: str, record: dict) -> None:
+        """본문을 파싱한 결과를 캐시 항목에 덧붙인다 (key 하나만 남긴다)."""
+        entry = self.get(url)
+        if entry is None:
+            return
+        entry.meta["parser"] = key
+        entry.meta["parsed"] = record
+        try:
+            with self._lock:
+                write_atomic(self.meta_path(entry.key), json.dumps(entry.meta, ensure_ascii=False))
+        except OSError as e:
+            logger.warning("HTTP 캐시 저장 실패: %s — %s", url, e)
+
+    def prune(self, now: float | None = None) -> int:
+        """보관 기간 동안 저장·재사용되지 않은 항목을 지운다. 지운 항목 수를 반환."""
+        cutoff = (time.time() if now is None else now) - self.retention
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        removed = 0
+        with self._lock:
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                key = name[: -len(".json")]
+                try:
+                    if os.path.getmtime(self.meta_path(key)) >= cutoff:
+                        continue
+                    os.remove(self.meta_path(key))
+                    if os.path.exists(self.body_path(key)):
+                        os.remove(self.body_path(key))
+                except OSError:
+                    continue
+                removed += 1
+        if removed:
+            logger.info("오래 쓰이지 않은 HTTP 캐시 항목 %d개 삭제", removed)
+        return removed
+
+
+# 모든 크롤러가 공유하는 기본 캐시 (HTTP_CACHE_DIR이 비어 있으면 비활성화)
+http_cache = HttpCache(HTTP_CACHE_DIR) if HTTP_CACHE_DIR else None
@@ -1,20 +1,42 @@
-"""Startup Policy Digest — 메인 진입점."""
+"""Startup Policy Digest — 메인 진입점.
+
+    python -m src.main                              # 등록된 모든 소스
+    python -m src.main --sources kstartup,naver     # 일부 소스만
+    python -m src.main --exclude naver --since 14   # 최근 14일 (YYYY-MM-DD도 가능)
+    python -m src.main --list                       # 소스와 메타데이터 목록
+
+시작 시간을 줄이기 위해 크롤러 모듈, 상세 페이지 보강, Slack 전송(slack_sdk)은
+실제로 쓰는 시점에 불러온다.
+"""
 
 from __future__ import annotations
 
+import argparse
 import logging
+import queue
 import sys
+import threading
+import time
+from collections.abc import Container, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 
-from src.crawlers import (
-    BizinfoCrawler,
-    KisedCrawler,
-    KStartupCrawler,
-    MSSCrawler,
-    NaverNewsCrawler,
+from src.archive import page_archive
+from src.config import (
+    CRAWL_DEADLINE,
+    CRAWL_WORKERS,
+    DAYS_LOOKBACK,
+    ENRICH_DETAILS,
+    METRICS_FILE,
+    METRICS_PROM_FILE,
+    PARSE_PROCESSES,
+    PIPELINE_QUEUE_SIZE,
 )
-from src.crawlers.base import Article
-from src.notifier import send_slack
-from src.processor import process
+from src.crawlers import registry
+from src.crawlers.base import Article, BaseCrawler, start_run, today_ordinal
+from src.history import HistoryStore
+from src.metrics import metrics
+from src.processor import Processor, load_history
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,53 +45,395 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-CRAWLERS = [
-    KStartupCrawler,
-    MSSCrawler,
-    KisedCrawler,
-    BizinfoCrawler,
-    NaverNewsCrawler,
-]
+# 기본 수집 대상 (레지스트리 key/소스 이름 또는 크롤러 클래스). None이면 등록된 전체
+CRAWLERS: list[str | type[BaseCrawler]] | None = None
 
 
-def collect_all() -> list[Article]:
-    """모든 크롤러를 실행하여 기사를 수집."""
-    all_articles: list[Article] = []
+def load_crawlers(entries: list[str | type[BaseCrawler]] | None = None) -> list[type[BaseCrawler]]:
+    """크롤러 클래스 목록. 이름으로 적힌 크롤러는 이때 모듈을 불러온다."""
+    entries = CRAWLERS if entries is None else entries
+    if entries is None:
+        entries = list(registry.REGISTRY)
+    return [registry.get(entry).load() if isinstance(entry, str) else entry for entry in entries]
+
+
+class _Deadlines:
+    """소스별 마감 시각. 큐가 차서 배치를 넣지 못하고 기다리는 동안은 시계를 멈춘다.
+
+    소비하는 쪽(처리·상세 페이지 보강)이 느려 막힌 시간까지 소스의 실행 시간으로
+    치면 정상인 소스가 취소되고 mark도 넘어가지 않는다.
+    """
+
+    def __init__(self, deadline: float) -> None:
+        self.deadline = deadline
+        self.started: dict[int, float] = {}
+        self.paused: dict[int, float] = {}
+
+    def start(self, idx: int) -> None:
+        self.started[idx] = time.monotonic()
+
+    def pause(self, idx: int) -> None:
+        self.paused[idx] = time.monotonic()
+
+    def resume(self, idx: int) -> None:
+        since = self.paused.get(idx)
+        if since is not None:
+            # 시작 시각을 먼저 미룬 뒤 멈춤을 푼다 (그 사이에 마감으로 보지 않도록)
+            self.started[idx] += time.monotonic() - since
+            del self.paused[idx]
+
+    def expiry(self, idx: int) -> float | None:
+        """마감 시각. 아직 시작 전이거나 큐를 기다리는 중이면 None."""
+        if idx in self.paused:
+            return None
+        started = self.started.get(idx)
+        return None if started is None else started + self.deadline
+
+
+def _pump(
+    crawler: BaseCrawler,
+    idx: int,
+    deadlines: _Deadlines,
+    events: queue.Queue,
+    stop: threading.Event,
+    cancelled: set[int],
+) -> None:
+    """워커 스레드에서 크롤러 하나를 실행하며 배치를 큐에 넣는다. 시작 시각을 기록해 마감 시간 계산에 쓴다."""
+    deadlines.start(idx)
+    try:
+        with metrics.span("crawl", source=crawler.name):
+            for batch in crawler.iter_batches():
+                if not _put(events, (idx, batch), stop, cancelled, deadlines):
+                    return
+    except Exception as e:
+        _put(events, (idx, e), stop, cancelled, deadlines)
+        return
+    _put(events, (idx, None), stop, cancelled, deadlines)
+
+
+def _put(
+    events: queue.Queue,
+    event: tuple,
+    stop: threading.Event,
+    cancelled: set[int],
+    deadlines: _Deadlines,
+) -> bool:
+    """큐에 자리가 날 때까지 (마감 시계를 멈추고) 기다렸다 넣는다. 파이프라인이 끝났거나 소스가 취소됐으면 False."""
+    idx = event[0]
+    if stop.is_set() or idx in cancelled:
+        return False
+    try:
+        events.put_nowait(event)
+        return True
+    except queue.Full:
+        deadlines.pause(idx)
+    try:
+        while not stop.is_set() and idx not in cancelled:
+            try:
+                events.put(event, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    finally:
+        deadlines.resume(idx)
+
+
+def stream(
+    crawlers: list[BaseCrawler],
+    max_workers: int = CRAWL_WORKERS,
+    deadline: float = CRAWL_DEADLINE,
+    maxsize: int = PIPELINE_QUEUE_SIZE,
+) -> Iterator[tuple[int, list[Article] | None]]:
+    """크롤러들을 병렬 실행하며 (crawlers 인덱스, 기사 배치)를 도착하는 대로 내보낸다.
 
-    for crawler_cls in CRAWLERS:
-        crawler = crawler_cls()
-        try:
-            articles = crawler.crawl()
-            all_articles.extend(articles)
-            logger.info("[%s] %d건 수집", crawler.name, len(articles))
-        except Exception:
-            logger.exception("[%s] 크롤링 중 오류 발생", crawler.name)
+    크롤러 스레드는 배치(목록 페이지)마다 크기 maxsize인 큐에 넣고, 큐가 차면 소비하는
+    쪽이 따라올 때까지 기다린다. 소스가 끝까지 성공하면 (인덱스, None)을 내보낸다.
+    실행 시간(큐를 기다린 시간은 빼고)이 deadline 초를 넘거나 오류가 난 소스는 그 뒤의
+    배치를 버리고 끝 표시도 내보내지 않는다.
+    """
+    deadlines = _Deadlines(deadline)
+    events: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+    cancelled: set[int] = set()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="crawler")
+    for idx, crawler in enumerate(crawlers):
+        executor.submit(_pump, crawler, idx, deadlines, events, stop, cancelled)
+
+    pending = set(range(len(crawlers)))
+    counts = dict.fromkeys(pending, 0)
+    try:
+        while pending:
+            now = time.monotonic()
+            expiries = {i: deadlines.expiry(i) for i in pending}
+            for idx in [i for i, at in expiries.items() if at is not None and now >= at]:
+                logger.error("[%s] %d초 내에 끝나지 않아 건너뜁니다.", crawlers[idx].name, deadline)
+                metrics.incr("crawl_timeouts", source=crawlers[idx].name)
+                cancelled.add(idx)
+                pending.discard(idx)
+
+            if not pending:
+                break
+
+            # 가장 먼저 마감되는 실행 중 소스까지만 대기 (실행 중인 소스가 없으면 deadline만큼)
+            running = [at for i, at in expiries.items() if at is not None and i in pending]
+            timeout = max(0.0, min(running) - now) if running else deadline
+            try:
+                idx, item = events.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            if idx not in pending:
+                continue  # 이미 건너뛴 소스의 늦은 배치
+
+            name = crawlers[idx].name
+            if isinstance(item, Exception):
+                logger.error("[%s] 크롤링 중 오류 발생", name, exc_info=item)
+                metrics.incr("crawl_errors", source=name)
+                pending.discard(idx)
+            elif item is None:
+                pending.discard(idx)
+                logger.info("[%s] %d건 수집", name, counts[idx])
+                metrics.incr("articles_collected", counts[idx], source=name)
+                yield idx, None
+            else:
+                counts[idx] += len(item)
+                yield idx, item
+    finally:
+        # 멈춘 소스를 기다리지 않는다 (요청 타임아웃이 지나면 스레드는 스스로 끝남)
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def collect(
+    crawlers: list[BaseCrawler],
+    max_workers: int = CRAWL_WORKERS,
+    deadline: float = CRAWL_DEADLINE,
+) -> dict[int, list[Article]]:
+    """크롤러들을 병렬 실행하여 끝난 크롤러의 결과를 {crawlers 인덱스: 기사 목록}으로 반환.
+
+    각 소스는 자신의 워커에서 실행되고, 시작 후 deadline 초 안에 끝나지 않거나
+    오류가 나면 (그때까지 받은 배치까지) 결과에서 빠진다.
+    """
+    results: dict[int, list[Article]] = {}
+    partial: dict[int, list[Article]] = {}
+    for idx, batch in stream(crawlers, max_workers, deadline):
+        if batch is None:
+            results[idx] = partial.pop(idx, [])
+        else:
+            partial.setdefault(idx, []).extend(batch)
+    return results
+
+
+def _make_crawlers(
+    history: Container[str] | None,
+    marks: dict[str, int] | None,
+    sources: list[str | type[BaseCrawler]] | None,
+    lookback_days: int,
+) -> list[BaseCrawler]:
+    return [
+        crawler_cls(
+            history=history,
+            lookback_days=lookback_days,
+            mark=marks.get(crawler_cls.name) if marks is not None else None,
+        )
+        for crawler_cls in load_crawlers(sources)
+    ]
+
+
+def _update_marks(marks: dict[str, int] | None, crawler: BaseCrawler) -> None:
+    if marks is not None and crawler.committed_mark is not None:
+        marks[crawler.name] = crawler.committed_mark
+
+
+def collect_all(
+    history: Container[str] | None = None,
+    max_workers: int = CRAWL_WORKERS,
+    deadline: float = CRAWL_DEADLINE,
+    marks: dict[str, int] | None = None,
+    sources: list[str | type[BaseCrawler]] | None = None,
+    lookback_days: int = DAYS_LOOKBACK,
+) -> list[Article]:
+    """모든 크롤러를 병렬 실행하여 기사를 수집.
+
+    시작 후 deadline 초 안에 끝나지 않은 소스는 결과를 버리고 나머지 소스만
+    사용한다. 결과는 CRAWLERS 순서대로 합친다. history를 넘기면 목록 크롤러가
+    이미 전송한 구간에서 페이지 넘기기를 멈춘다.
+
+    marks(소스 이름 → high-water mark)를 넘기면 각 크롤러가 그 이하 구간을 건너뛰고,
+    끝난 소스의 새 mark로 marks를 갱신한다. sources로 실행할 소스를 고를 수 있다.
+    """
+    crawlers = _make_crawlers(history, marks, sources, lookback_days)
+    results = collect(crawlers, max_workers, deadline)
+    for idx in results:
+        _update_marks(marks, crawlers[idx])
+
+    all_articles: list[Article] = []
+    for idx in sorted(results):
+        all_articles.extend(results[idx])
 
     logger.info("전체 수집 완료: 총 %d건", len(all_articles))
     return all_articles
 
 
-def main() -> int:
+def stream_all(
+    history: Container[str] | None = None,
+    max_workers: int = CRAWL_WORKERS,
+    deadline: float = CRAWL_DEADLINE,
+    marks: dict[str, int] | None = None,
+    sources: list[str | type[BaseCrawler]] | None = None,
+    lookback_days: int = DAYS_LOOKBACK,
+) -> Iterator[list[Article]]:
+    """collect_all의 스트리밍 버전. 모든 소스의 기사 배치를 도착하는 대로 내보낸다.
+
+    소스 순서가 아니라 도착 순서이고, 시간 초과나 오류로 멈춘 소스도 이미 내보낸
+    배치는 되돌리지 않는다. marks는 끝까지 마친 소스만 갱신한다.
+    """
+    crawlers = _make_crawlers(history, marks, sources, lookback_days)
+    total = 0
+    for idx, batch in stream(crawlers, max_workers, deadline):
+        if batch is None:
+            _update_marks(marks, crawlers[idx])
+            continue
+        total += len(batch)
+        yield batch
+    logger.info("전체 수집 완료: 총 %d건", total)
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _lookback(value: str) -> int:
+    """--since: 일수(N) 또는 날짜(YYYY-MM-DD)를 조회 기간(일)으로. 그 날짜도 포함한다."""
+    if value.isdigit():
+        return int(value)
+    try:
+        since = date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"일수 또는 YYYY-MM-DD 형식이어야 합니다: {value!r}") from None
+    days = today_ordinal() - since.toordinal() + 1
+    if days < 1:
+        raise argparse.ArgumentTypeError(f"미래 날짜입니다: {value}")
+    return days
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="스타트업 지원사업·정책 소식 수집 후 Slack 전송")
+    parser.add_argument("--sources", type=_csv, metavar="SOURCE,...", help="실행할 소스 (쉼표 구분, key 또는 소스 이름). 기본: 전체")
+    parser.add_argument("--exclude", type=_csv, default=[], metavar="SOURCE,...", help="제외할 소스 (쉼표 구분)")
+    parser.add_argument(
+        "--since",
+        type=_lookback,
+        dest="lookback_days",
+        metavar="DATE|DAYS",
+        help=f"이 날짜(YYYY-MM-DD) 또는 N일 전부터 수집 (기본: {DAYS_LOOKBACK}일). 지정하면 high-water mark를 무시",
+    )
+    parser.add_argument("--list", action="store_true", help="등록된 소스와 메타데이터를 출력하고 끝낸다")
+    args = parser.parse_args(argv)
+    try:
+        args.specs = registry.select(args.sources, args.exclude)
+    except KeyError as e:
+        parser.error(f"알 수 없는 소스: {e.args[0]} (사용 가능: {', '.join(registry.REGISTRY)})")
+    if not args.specs and not args.list:
+        parser.error("실행할 소스가 없습니다.")
+    return args
+
+
+def _print_sources(specs: list[registry.CrawlerSpec]) -> None:
+    print(f"{'key':<10} {'host':<20} {'interval':>8} {'cost':>4}  종류  이름")
+    for spec in specs:
+        kind = "뉴스" if spec.news else "공고"
+        print(f"{spec.key:<10} {spec.host:<20} {spec.interval / 3600:>7.0f}h {spec.cost:>4}  {kind}  {spec.name}")
+
+
+def main(argv: list[str] | None = None) -> int:
     """메인 실행 함수."""
+    start_run()
+    args = parse_args(argv)
+    if args.list:
+        _print_sources(args.specs)
+        return 0
+
     logger.info("=== Startup Policy Digest 시작 ===")
+    metrics.reset()
+    # 전체 실행이면 CRAWLERS(기본 None = 등록된 전체)를 그대로 쓴다
+    sources = None if args.sources is None and not args.exclude else [spec.key for spec in args.specs]
+
+    history = load_history()
+    try:
+        with metrics.span("run"):
+            return _run(history, sources, args.lookback_days)
+    finally:
+        history.close()
+        if PARSE_PROCESSES > 0:
+            from src.crawlers import parsepool
+
+            parsepool.shutdown()
+        prune_storage()
+        logger.info("단계별 소요 시간: %s", metrics.summary())
+        metrics.write(METRICS_FILE, METRICS_PROM_FILE)
+
+
+def prune_storage() -> None:
+    """보관 기간이 지난 원본 페이지와 오래 쓰이지 않은 캐시 항목(HTTP 캐시, 상세 페이지)을 지운다."""
+    from src.enrich import detail_cache
+    from src.httpcache import http_cache
 
-    # 1. 수집
-    articles = collect_all()
-    if not articles:
+    for store in (page_archive, http_cache, detail_cache):
+        if store is not None:
+            store.prune()
+
+
+def _run(
+    history: HistoryStore,
+    sources: list[str | type[BaseCrawler]] | None = None,
+    lookback_days: int | None = None,
+) -> int:
+    """수집 → (보강) → 처리 → 전송. lookback_days를 지정하면 mark 없이 그 기간을 다시 본다.
+
+    수집·보강·처리는 배치(목록 페이지) 단위로 겹쳐 돈다. 크롤러 스레드가 다음 페이지를
+    받는 동안 이 스레드는 앞서 받은 페이지를 처리하고, 걸러진 기사는 바로 버린다.
+    정렬과 메시지 작성은 전체 결과가 필요하므로 수집이 끝난 뒤에 한다.
+    """
+    # 1. 수집 (소스별 high-water mark 이후만)
+    marks = history.get_marks() if lookback_days is None else None
+    lookback_days = DAYS_LOOKBACK if lookback_days is None else lookback_days
+    classes = load_crawlers(sources)
+    # 소스 간 중복은 도착 순서가 아니라 수집 대상 순서로 남길 항목을 정한다
+    processor = Processor(history, lookback_days, [cls.name for cls in classes])
+
+    # 2. 새 항목만 상세 페이지로 보강 (선택)
+    detail_crawlers = None
+    if ENRICH_DETAILS:
+        from src.enrich import enrich
+
+        detail_crawlers = {cls.name: cls(history=history) for cls in classes}
+
+    # 3. 처리 (필터링, 중복 제거, 분류)를 배치가 도착하는 대로
+    for batch in stream_all(history, marks=marks, sources=sources, lookback_days=lookback_days):
+        if detail_crawlers is not None:
+            enrich(batch, detail_crawlers, history)
+        processor.feed(batch)
+
+    if not processor.received:
         logger.warning("수집된 기사가 없습니다.")
-        # 수집 실패해도 에러로 처리하지 않음
-        return 0
+        # 수집 실패해도 에러로 처리하지 않음 (지난 실행에서 멈춘 전송은 이어서 보낸다)
+        return _resume_slack()
 
-    # 2. 처리 (필터링, 중복 제거, 분류)
-    categorized = process(articles)
+    # 처리한 항목은 전송 이력에 기록되므로 mark도 함께 넘긴다
+    categorized = processor.finish()
+    if marks is not None:
+        history.set_marks(marks)
     if not categorized:
         logger.info("전송할 새로운 소식이 없습니다.")
-        return 0
+        return _resume_slack()
 
     total = sum(len(v) for v in categorized.values())
     logger.info("신규 소식 %d건 발견", total)
 
-    # 3. Slack 전송
+    # 4. Slack 전송
+    from src.notifier import send_slack
+
     success = send_slack(categorized)
     if not success:
         logger.error("Slack 전송 실패!")
@@ -79,5 +443,15 @@ def main() -> int:
     return 0
 
 
+def _resume_slack() -> int:
+    """보낼 새 소식이 없는 실행에서도 지난 실행에서 멈춘 Slack 전송은 마저 보낸다."""
+    from src.notifier import resume_slack
+
+    if not resume_slack():
+        logger.error("Slack 전송 실패!")
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,183 @@
+"""실행 지표: 단계별 소요 시간(span)과 카운터.
+
+    with metrics.span("fetch", source="K-Startup"):
+        resp = ...
+    metrics.incr("bytes_downloaded", len(resp.content), source="K-Startup")
+
+span은 이름과 라벨별로 횟수, 누적 시간, 최대 시간을 모은다. 실행이 끝나면
+write()가 JSON 실행 보고서와 Prometheus textfile collector 형식 파일을 쓴다.
+여러 스레드에서 동시에 기록해도 된다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from src.fsutil import write_atomic
+
+logger = logging.getLogger(__name__)
+
+PROM_PREFIX = "startup_digest"
+
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _key(name: str, labels: dict[str, object]) -> _Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _prom_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+class Metrics:
+    """한 번의 실행 동안 모은 span과 카운터."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = time.time()
+            self._started = time.perf_counter()
+            self._spans: dict[_Key, list[float]] = {}  # [횟수, 누적 초, 최대 초]
+            self._counters: dict[_Key, float] = {}
+
+    @contextmanager
+    def span(self, name: str, **labels) -> Iterator[None]:
+        """with 블록의 소요 시간을 기록 (예외가 나도 기록)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            stat = self._spans.get(key)
+            if stat is None:
+                self._spans[key] = [1, seconds, seconds]
+            else:
+                stat[0] += 1
+                stat[1] += seconds
+                stat[2] = max(stat[2], seconds)
+
+    def incr(self, name: str, value: float = 1, **labels) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def drain(self) -> tuple[dict, dict]:
+        """지금까지 모은 (span, 카운터)를 꺼내고 비운다. 다른 프로세스에서 모은 값을 merge로 넘길 때 쓴다."""
+        with self._lock:
+            spans, counters = self._spans, self._counters
+            self._spans, self._counters = {}, {}
+            return spans, counters
+
+    def merge(self, spans: dict, counters: dict) -> None:
+        """drain()으로 꺼낸 값을 더한다."""
+        with self._lock:
+            for key, (count, total, peak) in spans.items():
+                stat = self._spans.get(key)
+                if stat is None:
+                    self._spans[key] = [count, total, peak]
+                else:
+                    stat[0] += count
+                    stat[1] += total
+                    stat[2] = max(stat[2], peak)
+            for key, value in counters.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def span_total(self, name: str, **labels) -> float:
+        """라벨이 일치하는 span의 누적 시간 (라벨을 생략하면 전체 합)."""
+        wanted = {k: str(v) for k, v in labels.items()}
+        with self._lock:
+            return sum(
+                stat[1]
+                for (span, span_labels), stat in self._spans.items()
+                if span == name and wanted.items() <= dict(span_labels).items()
+            )
+
+    def report(self) -> dict:
+        """JSON 실행 보고서."""
+        with self._lock:
+            spans = [
+                {"name": name, "labels": dict(labels), "count": int(c), "seconds": round(t, 6), "max": round(m, 6)}
+                for (name, labels), (c, t, m) in sorted(self._spans.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            return {
+                "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+                "duration": round(time.perf_counter() - self._started, 6),
+                "spans": spans,
+                "counters": counters,
+            }
+
+    def prometheus(self) -> str:
+        """Prometheus textfile collector 형식."""
+        report = self.report()
+        lines = [
+            f"# TYPE {PROM_PREFIX}_last_run_timestamp_seconds gauge",
+            f"{PROM_PREFIX}_last_run_timestamp_seconds {self.started_at:.0f}",
+            f"# TYPE {PROM_PREFIX}_run_duration_seconds gauge",
+            f"{PROM_PREFIX}_run_duration_seconds {report['duration']}",
+        ]
+
+        span_lines: dict[str, list[str]] = {"span_seconds": [], "span_count": [], "span_max_seconds": []}
+        for s in report["spans"]:
+            labels = _prom_labels(_key("", {"span": s["name"], **s["labels"]})[1])
+            span_lines["span_seconds"].append(f"{PROM_PREFIX}_span_seconds{labels} {s['seconds']}")
+            span_lines["span_count"].append(f"{PROM_PREFIX}_span_count{labels} {s['count']}")
+            span_lines["span_max_seconds"].append(f"{PROM_PREFIX}_span_max_seconds{labels} {s['max']}")
+
+        counter_lines: dict[str, list[str]] = {}
+        for c in report["counters"]:
+            labels = _prom_labels(_key("", c["labels"])[1])
+            counter_lines.setdefault(c["name"], []).append(f"{PROM_PREFIX}_{c['name']}{labels} {c['value']}")
+
+        # 한 번의 실행 결과이므로 모두 gauge로 내보낸다
+        for name, samples in (*span_lines.items(), *counter_lines.items()):
+            if samples:
+                lines.append(f"# TYPE {PROM_PREFIX}_{name} gauge")
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path: str = "", prom_path: str = "") -> None:
+        """보고서를 파일로 쓴다. 경로가 빈 값이면 건너뛴다."""
+        try:
+            if json_path:
+                write_atomic(json_path, json.dumps(self.report(), ensure_ascii=False, indent=2))
+            if prom_path:
+                write_atomic(prom_path, self.prometheus())
+        except OSError as e:
+            logger.warning("실행 지표 저장 실패: %s", e)
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약: 단계별 누적 시간."""
+        totals: dict[str, float] = {}
+        with self._lock:
+            for (name, _), (_, seconds, _) in self._spans.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        return ", ".join(f"{name} {seconds:.2f}s" for name, seconds in sorted(totals.items(), key=lambda x: -x[1]))
+
+
+# 실행 전체가 공유하는 지표
+metrics = Metrics()
@@ -0,0 +1,122 @@
+"""제목 기반 근사 중복 탐지 (MinHash + LSH).
+
+같은 보도자료를 다시 쓴 뉴스 기사나 여러 사이트에 조금씩 다른 제목으로 올라온
+같은 사업 공고를 묶는다.
+
+- 제목 정규화: NFKC, 소문자, 말머리([속보] 등)·문장부호·공백 제거
+  (한국어는 띄어쓰기가 제각각이라 공백을 모두 지운 뒤 음절 3-gram을 쓴다)
+- MinHash 서명: 3-gram 집합의 자카드 유사도를 NUM_PERM개의 최솟값으로 근사
+- LSH: 서명을 BANDS개 밴드로 나눠 같은 밴드 값을 가진 항목만 후보로 비교
+  → 항목 수에 대해 거의 선형 시간
+
+"1차 모집"과 "2차 모집"처럼 숫자만 다른 제목은 서로 다른 공고이므로,
+제목에 들어 있는 숫자가 다르면 유사도와 무관하게 중복으로 보지 않는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import unicodedata
+from array import array
+from collections import defaultdict
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE = 3
+
+_PRIME = (1 << 31) - 1
+_rng = random.Random(0x5EED)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_TAG = re.compile(r"^\s*(?:[\[【(<〈「][^\]】)>〉」]{1,10}[\]】)>〉」]\s*)+")
+_NON_WORD = re.compile(r"[\W_]+")
+_NUMBER = re.compile(r"\d+")
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목: 말머리, 문장부호, 공백을 지운 소문자 문자열."""
+    text = unicodedata.normalize("NFKC", title).lower()
+    text = _TAG.sub("", text)
+    return _NON_WORD.sub("", text)
+
+
+def shingles(text: str) -> set[str]:
+    if len(text) <= SHINGLE:
+        return {text} if text else set()
+    return {text[i : i + SHINGLE] for i in range(len(text) - SHINGLE + 1)}
+
+
+def _hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big") % _PRIME
+
+
+def signature(title: str) -> array:
+    """제목의 MinHash 서명 (NUM_PERM개의 32비트 정수)."""
+    hashes = [_hash(s) for s in shingles(normalize_title(title))]
+    if not hashes:
+        return array("I", [_PRIME] * NUM_PERM)
+    return array("I", (min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS))
+
+
+def similarity(a: array, b: array) -> float:
+    """두 서명으로 추정한 자카드 유사도."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+def numbers(title: str) -> frozenset[str]:
+    return frozenset(n.lstrip("0") or "0" for n in _NUMBER.findall(unicodedata.normalize("NFKC", title)))
+
+
+class LSHIndex:
+    """MinHash 서명의 LSH 색인. 키는 호출자가 정한다."""
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self._buckets: dict[tuple, list] = defaultdict(list)
+        self._entries: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _bands(sig: array):
+        for band in range(BANDS):
+            yield (band, *sig[band * ROWS : (band + 1) * ROWS])
+
+    def insert(self, key, sig: array, nums: frozenset[str] = frozenset()) -> None:
+        if key in self._entries:
+            return
+        self._entries[key] = (sig, nums)
+        for band in self._bands(sig):
+            self._buckets[band].append(key)
+
+    def remove(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band in self._bands(entry[0]):
+            bucket = self._buckets.get(band)
+            if bucket is not None and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band]
+
+    def query(self, sig: array, nums: frozenset[str] = frozenset()):
+        """threshold 이상 유사하고 숫자가 같은 항목 중 가장 비슷한 것의 키. 없으면 None."""
+        best, best_score = None, self.threshold
+        checked = set()
+        for band in self._bands(sig):
+            for key in self._buckets.get(band, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                other, other_nums = self._entries[key]
+                if other_nums != nums:
+                    continue
+                score = similarity(sig, other)
+                if score >= best_score:
+                    best, best_score = key, score
+        return best
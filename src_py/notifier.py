@@ -3,30 +3,63 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import os
+import re
+import threading
+from datetime import date
 
 import requests
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
-from src.config import SLACK_BOT_TOKEN, SLACK_CHANNEL_ID, SLACK_WEBHOOK_URL
-from src.crawlers.base import Article
-from src.processor import CAT_NEWS, CAT_NEW, CAT_URGENT, LIMITS
+from src.config import (
+    SLACK_BOT_TOKEN,
+    SLACK_CHANNEL_ID,
+    SLACK_CHUNK_CHARS,
+    SLACK_DESTINATIONS,
+    SLACK_STATE_FILE,
+    SLACK_WEBHOOK_URL,
+)
+from src import transport
+from src.crawlers.base import Article, today_ordinal
+from src.delivery import SlackDelivery
+from src.fanout import Destination, fan_out, parse_destinations
+from src.metrics import metrics
+from src.processor import CAT_NEWS, CAT_NEW, CAT_URGENT, LIMITS, top
 
 logger = logging.getLogger(__name__)
 
 # 메인 메시지 카테고리 순서
 CATEGORY_ORDER = [CAT_URGENT, CAT_NEW, CAT_NEWS]
 
+# Block Kit 제한: 메시지당 블록 50개, section 텍스트 3000자
+MAX_BLOCKS = 50
+SECTION_CHARS = 3000
 
-def _format_article(a: Article) -> str:
-    """기사 한 줄 포맷팅."""
-    parts = [f"• <{a.url}|{a.title}>"]
+THREAD_HEADER = "📎 *전체 목록* ({}건)"
+THREAD_FOOTER = "_자동 수집 by Startup Policy Digest_"
+
+# Webhook 전송용 세션 (크롤러와 같은 연결 풀을 쓴다)
+http = transport.session(user_agent=None)
+
+# 토큰별 WebClient (실행이 이어지는 데몬 모드에서도 다시 만들지 않는다)
+_clients: dict[str, WebClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _format_article(a: Article, max_chars: int | None = None) -> str:
+    """기사 한 줄 포맷팅.
+
+    max_chars를 주면 제목을 줄여 그 길이에 맞춘다. 링크 `<url|title>`는 닫는 `>`까지 남긴다.
+    """
     info = [a.source]
+    if a.extra.get("agency"):
+        info.append(a.extra["agency"])
 
-    if a.category == CAT_URGENT and a.d_day is not None:
+    d_day = a.d_day
+    if a.category == CAT_URGENT and d_day is not None:
         dl = a.deadline.replace("-", ".")
-        info.append(f"마감 {dl[5:]} (D-{a.d_day})")
+        info.append(f"마감 {dl[5:]} (D-{d_day})")
     elif a.deadline:
         dl = a.deadline.replace("-", ".")
         info.append(f"마감 {dl[5:]}")
@@ -36,13 +69,27 @@ def _format_article(a: Article) -> str:
         if a.date:
             info.append(a.date[5:].replace("-", "."))
 
-    parts.append(f"  └ {' | '.join(info)}")
-    return "\n".join(parts)
+    duplicates = a.extra.get("duplicates")
+    if duplicates:
+        info.append(f"유사 소식 {duplicates}건")
+
+    detail = f"  └ {' | '.join(info)}"
+    title = a.title
+    if max_chars is not None:
+        room = max_chars - len(f"• <{a.url}|>\n{detail}")
+        if len(title) > room:
+            title = title[: max(room - 1, 0)] + "…"
+    return f"• <{a.url}|{title}>\n{detail}"
 
 
 def _build_main_message(categorized: dict[str, list[Article]]) -> str:
     """메인 메시지: 카테고리별 제한된 건수만 표시."""
-    today = datetime.now().strftime("%Y.%m.%d")
+    with metrics.span("build_message", kind="main"):
+        return _main_message(categorized)
+
+
+def _main_message(categorized: dict[str, list[Article]]) -> str:
+    today = date.fromordinal(today_ordinal()).strftime("%Y.%m.%d")
     shown_total = 0
     full_total = sum(len(v) for v in categorized.values())
 
@@ -56,8 +103,7 @@ def _build_main_message(categorized: dict[str, list[Article]]) -> str:
         if not articles:
             continue
 
-        limit = LIMITS.get(category)
-        display = articles if limit is None else articles[:limit]
+        display = top(articles, LIMITS.get(category))
         overflow = len(articles) - len(display)
         shown_total += len(display)
 
@@ -74,102 +120,189 @@ def _build_main_message(categorized: dict[str, list[Article]]) -> str:
     return "\n".join(lines)
 
 
-def _build_thread_message(categorized: dict[str, list[Article]]) -> str:
-    """스레드 메시지: 전체 목록."""
-    total = sum(len(v) for v in categorized.values())
-    lines = [
-        f"📎 *전체 목록* ({total}건)",
-        "",
-    ]
-
-    for category in CATEGORY_ORDER:
-        articles = categorized.get(category, [])
-        if not articles:
-            continue
-
-        lines.append(f"*{category}* ({len(articles)}건)")
-        for a in articles:
-            lines.append(_format_article(a))
-        lines.append("")
-
-    lines.append("_자동 수집 by Startup Policy Digest_")
-    return "\n".join(lines)
-
+def _build_thread_chunks(
+    categorized: dict[str, list[Article]],
+    max_chars: int = SLACK_CHUNK_CHARS,
+) -> list[dict]:
+    """스레드 전체 목록을 Block Kit 메시지 여러 개로 나눈다.
 
-def _send_via_bot(categorized: dict[str, list[Article]]) -> bool:
-    """Slack Bot Token으로 메인 메시지 + 스레드 답글 전송."""
-    client = WebClient(token=SLACK_BOT_TOKEN)
+    카테고리마다 section을 새로 시작하고, section은 SECTION_CHARS, 메시지는
+    MAX_BLOCKS개와 max_chars자를 넘지 않게 자른다. 이어지는 카테고리에는
+    "(계속)"을 붙인다. 반환값은 chat.postMessage의 text/blocks 인자.
+    """
+    with metrics.span("build_message", kind="thread"):
+        total = sum(len(v) for v in categorized.values())
+        sections = [THREAD_HEADER.format(total)]
+        for category in CATEGORY_ORDER:
+            articles = categorized.get(category, [])
+            if not articles:
+                continue
+
+            section = f"*{category}* ({len(articles)}건)"
+            for a in articles:
+                line = _format_article(a, SECTION_CHARS // 2)
+                if len(section) + 1 + len(line) > SECTION_CHARS:
+                    sections.append(section)
+                    section = f"*{category}* (계속)"
+                section += "\n" + line
+            sections.append(section)
+
+        chunks: list[list[str]] = [[]]
+        size = 0
+        for section in sections:
+            if chunks[-1] and (len(chunks[-1]) >= MAX_BLOCKS - 1 or size + len(section) > max_chars):
+                chunks.append([])
+                size = 0
+            chunks[-1].append(section)
+            size += len(section)
+
+        messages = []
+        for i, texts in enumerate(chunks):
+            blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": t}} for t in texts]
+            if i == len(chunks) - 1:
+                blocks.append({"type": "context", "elements": [{"type": "mrkdwn", "text": THREAD_FOOTER}]})
+                texts = [*texts, THREAD_FOOTER]
+            messages.append({"text": "\n\n".join(texts), "blocks": blocks})
+        return messages
+
+
+def _destinations() -> list[Destination]:
+    """전송 대상 목록. SLACK_DESTINATIONS가 없으면 기존 단일 설정을 대상 하나로 쓴다."""
+    if SLACK_DESTINATIONS:
+        return parse_destinations(SLACK_DESTINATIONS)
+    if (SLACK_BOT_TOKEN and SLACK_CHANNEL_ID) or SLACK_WEBHOOK_URL:
+        return [Destination("default", SLACK_BOT_TOKEN, SLACK_CHANNEL_ID, SLACK_WEBHOOK_URL)]
+    return []
+
+
+def _state_file(dest: Destination) -> str:
+    """대상별 전송 상태 파일 (기본 대상은 SLACK_STATE_FILE 그대로)."""
+    if dest.name == "default" or not SLACK_STATE_FILE:
+        return SLACK_STATE_FILE
+    root, ext = os.path.splitext(SLACK_STATE_FILE)
+    slug = re.sub(r"[^\w-]", "_", dest.name)
+    return f"{root}.{slug}{ext}"
+
+
+def _client(token: str) -> WebClient:
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = _clients[token] = WebClient(token=token)
+        return client
+
+
+def _render(categorized: dict[str, list[Article]]) -> list[dict]:
+    """메인 메시지 + 스레드 메시지들."""
+    return [{"text": _build_main_message(categorized)}, *_build_thread_chunks(categorized)]
+
+
+def _send_via_bot(dest: Destination, client: WebClient, messages: list[dict]) -> bool:
+    """Slack Bot Token으로 메인 메시지 + 스레드 답글(여러 개로 나눠) 전송."""
+    delivery = SlackDelivery(client, dest.channel, _state_file(dest))
 
     try:
-        # 봇이 채널에 참여하지 않은 경우 자동 참여 시도
-        try:
-            client.conversations_join(channel=SLACK_CHANNEL_ID)
-        except SlackApiError:
-            pass  # 이미 참여중이거나 권한 없으면 무시
-
-        # 메인 메시지
-        main_text = _build_main_message(categorized)
-        result = client.chat_postMessage(
-            channel=SLACK_CHANNEL_ID,
-            text=main_text,
-            unfurl_links=False,
-            unfurl_media=False,
-        )
-        thread_ts = result["ts"]
-
-        # 스레드 답글 (전체 목록)
-        thread_text = _build_thread_message(categorized)
-        client.chat_postMessage(
-            channel=SLACK_CHANNEL_ID,
-            text=thread_text,
-            thread_ts=thread_ts,
-            unfurl_links=False,
-            unfurl_media=False,
-        )
+        # 봇이 채널에 참여하지 않은 경우 자동 참여 시도 (참여한 채널은 기록해 두고 건너뜀)
+        delivery.ensure_joined()
 
-        logger.info("Slack 전송 성공! (메인 + 스레드)")
+        if not delivery.deliver(messages):
+            return False
+
+        logger.info("[%s] Slack 전송 성공! (메인 + 스레드 %d개)", dest.name, len(messages) - 1)
         return True
     except SlackApiError as e:
-        logger.error("Slack API 오류: %s (needed: %s)", e.response["error"], e.response.get("needed", "unknown"))
-        logger.error("Slack API 응답: %s", e.response.data)
+        logger.error(
+            "[%s] Slack API 오류: %s (needed: %s)", dest.name, e.response["error"], e.response.get("needed", "unknown")
+        )
+        logger.error("[%s] Slack API 응답: %s", dest.name, e.response.data)
         # Bot Token 실패 시 Webhook 폴백
-        if SLACK_WEBHOOK_URL:
-            logger.info("Webhook으로 폴백합니다.")
-            return _send_via_webhook(categorized)
+        if dest.webhook:
+            logger.info("[%s] Webhook으로 폴백합니다.", dest.name)
+            # 앞선 작업이 실패해 이번 작업이 기록에 남아 있을 수 있다 — 다음 실행에서 봇으로 또 보내지 않게
+            delivery.discard(messages)
+            return _send_via_webhook(dest, messages[0]["text"])
         return False
 
 
-def _send_via_webhook(categorized: dict[str, list[Article]]) -> bool:
+def _send_via_webhook(dest: Destination, main_text: str) -> bool:
     """Webhook 폴백: 메인 메시지만 전송 (스레드 불가)."""
-    main_text = _build_main_message(categorized)
     payload = {"text": main_text, "unfurl_links": False, "unfurl_media": False}
 
     try:
-        resp = requests.post(SLACK_WEBHOOK_URL, json=payload, timeout=10)
+        with metrics.span("slack_api", method="webhook"):
+            resp = http.post(dest.webhook, json=payload, timeout=transport.timeout_for(dest.webhook))
         resp.raise_for_status()
-        logger.info("Slack 전송 성공! (Webhook, 스레드 미지원)")
+        logger.info("[%s] Slack 전송 성공! (Webhook, 스레드 미지원)", dest.name)
         return True
     except requests.RequestException as e:
-        logger.error("Slack Webhook 전송 실패: %s", e)
+        logger.error("[%s] Slack Webhook 전송 실패: %s", dest.name, e)
         return False
 
 
-def send_slack(categorized: dict[str, list[Article]]) -> bool:
-    """Slack으로 다이제스트를 전송한다.
+def send_slack(categorized: dict[str, list[Article]], destinations: list[Destination] | None = None) -> bool:
+    """Slack으로 다이제스트를 전송한다. 모든 대상에 보냈으면 True.
 
-    Bot Token이 있으면 메인+스레드, 없으면 Webhook으로 메인만 전송.
+    대상마다 Bot Token이 있으면 메인+스레드, 없으면 Webhook으로 메인만 전송.
+    같은 카테고리 구성의 메시지는 한 번만 만들고, 같은 토큰의 대상은 WebClient를
+    함께 쓴다. 대상들에는 동시에 보낸다 (src.fanout).
     """
     if not categorized:
         logger.info("전송할 새로운 소식이 없습니다.")
         return True
 
-    # Bot Token 우선
-    if SLACK_BOT_TOKEN and SLACK_CHANNEL_ID:
-        return _send_via_bot(categorized)
+    destinations = _destinations() if destinations is None else destinations
+    if not destinations:
+        logger.error("Slack 전송 수단이 설정되지 않았습니다. (BOT_TOKEN 또는 WEBHOOK_URL 필요)")
+        return False
 
-    # Webhook 폴백
-    if SLACK_WEBHOOK_URL:
-        return _send_via_webhook(categorized)
+    # 대상별 메시지는 전송 전에 한 번씩만 만든다
+    payloads: dict[tuple[str, ...], list[dict] | None] = {}
+    for dest in destinations:
+        if dest.categories not in payloads:
+            selected = {c: v for c, v in categorized.items() if not dest.categories or c in dest.categories}
+            payloads[dest.categories] = _render(selected) if selected else None
+
+    def send(dest: Destination) -> bool:
+        messages = payloads[dest.categories]
+        if messages is None:
+            logger.info("[%s] 보낼 카테고리의 새 소식이 없습니다.", dest.name)
+            return True
+        if dest.uses_bot:
+            return _send_via_bot(dest, _client(dest.token), messages)
+        return _send_via_webhook(dest, messages[0]["text"])
+
+    results = fan_out(destinations, send)
+    failed = [name for name, ok in results.items() if not ok]
+    if failed:
+        logger.error("Slack 전송 실패 대상: %s (%d/%d)", ", ".join(failed), len(failed), len(results))
+    return not failed
+
+
+def resume_slack(destinations: list[Destination] | None = None) -> bool:
+    """지난 실행에서 멈춘 스레드 전송을 이어서 보낸다 (새 소식이 없는 실행에서도).
+
+    남은 작업이 없거나 모두 보냈으면 True.
+    """
+    destinations = _destinations() if destinations is None else destinations
+    deliveries = {}
+    for dest in destinations:
+        if dest.uses_bot:
+            delivery = SlackDelivery(_client(dest.token), dest.channel, _state_file(dest))
+            if delivery.pending:
+                deliveries[dest.name] = delivery
+    if not deliveries:
+        return True
 
-    logger.error("Slack 전송 수단이 설정되지 않았습니다. (BOT_TOKEN 또는 WEBHOOK_URL 필요)")
-    return False
+    def resume(dest: Destination) -> bool:
+        logger.info("[%s] 미완료 Slack 전송 %d건을 이어서 보냅니다.", dest.name, deliveries[dest.name].pending)
+        try:
+            return deliveries[dest.name].resume()
+        except SlackApiError as e:
+            logger.error("[%s] Slack API 오류: %s", dest.name, e.response["error"])
+            return False
+
+    results = fan_out([d for d in destinations if d.name in deliveries], resume)
+    failed = [name for name, ok in results.items() if not ok]
+    if failed:
+        logger.error("Slack 이어 보내기 실패 대상: %s", ", ".join(failed))
+    return not failed
@@ -1,26 +1,35 @@
-"""수집된 기사 처리: 중복 제거, 날짜 필터링, 행동 기반 카테고리 분류."""
+"""수집된 기사 처리: 중복 제거, 근사 중복 묶기, 날짜 필터링, 행동 기반 카테고리 분류."""
 
 from __future__ import annotations
 
-import json
+import heapq
 import logging
-import os
-from datetime import datetime, timedelta
-
-from src.config import DAYS_LOOKBACK, HISTORY_FILE
-from src.crawlers.base import Article
+from array import array
+from collections.abc import Container, Iterable, Sequence
+
+from src.config import DAYS_LOOKBACK, NEARDUP_HISTORY_DAYS, NEARDUP_THRESHOLD, RELEVANCE_MIN_SCORE
+from src.crawlers.base import Article, today_ordinal
+from src.crawlers.registry import REGISTRY
+from src.history import HistoryStore
+from src.metrics import metrics
+from src.neardup import LSHIndex, numbers, signature
+from src.relevance import profile
+from src.urlnorm import fingerprint
 
 logger = logging.getLogger(__name__)
 
 # 뉴스 소스 (마감일 없는 정보성 콘텐츠)
-NEWS_SOURCES = {"네이버뉴스", "중소벤처기업부"}
+NEWS_SOURCES = {spec.name for spec in REGISTRY.values() if spec.news}
+
+# 같은 항목이 여러 소스에서 오면 이 순서(레지스트리 등록 순서)가 앞선 소스의 것을 남긴다
+SOURCE_ORDER = tuple(spec.name for spec in REGISTRY.values())
 
 # 카테고리 정의
 CAT_URGENT = "🔥 마감 임박"
 CAT_NEW = "📋 신규 공고"
 CAT_NEWS = "📰 정책 동향"
 
-# 메인 메시지 표시 제한
+# 메인 메시지 표시 제한 (관련도 점수 상위 N건)
 LIMITS = {
     CAT_URGENT: None,  # 전체 표시
     CAT_NEW: 10,
@@ -45,69 +54,196 @@ def classify(article: Article) -> str:
     return CAT_NEW
 
 
-def load_history() -> set[str]:
-    """전송 이력(URL 목록)을 로드."""
-    if not os.path.exists(HISTORY_FILE):
-        return set()
-    try:
-        with open(HISTORY_FILE, encoding="utf-8") as f:
-            return set(json.load(f))
-    except (json.JSONDecodeError, OSError):
-        return set()
-
-
-def save_history(urls: set[str]) -> None:
-    """전송 이력 저장. 최근 500건만 유지."""
-    url_list = sorted(urls)[-500:]
-    os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
-    with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(url_list, f, ensure_ascii=False, indent=2)
-
-
-def process(articles: list[Article]) -> dict[str, list[Article]]:
-    """기사 목록을 처리하여 카테고리별로 분류된 딕셔너리 반환."""
-    cutoff = datetime.now() - timedelta(days=DAYS_LOOKBACK)
-    history = load_history()
-    result: dict[str, list[Article]] = {}
-    new_urls: set[str] = set()
-
-    for article in articles:
+def top(articles: list[Article], limit: int | None) -> list[Article]:
+    """관련도 점수 상위 limit건 (점수가 같으면 원래 순서). limit이 None이면 전체."""
+    if limit is None or len(articles) <= limit:
+        return articles
+    return heapq.nlargest(limit, articles, key=lambda a: a.extra.get("score", 0))
+
+
+def load_history() -> HistoryStore:
+    """전송 이력 저장소를 연다."""
+    return HistoryStore()
+
+
+def save_history(history: HistoryStore, articles: list[Article], signatures: dict[int, array]) -> None:
+    """새로 전송할 기사를 이력에 기록."""
+    history.add(articles, signatures=signatures)
+
+
+def _neardup_indexes(history: Container[str]) -> dict[bool, LSHIndex]:
+    """뉴스/공고별 LSH 색인. 최근 전송한 항목의 서명을 미리 넣어 둔다."""
+    indexes = {True: LSHIndex(NEARDUP_THRESHOLD), False: LSHIndex(NEARDUP_THRESHOLD)}
+    if isinstance(history, HistoryStore):
+        for fp, source, title, sig in history.recent_signatures(NEARDUP_HISTORY_DAYS):
+            indexes[source in NEWS_SOURCES].insert(fp, sig, numbers(title))
+    return indexes
+
+
+class Processor:
+    """기사를 들어오는 대로 걸러 분류한다 (필터링, 중복 제거, 관련도, 근사 중복, 카테고리).
+
+    feed()는 배치(크롤러의 한 페이지)마다 부를 수 있어 수집과 겹쳐 돌고, 걸러진 기사는
+    붙잡아 두지 않는다. finish()가 카테고리별로 정렬하고 전송 이력에 기록한 결과를 반환한다.
+
+    배치는 소스가 끝나는 순서대로 섞여 들어오므로, 중복(같은 URL, 근사 중복) 중 무엇을
+    남길지는 도착 순서가 아니라 source_order(기본은 레지스트리 순서)로 정한다. 앞선
+    소스의 항목이 나중에 오면 먼저 채택한 항목을 물리고 그 자리를 차지한다.
+    """
+
+    def __init__(
+        self,
+        history: Container[str] | None = None,
+        lookback_days: int = DAYS_LOOKBACK,
+        source_order: Sequence[str] = SOURCE_ORDER,
+    ) -> None:
+        self.cutoff = today_ordinal() - lookback_days
+        self.history = load_history() if history is None else history
+        self.ranks = {name: i for i, name in enumerate(source_order)}
+        self.result: dict[str, list[Article]] = {}
+        self.new_articles: list[Article] = []
+        self.claims: dict[int, Article] = {}  # URL 지문 → 그 지문을 차지한 기사 (소스 간 중복 제거)
+        self.signatures: dict[int, array] = {}  # 채택한 기사의 지문 → MinHash 서명
+        self.representatives: dict[int, Article] = {}
+        self.indexes = _neardup_indexes(self.history)
+        self.dropped = dict.fromkeys(("stale", "expired", "duplicate", "sent", "irrelevant", "neardup"), 0)  # 제외 사유별 건수
+        self.received = 0
+
+    def feed(self, articles: Iterable[Article]) -> int:
+        """기사들을 처리하고 채택한 건수를 반환."""
+        with metrics.span("process"):
+            before = len(self.new_articles)
+            for article in articles:
+                self.received += 1
+                self._accept(article)
+            return len(self.new_articles) - before
+
+    def _accept(self, article: Article) -> None:
+        dropped = self.dropped
         # 날짜 필터링 (뉴스만 — 공고는 마감 전이면 표시)
         if article.source in NEWS_SOURCES:
-            dt = article.date_obj
-            if dt and dt < cutoff:
-                continue
+            if article.date_ord is not None and article.date_ord <= self.cutoff:
+                dropped["stale"] += 1
+                return
 
         # 마감된 공고 제외
         d_day = article.d_day
         if d_day is not None and d_day < 0:
-            continue
-
-        # 중복 제거
-        if article.url in history:
-            continue
+            dropped["expired"] += 1
+            return
+
+        # 중복 제거: 전송 이력, 그리고 다른 소스의 같은 공고 (앞선 소스의 것을 남긴다)
+        fp = fingerprint(article.url)
+        claimant = self.claims.get(fp)
+        duplicates = 0
+        if claimant is not None:
+            if self.rank(article) >= self.rank(claimant):
+                dropped["duplicate"] += 1
+                return
+            withdrawn = self._withdraw(fp)
+            if withdrawn is not None:
+                dropped["duplicate"] += 1
+                duplicates = withdrawn.extra.get("duplicates", 0)
+        if article.url in self.history:
+            dropped["sent"] += 1
+            return
+        self.claims[fp] = article
+
+        # 관련도: 관심 용어와 소스 가중치로 점수를 매기고 낮으면 제외
+        score = profile.score(article.title, article.source)
+        if score < RELEVANCE_MIN_SCORE:
+            dropped["irrelevant"] += 1
+            return
+        article.extra["score"] = score
+
+        # 근사 중복: 뉴스는 뉴스끼리, 공고는 공고끼리 묶어 앞선 소스의 항목 하나만 남긴다
+        sig = signature(article.title)
+        nums = numbers(article.title)
+        index = self.indexes[article.source in NEWS_SOURCES]
+        match = index.query(sig, nums)
+        if match is not None:
+            rep = self.representatives.get(match)
+            if rep is None or self.rank(article) >= self.rank(rep):
+                if rep is not None:
+                    rep.extra["duplicates"] = rep.extra.get("duplicates", 0) + 1
+                dropped["neardup"] += 1
+                return
+            # 나중에 온 앞선 소스의 항목이 묶음의 대표가 된다
+            self._withdraw(match)
+            dropped["neardup"] += 1
+            duplicates += rep.extra.get("duplicates", 0) + 1
+        if duplicates:
+            article.extra["duplicates"] = duplicates
+        index.insert(fp, sig, nums)
+        self.signatures[fp] = sig
+        self.representatives[fp] = article
 
         # 카테고리 분류
         article.category = classify(article)
-        result.setdefault(article.category, []).append(article)
-        new_urls.add(article.url)
-
-    # 마감 임박: D-day 오름차순 (급한 것 먼저)
-    if CAT_URGENT in result:
-        result[CAT_URGENT].sort(key=lambda a: a.d_day if a.d_day is not None else 999)
-
-    # 신규 공고: 등록일 역순
-    if CAT_NEW in result:
-        result[CAT_NEW].sort(key=lambda a: a.date, reverse=True)
-
-    # 정책 동향: 발행일 역순
-    if CAT_NEWS in result:
-        result[CAT_NEWS].sort(key=lambda a: a.date, reverse=True)
-
-    # 전송 이력 업데이트
-    if new_urls:
-        save_history(history | new_urls)
-
-    total = sum(len(v) for v in result.values())
-    logger.info("처리 완료: 총 %d건 (신규), %d건 필터링됨", total, len(articles) - total)
-    return result
+        self.result.setdefault(article.category, []).append(article)
+        self.new_articles.append(article)
+
+    def rank(self, article: Article) -> int:
+        """source_order에서의 순위 (앞설수록 작다). 목록에 없는 소스는 맨 뒤."""
+        return self.ranks.get(article.source, len(self.ranks))
+
+    def _withdraw(self, fp: int) -> Article | None:
+        """채택했던 지문 fp의 기사를 결과에서 뺀다. 채택한 기사가 아니면 None."""
+        article = self.representatives.pop(fp, None)
+        if article is None:
+            return None
+        del self.signatures[fp]
+        self.indexes[article.source in NEWS_SOURCES].remove(fp)
+        self.result[article.category].remove(article)
+        if not self.result[article.category]:
+            del self.result[article.category]
+        self.new_articles.remove(article)
+        return article
+
+    def finish(self) -> dict[str, list[Article]]:
+        """카테고리별로 정렬하고 채택한 기사를 전송 이력에 기록한 뒤 결과를 반환."""
+        with metrics.span("process"):
+            return self._finish()
+
+    def _finish(self) -> dict[str, list[Article]]:
+        result = self.result
+
+        # 같은 날짜끼리는 소스 순서, 같은 소스 안에서는 수집 순서 (도착 순서와 무관하게)
+        rank = self.rank
+
+        # 마감 임박: D-day 오름차순 (급한 것 먼저)
+        if CAT_URGENT in result:
+            result[CAT_URGENT].sort(key=lambda a: (a.deadline_ord if a.deadline_ord is not None else 1 << 30, rank(a)))
+
+        # 신규 공고: 등록일 역순
+        if CAT_NEW in result:
+            result[CAT_NEW].sort(key=lambda a: (a.date_ord or 0, -rank(a)), reverse=True)
+
+        # 정책 동향: 발행일 역순
+        if CAT_NEWS in result:
+            result[CAT_NEWS].sort(key=lambda a: (a.date_ord or 0, -rank(a)), reverse=True)
+
+        # 전송 이력 업데이트
+        if self.new_articles:
+            save_history(self.history, self.new_articles, self.signatures)
+
+        for reason, count in self.dropped.items():
+            metrics.incr("dropped", count, reason=reason)
+        for category, items in result.items():
+            metrics.incr("selected", len(items), category=category)
+
+        total = sum(len(v) for v in result.values())
+        logger.info("처리 완료: 총 %d건 (신규), %d건 필터링됨", total, self.received - total)
+        return result
+
+
+def process(
+    articles: Iterable[Article],
+    history: Container[str] | None = None,
+    lookback_days: int = DAYS_LOOKBACK,
+    source_order: Sequence[str] = SOURCE_ORDER,
+) -> dict[str, list[Article]]:
+    """기사 목록을 처리하여 카테고리별로 분류된 딕셔너리 반환."""
+    processor = Processor(history, lookback_days, source_order)
+    processor.feed(articles)
+    return processor.finish()
@@ -0,0 +1,93 @@
+"""호스트별 토큰 버킷 요청 속도 제한.
+
+같은 사이트에는 정해진 속도 이상으로 요청하지 않고, 서로 다른 사이트 사이에는
+대기 시간을 만들지 않는다. 토큰을 미리 예약하는 방식이라 락을 잡은 채로
+잠들지 않으므로 스레드와 asyncio 양쪽에서 함께 쓸 수 있다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+from src.config import HOST_RATE_LIMITS, REQUEST_BURST, REQUEST_DELAY
+from src.crawlers.registry import host_rates
+
+
+def host_of(url: str) -> str:
+    """URL에서 호스트 키를 추출 (소문자, www. 제거)."""
+    host = (urlsplit(url).hostname or url).lower()
+    return host.removeprefix("www.")
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷. rate <= 0이면 제한 없음."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 그 토큰을 쓸 수 있을 때까지 기다려야 할 시간(초)을 반환."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 묶음."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        overrides: dict[str, tuple[float, int]] | None = None,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.overrides = overrides or {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.overrides.get(host, (self.rate, self.burst))
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """요청 전에 호출. 필요한 만큼 잠들고 대기한 시간을 반환."""
+        wait = self.bucket(host_of(url)).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """acquire의 asyncio 버전."""
+        import asyncio
+
+        wait = self.bucket(host_of(url)).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+# 모든 크롤러가 공유하는 기본 리미터
+limiter = RateLimiter(
+    rate=1.0 / REQUEST_DELAY if REQUEST_DELAY > 0 else 0.0,
+    burst=REQUEST_BURST,
+    overrides={**host_rates(), **HOST_RATE_LIMITS},
+)
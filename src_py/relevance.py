@@ -0,0 +1,107 @@
+"""제목 관련도 점수 (Aho-Corasick).
+
+관심 프로필(키워드, 동의어, 제외어, 소스 가중치)을 Aho-Corasick 오토마톤으로 한 번
+컴파일하고, 제목은 한 글자씩 한 번만 훑어 모든 용어를 동시에 찾는다. 제목 길이와
+일치 수에 비례하는 시간이라 용어와 항목이 늘어도 선형으로 늘어난다.
+
+- 정규화: NFKC, 소문자, 공백 제거 (띄어쓰기 차이 흡수 — "예비 창업" = "예비창업")
+- 동의어는 대표 용어로 세고, 같은 용어는 제목에 여러 번 나와도 한 번만 센다
+- 점수 = 일치한 용어 가중치 합 - 일치한 제외어 가중치 합 + 소스 가중치
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections import deque
+
+from src.config import (
+    RELEVANCE_KEYWORDS,
+    RELEVANCE_NEGATIVE,
+    RELEVANCE_SOURCE_WEIGHTS,
+    RELEVANCE_SYNONYMS,
+)
+
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    return _SPACE.sub("", unicodedata.normalize("NFKC", text).casefold())
+
+
+class Matcher:
+    """여러 패턴을 한 번에 찾는 Aho-Corasick 오토마톤. 패턴마다 정수 값(용어 번호)을 단다."""
+
+    def __init__(self, patterns: dict[str, int]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[tuple[int, ...]] = [()]
+        for pattern, value in patterns.items():
+            state = 0
+            for ch in normalize(pattern):
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = self._goto[state][ch] = len(self._goto)
+                    self._goto.append({})
+                    self._out.append(())
+                state = nxt
+            if state:
+                self._out[state] += (value,)
+
+        # 실패 링크 (BFS). 출력은 실패 링크를 따라 합쳐 둔다
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> set[int]:
+        """정규화한 text에 나오는 패턴들의 값."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for ch in normalize(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class RelevanceProfile:
+    """관심 프로필을 컴파일한 점수기."""
+
+    def __init__(
+        self,
+        keywords: dict[str, float],
+        synonyms: dict[str, str] | None = None,
+        negative: dict[str, float] | None = None,
+        source_weights: dict[str, float] | None = None,
+    ) -> None:
+        self.terms = [*keywords, *(negative or {})]
+        self.weights = [*keywords.values(), *(-w for w in (negative or {}).values())]
+        index = {term: i for i, term in enumerate(self.terms)}
+        patterns = dict(index)
+        for variant, term in (synonyms or {}).items():
+            if term not in index:
+                raise ValueError(f"동의어 {variant!r}의 대상 {term!r}이 키워드에 없습니다.")
+            patterns[variant] = index[term]
+        self.matcher = Matcher(patterns)
+        self.source_weights = source_weights or {}
+
+    def matches(self, title: str) -> list[str]:
+        """제목에서 찾은 용어 (프로필 순서)."""
+        return [self.terms[i] for i in sorted(self.matcher.find(title))]
+
+    def score(self, title: str, source: str = "") -> float:
+        return sum(self.weights[i] for i in self.matcher.find(title)) + self.source_weights.get(source, 0)
+
+
+# config의 관심 프로필 (import할 때 한 번 컴파일)
+profile = RelevanceProfile(RELEVANCE_KEYWORDS, RELEVANCE_SYNONYMS, RELEVANCE_NEGATIVE, RELEVANCE_SOURCE_WEIGHTS)
@@ -0,0 +1,163 @@
+"""크롤러 응답 녹화/재생.
+
+녹화: CRAWL_RECORD_DIR를 지정하면 BaseCrawler 세션의 모든 2xx 응답을 gzip
+압축한 JSON 픽스처로 저장한다 (본문 전체를 받도록 HTTP 캐시는 끈다).
+재생: CRAWL_REPLAY_DIR를 지정하면 네트워크 대신 픽스처로 응답한다 (속도 제한,
+HTTP 캐시, 원본 페이지 보관소, 레이아웃 기록은 끈다). 픽스처가 없는 요청은 ConnectionError로 실패한다.
+
+픽스처는 <dir>/v<FIXTURE_VERSION>/<요청 키>.json.gz 에 저장되고, 요청 키는
+메서드와 쿼리를 포함한 전체 URL의 해시다.
+
+    python -m src.replay record <dir>   # 모든 크롤러를 실행하며 녹화
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.ratelimit import RateLimiter
+
+FIXTURE_VERSION = 1
+
+# 재생에 필요한 응답 헤더만 저장
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def request_key(method: str, url: str) -> str:
+    return hashlib.sha256(f"{method.upper()} {url}".encode("utf-8")).hexdigest()[:24]
+
+
+def fixture_path(directory: str, method: str, url: str) -> str:
+    return os.path.join(directory, f"v{FIXTURE_VERSION}", f"{request_key(method, url)}.json.gz")
+
+
+def save_fixture(
+    directory: str,
+    method: str,
+    url: str,
+    status: int,
+    headers: dict[str, str],
+    body: bytes,
+    encoding: str | None = None,
+) -> str:
+    """응답 하나를 픽스처로 저장하고 경로를 반환."""
+    path = fixture_path(directory, method, url)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    record = {
+        "version": FIXTURE_VERSION,
+        "method": method.upper(),
+        "url": url,
+        "status": status,
+        "headers": {k: v for k, v in headers.items() if k in _KEPT_HEADERS},
+        "encoding": encoding,
+        "body": base64.b64encode(body).decode("ascii"),
+    }
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False)
+    return path
+
+
+def load_fixture(directory: str, method: str, url: str) -> dict | None:
+    path = fixture_path(directory, method, url)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            record = json.load(f)
+    except OSError:
+        return None
+    if record.get("version") != FIXTURE_VERSION:
+        return None
+    record["body"] = base64.b64decode(record["body"])
+    return record
+
+
+class Recorder:
+    """requests 응답 훅으로 응답을 픽스처에 저장."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def __call__(self, resp: requests.Response, *args, **kwargs) -> requests.Response:
+        if 200 <= resp.status_code < 300:
+            save_fixture(
+                self.directory,
+                resp.request.method,
+                resp.request.url,
+                resp.status_code,
+                dict(resp.headers),
+                resp.content,
+                resp.encoding,
+            )
+        return resp
+
+
+class ReplayAdapter(BaseAdapter):
+    """픽스처로 응답하는 transport adapter."""
+
+    def __init__(self, directory: str) -> None:
+        super().__init__()
+        self.directory = directory
+
+    def send(self, request, **kwargs) -> requests.Response:
+        record = load_fixture(self.directory, request.method, request.url)
+        if record is None:
+            raise requests.ConnectionError(
+                f"재생할 픽스처가 없습니다: {request.method} {request.url}", request=request
+            )
+
+        resp = requests.Response()
+        resp.status_code = record["status"]
+        resp.headers = CaseInsensitiveDict(record["headers"])
+        resp._content = record["body"]
+        resp.encoding = record["encoding"]
+        resp.url = request.url
+        resp.request = request
+        resp.reason = "Replayed"
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def install(session: requests.Session, record_dir: str = "", replay_dir: str = "") -> None:
+    """세션에 녹화 훅 또는 재생 adapter를 붙인다."""
+    if replay_dir:
+        adapter = ReplayAdapter(replay_dir)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    elif record_dir:
+        session.hooks["response"].append(Recorder(record_dir))
+
+
+def attach(crawler, record_dir: str = "", replay_dir: str = "") -> None:
+    """크롤러를 녹화/재생 모드로 바꾼다. 어느 쪽이든 HTTP 캐시는 쓰지 않고, 재생할 때는 보관소·레이아웃 기록도 쓰지 않는다."""
+    install(crawler.session, record_dir=record_dir, replay_dir=replay_dir)
+    crawler.http_cache = None
+    if replay_dir:
+        crawler.rate_limiter = RateLimiter(rate=0, burst=1)
+        crawler.archive = None
+        crawler.layout_store = None
+
+
+def _record(directory: str) -> int:
+    os.environ["CRAWL_RECORD_DIR"] = directory
+    from src.main import collect_all
+
+    articles = collect_all()
+    print(f"{len(articles)}건 수집, 픽스처 저장 위치: {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "record":
+        print("사용법: python -m src.replay record <dir>", file=sys.stderr)
+        sys.exit(2)
+    sys.exit(_record(sys.argv[2]))
@@ -0,0 +1,84 @@
+"""공유 HTTP 전송 계층.
+
+크롤러와 Webhook 전송이 하나의 연결 풀(HTTPAdapter)을 함께 쓴다. 세션 객체는
+쓰는 쪽마다 따로 만들어 헤더나 녹화/재생 adapter를 독립적으로 붙일 수 있지만,
+연결은 풀에서 재사용하므로 같은 호스트에 TLS 핸드셰이크를 반복하지 않는다.
+
+- 연결 실패, 읽기 타임아웃, 429/5xx 응답은 지수 백오프(지터 포함)로 재시도한다.
+  Retry-After가 있으면 그만큼 (최대 HTTP_RETRY_AFTER_MAX초) 기다린다. 재시도도 요청이므로
+  보내기 전에 호스트별 토큰 버킷(src.ratelimit.limiter)에서 토큰을 받는다. POST처럼 멱등이 아닌 요청은 연결
+  단계의 실패만 재시도한다 (서버가 받았을 수 있는 요청은 다시 보내지 않음).
+- 타임아웃은 (연결, 읽기) 쌍이고 읽기 타임아웃은 HOST_TIMEOUTS로 호스트별로 바꿀 수 있다.
+"""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import (
+    CONNECT_TIMEOUT,
+    HOST_TIMEOUTS,
+    HTTP_BACKOFF,
+    HTTP_BACKOFF_JITTER,
+    HTTP_POOL_HOSTS,
+    HTTP_POOL_SIZE,
+    HTTP_RETRIES,
+    HTTP_RETRY_AFTER_MAX,
+    REQUEST_TIMEOUT,
+    USER_AGENT,
+)
+from src.ratelimit import host_of, limiter
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class LimitedRetry(Retry):
+    """Retry-After를 HTTP_RETRY_AFTER_MAX초로 자르고, 재시도마다 호스트 토큰을 받는 Retry."""
+
+    host: str | None = None
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        retry.host = _pool.host if _pool is not None else self.host
+        return retry
+
+    def get_retry_after(self, response) -> float | None:
+        seconds = super().get_retry_after(response)
+        return None if seconds is None else min(seconds, HTTP_RETRY_AFTER_MAX)
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        if self.host:
+            limiter.acquire(self.host)
+
+
+def retry_policy(total: int = HTTP_RETRIES) -> Retry:
+    return LimitedRetry(
+        total=total,
+        backoff_factor=HTTP_BACKOFF,
+        backoff_jitter=HTTP_BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 재시도를 다 쓰면 마지막 응답을 그대로 돌려준다 (raise_for_status로 처리)
+    )
+
+
+def timeout_for(url: str) -> tuple[float, float]:
+    """(연결, 읽기) 타임아웃."""
+    return CONNECT_TIMEOUT, HOST_TIMEOUTS.get(host_of(url), REQUEST_TIMEOUT)
+
+
+# 모든 세션이 공유하는 연결 풀
+adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry_policy())
+
+
+def session(user_agent: str | None = USER_AGENT) -> requests.Session:
+    """공유 연결 풀을 쓰는 새 세션."""
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    if user_agent:
+        s.headers["User-Agent"] = user_agent
+    return s
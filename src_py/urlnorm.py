@@ -0,0 +1,83 @@
+"""URL 정규화와 지문(fingerprint).
+
+같은 공고나 기사가 추적 파라미터, http/https, 끝 슬래시, 미러 사이트 때문에
+서로 다른 URL로 들어오는 것을 하나로 묶는다. 공고 ID가 있는 URL은 어느
+사이트에서 왔든 ID만으로 키를 만든다 (예: 창업진흥원 목록의 링크는 K-Startup
+상세 페이지를 가리키므로 K-Startup에서 수집한 같은 공고와 같은 키가 된다).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# 공고/게시물 ID → 사이트와 무관한 정규 키
+_ID_PARAMS = {
+    "pbancSn": "k-startup.go.kr/pbanc/{}",
+    "pblancId": "bizinfo.go.kr/pblanc/{}",
+}
+
+# 호스트별로 의미 있는 쿼리 파라미터 (나머지는 버린다)
+HOST_PARAMS: dict[str, set[str]] = {
+    "k-startup.go.kr": {"pbancSn", "schM"},
+    "bizinfo.go.kr": {"pblancId"},
+    "mss.go.kr": {"cbIdx", "bcIdx"},
+    "kised.or.kr": {"mid", "bbsSn", "nttId"},
+}
+
+# 어느 호스트에서든 버리는 추적 파라미터
+_TRACKING = re.compile(r"^(utm_\w+|fbclid|gclid|dclid|msclkid|igshid|mc_cid|mc_eid|ref_src)$", re.I)
+
+_NAVER_ARTICLE = re.compile(r"^/(?:mnews/)?article/(\d+)/(\d+)")
+
+
+def _host(netloc: str) -> str:
+    host = netloc.rsplit("@", 1)[-1].lower()
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+    return host.removeprefix("www.").removeprefix("m.")
+
+
+@lru_cache(maxsize=65536)
+def canonicalize(url: str) -> str:
+    """URL을 비교용 정규 문자열로 바꾼다 (스킴 없음)."""
+    parts = urlsplit(url.strip())
+    host = _host(parts.netloc)
+    params = parse_qsl(parts.query, keep_blank_values=False)
+
+    for name, value in params:
+        template = _ID_PARAMS.get(name)
+        if template and value:
+            return template.format(value)
+
+    if host in ("n.news.naver.com", "news.naver.com"):
+        match = _NAVER_ARTICLE.match(parts.path)
+        if match:
+            return "news.naver.com/article/{}/{}".format(*match.groups())
+        query = dict(params)
+        if "oid" in query and "aid" in query:
+            return f"news.naver.com/article/{query['oid']}/{query['aid']}"
+
+    if host == "mss.go.kr":
+        query = dict(params)
+        if "bcIdx" in query:
+            return f"mss.go.kr/bbs/{query.get('cbIdx', '')}/{query['bcIdx']}"
+
+    allowed = HOST_PARAMS.get(host)
+    kept = sorted(
+        (k, v)
+        for k, v in params
+        if not _TRACKING.match(k) and (allowed is None or k in allowed)
+    )
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    query = f"?{urlencode(kept)}" if kept else ""
+    return f"{host}{path}{query}"
+
+
+@lru_cache(maxsize=65536)
+def fingerprint(url: str) -> int:
+    """정규화한 URL의 64비트 지문 (SQLite INTEGER에 맞춘 부호 있는 정수)."""
+    digest = hashlib.blake2b(canonicalize(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
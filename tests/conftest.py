@@ -0,0 +1,18 @@
+"""테스트 공용 도우미."""
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.slack_response import SlackResponse
+
+
+def slack_error(error: str, status: int = 200, headers: dict | None = None) -> SlackApiError:
+    """Slack API가 돌려준 오류 응답."""
+    response = SlackResponse(
+        client=None,
+        http_verb="POST",
+        api_url="https://slack.com/api/chat.postMessage",
+        req_args={},
+        data={"ok": False, "error": error},
+        headers=headers or {},
+        status_code=status,
+    )
+    return SlackApiError(error, response)
@@ -0,0 +1,144 @@
+"""원본 페이지 보관소 테스트."""
+
+import re
+import requests
+
+from src.archive import PageArchive, reparse
+from src.crawlers.base import Article, ListCrawler, today_iso
+from src.ratelimit import RateLimiter
+from tests.test_parsing import KSTARTUP_HTML, MSS_HTML
+
+DAY = 86400
+
+
+def _response(body: bytes, url: str) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    resp.encoding = "utf-8"
+    resp.url = url
+    return resp
+
+
+class _CsvCrawler(ListCrawler):
+    """본문 "105,104,103"의 번호마다 공고 하나를 만드는 테스트용 크롤러."""
+
+    name = "csv"
+    http_cache = None
+    layout_store = None
+    rate_limiter = RateLimiter(rate=0, burst=1)
+    mark_pattern = re.compile(r"id=(\d+)")
+    max_pages = 1
+
+    def __init__(self, archive: PageArchive, body: bytes, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+        self.body = body
+        self.parsed = 0
+        self.date = "2026-02-10"  # 빈 값이면 날짜를 읽지 못한 것처럼 이번 실행의 오늘로
+        self.session.get = lambda url, **kw: _response(self.body, url)
+
+    def page_request(self, page: int) -> tuple[str, dict]:
+        return "https://example.com/list", {}
+
+    def _parse_page(self, resp) -> list[Article]:
+        # 파싱 횟수를 세야 하므로 파서 프로세스(PARSE_PROCESSES)를 쓰지 않는다
+        return self._parse_list(resp)
+
+    def _rows(self, resp) -> list:
+        self.parsed += 1
+        return resp.text.split(",")
+
+    def _parse_row(self, row) -> Article:
+        date = self.date or today_iso()
+        return Article(title=f"공고 {row}", url=f"https://example.com/view?id={row}", source=self.name, date=date)
+
+
+class TestPageArchive:
+    def test_deduplicates_bodies(self, tmp_path):
+        archive = PageArchive(str(tmp_path))
+        first = archive.put("s", "https://example.com/1", b"<html>same</html>", "utf-8", now=1.0)
+        second = archive.put("s", "https://example.com/2", b"<html>same</html>", "utf-8", now=2.0)
+
+        assert first == second
+        assert len(list(tmp_path.glob("pages/*/*.gz"))) == 1
+        assert archive.body(first) == b"<html>same</html>"
+        assert [e["url"] for e in archive.entries("s")] == ["https://example.com/1", "https://example.com/2"]
+        assert [e["time"] for e in archive.entries(since=1.5)] == [2.0]
+
+    def test_prune_keeps_bodies_still_referenced(self, tmp_path):
+        archive = PageArchive(str(tmp_path), retention_days=1)
+        old = archive.put("s", "https://example.com/old", b"old", now=0.0)
+        shared = archive.put("s", "https://example.com/a", b"shared", now=0.0)
+        archive.put("s", "https://example.com/b", b"shared", now=3 * DAY)
+
+        assert archive.prune(now=3 * DAY) == 1
+        assert archive.body(old) is None
+        assert archive.body(shared) == b"shared"
+        assert [e["url"] for e in archive.entries()] == ["https://example.com/b"]
+
+
+class TestArchivedParsing:
+    def test_unchanged_body_skips_parsing(self, tmp_path):
+        archive = PageArchive(str(tmp_path))
+        crawler = _CsvCrawler(archive, b"103,102,101")
+        first = crawler.crawl()
+        second = crawler.crawl()
+
+        assert crawler.parsed == 1
+        assert [a.title for a in second] == [a.title for a in first] == ["공고 103", "공고 102", "공고 101"]
+        assert len(list(archive.entries("csv"))) == 2
+
+    def test_changed_body_reparses(self, tmp_path):
+        archive = PageArchive(str(tmp_path))
+        crawler = _CsvCrawler(archive, b"103,102,101")
+        crawler.crawl()
+        crawler.body = b"104,103,102,101"
+
+        assert [a.title for a in crawler.crawl()] == ["공고 104", "공고 103", "공고 102", "공고 101"]
+        assert crawler.parsed == 2
+
+    def test_reused_result_keeps_mark_state(self, tmp_path):
+        archive = PageArchive(str(tmp_path))
+        _CsvCrawler(archive, b"106,105,104,103,102,101", mark=102).crawl()
+
+        crawler = _CsvCrawler(archive, b"106,105,104,103,102,101", mark=102)
+        assert [a.title for a in crawler.crawl()] == ["공고 106", "공고 105", "공고 104", "공고 103"]
+        assert crawler.parsed == 0
+        assert crawler.new_mark == 106
+
+        # mark가 다르면 파싱 결과도 다르므로 다시 파싱한다
+        other = _CsvCrawler(archive, b"106,105,104,103,102,101", mark=104)
+        assert [a.title for a in other.crawl()] == ["공고 106", "공고 105"]
+        assert other.parsed == 1
+
+    def test_fallback_dates_are_not_reused(self, tmp_path):
+        # 날짜를 읽지 못해 오늘로 채운 결과는 다른 날 그대로 쓰면 안 되므로 저장하지 않는다
+        archive = PageArchive(str(tmp_path))
+        crawler = _CsvCrawler(archive, b"103,102,101")
+        crawler.date = ""
+        crawler.crawl()
+        crawler.crawl()
+        assert crawler.parsed == 2
+
+
+class TestReparse:
+    def test_reparses_archived_pages_offline(self, tmp_path):
+        archive = PageArchive(str(tmp_path))
+        body = KSTARTUP_HTML.encode("utf-8")
+        archive.put("K-Startup", "https://www.k-startup.go.kr/list", body, "utf-8", now=1.0)
+        archive.put("K-Startup", "https://www.k-startup.go.kr/list", body, "utf-8", now=2.0)
+
+        articles = list(reparse(archive, "kstartup"))
+        assert [a.title for a in articles] == ["2026년 예비창업패키지 모집"]
+        assert list(reparse(archive, "kstartup", since=3.0)) == []
+
+    def test_skips_detail_pages(self, tmp_path):
+        archive = PageArchive(str(tmp_path))
+        archive.put("중소벤처기업부", "https://www.mss.go.kr/list", MSS_HTML.encode("utf-8"), "utf-8", now=1.0)
+        # 범용 선택자("table tbody tr")에 걸리는 상세 페이지의 첨부파일 표
+        detail = "<table><tbody><tr><td>첨부</td><td><a href='/file.hwp'>공고문.hwp</a></td><td>2026.02.11</td></tr></tbody></table>"
+        archive.put("중소벤처기업부", "https://www.mss.go.kr/view", detail.encode("utf-8"), "utf-8", now=2.0, kind="detail")
+
+        assert [e["kind"] for e in archive.entries("중소벤처기업부")] == ["list", "detail"]
+        assert [a.title for a in reparse(archive, "mss")] == ["중기부, 창업기업 지원 확대"]
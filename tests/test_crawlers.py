@@ -1,8 +1,10 @@
 """크롤러 단위 테스트."""
 
+import re
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
-from src.crawlers.base import Article
+from src.crawlers.base import Article, ListCrawler
 from src.crawlers.naver_news import NaverNewsCrawler, _parse_date, _strip_html
 
 
@@ -93,6 +95,61 @@ class TestNaverNewsCrawler:
         assert urls.count("https://example.com/same") == 1
 
 
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_ID", "test_id")
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_SECRET", "test_secret")
+    @patch("src.crawlers.naver_news.SEARCH_KEYWORDS", ["창업"])
+    def test_crawl_walks_pages_until_lookback(self):
+        def page(start: int, days_ago: int) -> MagicMock:
+            pub = (datetime.now() - timedelta(days=days_ago)).strftime("%a, %d %b %Y 09:00:00 +0900")
+            resp = MagicMock()
+            resp.json.return_value = {
+                "items": [
+                    {"title": f"기사 {start + i}", "originallink": f"https://example.com/{start + i}", "pubDate": pub}
+                    for i in range(100)
+                ]
+            }
+            return resp
+
+        pages = {1: page(1, 0), 101: page(101, 2), 201: page(201, 30), 301: page(301, 40)}
+        crawler = NaverNewsCrawler()
+        crawler.fetch = MagicMock(side_effect=lambda url, params: pages[params["start"]])
+
+        articles = crawler.crawl()
+
+        starts = [call.kwargs["params"]["start"] for call in crawler.fetch.call_args_list]
+        assert starts == [1, 101, 201]
+        assert len(articles) == 300
+        assert crawler.fetch.call_args_list[0].kwargs["params"]["display"] == 100
+
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_ID", "test_id")
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_SECRET", "test_secret")
+    @patch("src.crawlers.naver_news.SEARCH_KEYWORDS", ["a", "b", "c", "d"])
+    def test_crawl_keywords_concurrently(self):
+        import threading
+        import time
+
+        active = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def fetch(url, params):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            resp = MagicMock()
+            resp.json.return_value = {"items": []}
+            return resp
+
+        crawler = NaverNewsCrawler()
+        crawler.fetch = MagicMock(side_effect=fetch)
+        crawler.crawl()
+
+        assert crawler.fetch.call_count == 4
+        assert active["max"] > 1
+
+
 class TestArticle:
     def test_date_obj_valid(self):
         a = Article(title="t", url="u", source="s", date="2026-02-10")
@@ -115,6 +172,206 @@ class TestArticle:
         a = Article(title="t", url="u", source="s", date="2026-01-01", deadline=future)
         assert a.d_day == 5
 
+    def test_dates_parsed_once_into_ordinals(self):
+        a = Article(title="t", url="u", source="s", date="2026-02-10", deadline="2026-02-18")
+        assert a.deadline_ord - a.date_ord == 8
+        a.deadline = "2026-02-20"
+        assert a.deadline_ord - a.date_ord == 10
+
+    def test_d_day_uses_run_today(self):
+        from datetime import date
+
+        from src.crawlers.base import start_run
+
+        try:
+            start_run(date(2026, 2, 10))
+            a = Article(title="t", url="u", source="s", date="2026-02-01", deadline="2026-02-18")
+            assert a.d_day == 8
+        finally:
+            start_run()
+
+    def test_uses_slots(self):
+        a = Article(title="t", url="u", source="s", date="2026-01-01")
+        assert not hasattr(a, "__dict__")
+
     def test_d_day_none_without_deadline(self):
         a = Article(title="t", url="u", source="s", date="2026-01-01")
         assert a.d_day is None
+
+
+def _days_ago(n: int) -> str:
+    return (datetime.now() - timedelta(days=n)).strftime("%Y-%m-%d")
+
+
+class _PagedCrawler(ListCrawler):
+    """페이지 번호별로 정해진 기사 목록을 돌려주는 테스트용 크롤러."""
+
+    name = "paged"
+    http_cache = None
+    layout_store = None
+    max_pages = 5
+
+    def __init__(self, pages: dict[int, list[Article]], **kwargs):
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.requested: list[int] = []
+
+    def _fetch_page(self, page: int):
+        self.requested.append(page)
+        return page if page in self.pages else None
+
+    def _parse_list(self, resp) -> list[Article]:
+        return self.pages[resp]
+
+
+def _page(page: int, days_ago: int, n: int = 2) -> list[Article]:
+    return [
+        Article(title=f"p{page}-{i}", url=f"https://example.com/{page}/{i}", source="paged", date=_days_ago(days_ago))
+        for i in range(n)
+    ]
+
+
+class TestListCrawler:
+    def test_walks_pages_until_stale(self):
+        crawler = _PagedCrawler({1: _page(1, 1), 2: _page(2, 3), 3: _page(3, 30), 4: _page(4, 40)})
+        titles = [a.title for a in crawler.iter_articles()]
+        assert titles == ["p1-0", "p1-1", "p2-0", "p2-1", "p3-0", "p3-1"]
+        # 3페이지를 파싱하는 동안 4페이지를 미리 요청했을 수 있다
+        assert crawler.requested[:3] == [1, 2, 3]
+
+    def test_stops_at_sent_history(self):
+        pages = {1: _page(1, 1), 2: _page(2, 1), 3: _page(3, 1)}
+        history = {a.url for a in pages[2]}
+        crawler = _PagedCrawler(pages, history=history)
+        assert [len(p) for p in crawler.iter_pages()] == [2, 2]
+
+    def test_respects_max_pages(self):
+        crawler = _PagedCrawler({p: _page(p, 0) for p in range(1, 10)})
+        crawler.max_pages = 3
+        assert len(list(crawler.iter_pages())) == 3
+        assert max(crawler.requested) == 3
+
+    def test_stops_when_page_repeats(self):
+        same = _page(1, 0)
+        crawler = _PagedCrawler({1: same, 2: same, 3: same})
+        assert [a.title for a in crawler.crawl()] == ["p1-0", "p1-1"]
+
+    def test_page_requests(self):
+        from src.crawlers import MSSCrawler
+
+        url, params = MSSCrawler().page_request(3)
+        assert params == {"cbIdx": "86", "pageIndex": "3"}
+
+
+class _NumberedCrawler(ListCrawler):
+    """공고 번호가 붙은 행을 돌려주는 테스트용 크롤러 (행 = 번호)."""
+
+    name = "numbered"
+    http_cache = None
+    layout_store = None
+    mark_pattern = re.compile(r"id=(\d+)")
+
+    def __init__(self, pages: dict[int, list[int]], **kwargs):
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.requested: list[int] = []
+        self.parsed: list[int] = []
+
+    def _fetch_page(self, page: int):
+        self.requested.append(page)
+        return page if page in self.pages else None
+
+    def _rows(self, resp) -> list:
+        return self.pages[resp]
+
+    def _parse_row(self, row) -> Article:
+        self.parsed.append(row)
+        return Article(title=f"공고 {row}", url=f"https://example.com/view?id={row}", source=self.name, date=_days_ago(0))
+
+
+class TestHighWaterMark:
+    def test_first_run_records_mark(self):
+        crawler = _NumberedCrawler({1: [105, 104, 103], 2: [102, 101]})
+        assert len(crawler.crawl()) == 5
+        assert crawler.new_mark == 105
+
+    def test_stops_parsing_at_known_rows(self):
+        # 상단 고정 공지(50)는 번호가 작아도 건너뛰고 계속 읽는다
+        crawler = _NumberedCrawler({1: [50, 107, 106, 105, 104, 103, 102, 101], 2: [100, 99]}, mark=104)
+        assert [a.title for a in crawler.crawl()] == ["공고 107", "공고 106", "공고 105"]
+        assert crawler.parsed == [50, 107, 106, 105, 104, 103, 102]
+        assert crawler.requested == [1]
+        assert crawler.new_mark == 107
+
+    def test_walks_pages_while_all_new(self):
+        crawler = _NumberedCrawler({1: [110, 109], 2: [108, 107], 3: [104, 103, 102, 101]}, mark=104)
+        assert [a.title for a in crawler.crawl()] == ["공고 110", "공고 109", "공고 108", "공고 107"]
+        assert crawler.requested[:3] == [1, 2, 3]
+
+    def test_failed_page_keeps_old_mark(self):
+        # 2페이지를 받지 못하면 그 아래 항목(105..101)을 다음 실행에서 다시 봐야 한다
+        crawler = _NumberedCrawler({1: [110, 109, 108, 107, 106]}, mark=100)
+        assert len(crawler.crawl()) == 5
+        assert crawler.requested == [1, 2]
+        assert crawler.complete is False
+        assert crawler.committed_mark == 100
+
+        crawler.pages.update({2: [105, 104, 103, 102, 101], 3: []})
+        crawler.refresh()
+        assert [a.title for a in crawler.crawl()][-5:] == [f"공고 {n}" for n in range(105, 100, -1)]
+        assert crawler.committed_mark == 110
+
+    def test_max_pages_truncation_keeps_old_mark(self):
+        crawler = _NumberedCrawler({1: [110, 109], 2: [108, 107]}, mark=100)
+        crawler.max_pages = 2
+        crawler.crawl()
+        assert crawler.new_mark == 110
+        assert crawler.committed_mark == 100
+
+    def test_site_crawler_patterns(self):
+        from src.crawlers import BizinfoCrawler, KisedCrawler, KStartupCrawler, MSSCrawler
+
+        def key(cls, url):
+            return cls().mark_key(Article(title="t", url=url, source="s", date=""))
+
+        assert key(KStartupCrawler, "https://www.k-startup.go.kr/x?schM=view&pbancSn=176543") == 176543
+        assert key(KisedCrawler, "https://www.k-startup.go.kr/x?schM=view&pbancSn=176543") == 176543
+        assert key(MSSCrawler, "https://www.mss.go.kr/x?cbIdx=86&bcIdx=1054321") == 1054321
+        assert key(BizinfoCrawler, "https://www.bizinfo.go.kr/x?pblancId=PBLN_000000000012345") == 12345
+        assert key(BizinfoCrawler, "https://www.bizinfo.go.kr/web/list.do") is None
+
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_ID", "test_id")
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_SECRET", "test_secret")
+    @patch("src.crawlers.naver_news.SEARCH_KEYWORDS", ["창업"])
+    def test_naver_stops_at_last_seen_timestamp(self):
+        base = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+
+        def item(n: int) -> dict:
+            pub = (base - timedelta(minutes=n)).strftime("%a, %d %b %Y %H:%M:%S +0900")
+            return {"title": f"기사 {n}", "originallink": f"https://example.com/{n}", "pubDate": pub}
+
+        resp = MagicMock()
+        resp.json.return_value = {"items": [item(n) for n in range(100)]}
+        mark = datetime.strptime(item(10)["pubDate"], "%a, %d %b %Y %H:%M:%S %z").timestamp()
+
+        crawler = NaverNewsCrawler(mark=int(mark))
+        crawler.fetch = MagicMock(return_value=resp)
+        articles = crawler.crawl()
+        assert [a.title for a in articles] == [f"기사 {n}" for n in range(11)]
+        assert crawler.fetch.call_count == 1
+        assert crawler.new_mark > crawler.mark
+        assert crawler.committed_mark == crawler.new_mark
+
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_ID", "test_id")
+    @patch("src.crawlers.naver_news.NAVER_CLIENT_SECRET", "test_secret")
+    @patch("src.crawlers.naver_news.SEARCH_KEYWORDS", ["창업", "스타트업"])
+    def test_naver_failed_keyword_keeps_old_mark(self):
+        pub = (datetime.now().replace(microsecond=0) - timedelta(minutes=5)).strftime("%a, %d %b %Y %H:%M:%S +0900")
+        resp = MagicMock()
+        resp.json.return_value = {"items": [{"title": "기사", "originallink": "https://example.com/1", "pubDate": pub}]}
+
+        crawler = NaverNewsCrawler(mark=1)
+        crawler.fetch = MagicMock(side_effect=lambda url, params: resp if params["query"] == "창업" else None)
+        assert len(crawler.crawl()) == 1
+        assert crawler.new_mark > 1
+        assert crawler.committed_mark == 1
@@ -0,0 +1,126 @@
+"""데몬 모드 테스트."""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.crawlers.base import Article, BaseCrawler
+from src.daemon import Daemon
+from src.history import HistoryStore
+
+
+def _make_crawler(name: str, urls: list[str]) -> type[BaseCrawler]:
+    class _Crawler(BaseCrawler):
+        calls = 0
+
+        def crawl(self) -> list[Article]:
+            type(self).calls += 1
+            today = date.today().isoformat()
+            return [Article(title=f"{name} 창업 지원 {u}", url=u, source=name, date=today) for u in urls]
+
+    _Crawler.name = name
+    return _Crawler
+
+
+@pytest.fixture(autouse=True)
+def prune_storage():
+    """수집 주기마다 하는 정리는 저장소 기본 경로(data/)를 건드리므로 가짜로 바꾼다."""
+    with patch("src.daemon.prune_storage") as mock_prune:
+        yield mock_prune
+
+
+@pytest.fixture
+def history(tmp_path):
+    store = HistoryStore(str(tmp_path / "h.db"), legacy_file=None)
+    yield store
+    store.close()
+
+
+class TestHistoryPending:
+    def test_buffer_skips_sent_and_pending(self, history):
+        a = Article(title="a", url="https://example.com/a", source="s", date="2026-02-10")
+        b = Article(title="b", url="https://example.com/b?utm_source=x", source="s", date="2026-02-10")
+        history.add([a])
+        assert history.buffer([a, b, b]) == 1
+        assert history.is_pending("https://example.com/b")
+        assert [x.title for x in history.pending()] == ["b"]
+        history.clear_pending([b])
+        assert history.pending() == []
+
+
+class TestDaemon:
+    def test_per_source_intervals(self, history):
+        fast = _make_crawler("fast", ["https://example.com/f"])
+        slow = _make_crawler("slow", ["https://example.com/s"])
+        daemon = Daemon(history, [fast, slow], intervals={"fast": 60, "slow": 3600}, digest_interval=10**6)
+        daemon.next_digest = float("inf")
+
+        now = 1_000_000.0
+        daemon.crawl_due(now)
+        daemon.crawl_due(now + 61)
+        daemon.crawl_due(now + 122)
+        assert (fast.calls, slow.calls) == (3, 1)
+        assert len(history.pending()) == 2
+
+    def test_prunes_storage_after_each_crawl(self, history, prune_storage):
+        daemon = Daemon(history, [_make_crawler("c", [])], intervals={"c": 1})
+        daemon.crawl_due(1.0)
+        daemon.crawl_due(3.0)
+        assert prune_storage.call_count == 2
+
+    def test_keeps_crawler_instances(self, history):
+        crawler_cls = _make_crawler("c", [])
+        daemon = Daemon(history, [crawler_cls], intervals={"c": 1})
+        session = daemon.crawlers[0].session
+        daemon.crawl_due(1.0)
+        daemon.crawl_due(3.0)
+        assert daemon.crawlers[0].session is session
+
+    @patch("src.daemon.metrics.write")
+    @patch("src.daemon.send_slack", return_value=True)
+    def test_digest_sends_pending_and_clears(self, mock_send, mock_write, history):
+        crawler_cls = _make_crawler("c", ["https://example.com/1", "https://example.com/2"])
+        daemon = Daemon(history, [crawler_cls], intervals={"c": 60}, digest_interval=3600)
+        daemon.run_once(1_000_000.0)
+
+        mock_send.assert_called_once()
+        assert sum(len(v) for v in mock_send.call_args.args[0].values()) == 2
+        assert history.pending() == []
+        assert "https://example.com/1" in history
+        assert history.get_meta("last_digest_at") == "1000000.0"
+
+        # 다시 수집해도 이미 보낸 항목은 쌓이지 않고, 다음 다이제스트 전에는 보내지 않는다
+        daemon.run_once(1_000_061.0)
+        assert history.pending() == []
+        assert mock_send.call_count == 1
+
+    @patch("src.daemon.metrics.write")
+    @patch("src.daemon.send_slack", return_value=True)
+    def test_digest_keeps_news_buffered_early_in_interval(self, mock_send, mock_write, history):
+        # 지난 다이제스트 직후 쌓인 뉴스는 다음 다이제스트 때 DAYS_LOOKBACK보다 오래됐다
+        old = (date.today() - timedelta(days=9)).isoformat()
+        article = Article(title="창업 지원 정책 발표", url="https://example.com/news", source="네이버뉴스", date=old)
+        history.buffer([article])
+
+        daemon = Daemon(history, [], digest_interval=7 * 86400)
+        assert daemon.digest(1_000_000.0) is True
+        mock_send.assert_called_once()
+        assert [a.url for v in mock_send.call_args.args[0].values() for a in v] == ["https://example.com/news"]
+
+    def test_digest_schedule_survives_restart(self, history):
+        history.set_meta("last_digest_at", "1000.0")
+        daemon = Daemon(history, [], digest_interval=500)
+        assert daemon.next_digest == 1500.0
+
+    def test_failed_crawler_is_replaced(self, history):
+        class Broken(BaseCrawler):
+            name = "broken"
+
+            def crawl(self):
+                raise RuntimeError("boom")
+
+        daemon = Daemon(history, [Broken])
+        first = daemon.crawlers[0]
+        daemon.crawl_due(1.0)
+        assert daemon.crawlers[0] is not first
@@ -0,0 +1,70 @@
+"""Slack 전송 엔진 테스트."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from src.delivery import SlackDelivery
+from src.ratelimit import TokenBucket
+from tests.conftest import slack_error
+
+
+@pytest.fixture
+def sleep():
+    with patch("src.delivery.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+def _delivery(client, tmp_path, **kwargs) -> SlackDelivery:
+    return SlackDelivery(client, "C123", str(tmp_path / "state.json"), bucket=TokenBucket(0, 1), **kwargs)
+
+
+MESSAGES = [{"text": "main"}, {"text": "part 1"}, {"text": "part 2"}]
+
+
+class TestSlackDelivery:
+    def test_posts_thread_replies(self, tmp_path, sleep):
+        client = MagicMock()
+        client.chat_postMessage.return_value = {"ts": "1.0"}
+        assert _delivery(client, tmp_path).deliver(MESSAGES) is True
+
+        calls = client.chat_postMessage.call_args_list
+        assert [c.kwargs["text"] for c in calls] == ["main", "part 1", "part 2"]
+        assert [c.kwargs.get("thread_ts") for c in calls] == [None, "1.0", "1.0"]
+        assert json.loads((tmp_path / "state.json").read_text())["jobs"] == []
+
+    def test_honours_retry_after(self, tmp_path, sleep):
+        client = MagicMock()
+        client.chat_postMessage.side_effect = [slack_error("ratelimited", 429, {"Retry-After": "7"}), {"ts": "1.0"}]
+        assert _delivery(client, tmp_path).deliver(MESSAGES[:1]) is True
+        sleep.assert_called_once_with(7.0)
+
+    def test_non_retryable_error_raises_and_drops_job(self, tmp_path, sleep):
+        client = MagicMock()
+        client.chat_postMessage.side_effect = slack_error("channel_not_found")
+        with pytest.raises(SlackApiError):
+            _delivery(client, tmp_path).deliver(MESSAGES)
+        assert json.loads((tmp_path / "state.json").read_text())["jobs"] == []
+
+    def test_resumes_after_last_sent_message(self, tmp_path, sleep):
+        client = MagicMock()
+        client.chat_postMessage.side_effect = [{"ts": "1.0"}, {"ts": "2.0"}] + [slack_error("internal_error")] * 3
+        assert _delivery(client, tmp_path, max_retries=2).deliver(MESSAGES) is False
+
+        client = MagicMock()
+        client.chat_postMessage.return_value = {"ts": "3.0"}
+        assert _delivery(client, tmp_path).deliver([{"text": "next"}]) is True
+        calls = client.chat_postMessage.call_args_list
+        assert [c.kwargs["text"] for c in calls] == ["part 2", "next"]
+        assert calls[0].kwargs["thread_ts"] == "1.0"
+        assert "thread_ts" not in calls[1].kwargs
+
+    def test_rejoins_when_removed_from_channel(self, tmp_path, sleep):
+        client = MagicMock()
+        client.chat_postMessage.side_effect = [slack_error("not_in_channel"), {"ts": "1.0"}]
+        delivery = _delivery(client, tmp_path)
+        delivery.state["joined"] = ["C123"]
+        assert delivery.deliver(MESSAGES[:1]) is True
+        client.conversations_join.assert_called_once_with(channel="C123")
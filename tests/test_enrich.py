@@ -0,0 +1,148 @@
+"""상세 페이지 보강 테스트."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+from src.crawlers.base import Article
+from src.crawlers.detail import extract_details
+from src.crawlers.kised import KisedCrawler
+from src.crawlers.naver_news import NaverNewsCrawler
+from src.crawlers.parsing import make_soup
+from src.enrich import DetailCache, enrich
+
+DETAIL_HTML = """
+<html><body>
+<table class="view">
+  <tr><th>공고명</th><td>2026 예비창업패키지</td></tr>
+  <tr><th>주관기관</th><td>창업진흥원</td><th>등록일</th><td>2026.02.03</td></tr>
+  <tr><th>접수기간</th><td>2026-02-05 ~ 2026-02-28 18:00</td></tr>
+</table>
+<dl><dt>지원 규모</dt><dd>최대  1억원</dd><dt>등록일</dt><dd>2020-01-01</dd></dl>
+</body></html>
+"""
+
+
+def _resp(html=DETAIL_HTML):
+    resp = MagicMock()
+    resp.text = html
+    resp.encoding = "utf-8"
+    return resp
+
+
+def _article(n, source="창업진흥원", host="www.k-startup.go.kr"):
+    return Article(
+        title=f"공고 {n}",
+        url=f"https://{host}/web/contents/bizpbanc-ongoing.do?schM=view&pbancSn={n}",
+        source=source,
+        date="2026-02-10",
+    )
+
+
+class TestExtractDetails:
+    def test_extracts_labelled_fields(self):
+        details = extract_details(make_soup(DETAIL_HTML, "html.parser"))
+        assert details == {
+            "agency": "창업진흥원",
+            "date": "2026-02-03",
+            "deadline": "2026-02-28",  # 범위의 끝 날짜
+            "budget": "최대 1억원",
+        }
+
+    def test_empty_page(self):
+        assert extract_details(make_soup("<p>본문</p>", "html.parser")) == {}
+
+
+class TestDetailUrl:
+    def test_list_crawler_uses_numbered_url(self):
+        crawler = KisedCrawler()
+        assert crawler.detail_url(_article(1)) == _article(1).url
+        fallback = Article(title="t", url="https://www.kised.or.kr/menu.es?mid=a10302000000", source="창업진흥원", date="")
+        assert crawler.detail_url(fallback) is None
+
+    def test_news_has_no_detail(self):
+        assert NaverNewsCrawler().detail_url(_article(1, source="네이버뉴스")) is None
+
+
+class TestEnrich:
+    def _crawler(self):
+        crawler = KisedCrawler()
+        crawler.fetch = MagicMock(return_value=_resp())
+        return crawler
+
+    def test_fills_fields_of_new_articles_only(self):
+        crawler = self._crawler()
+        articles = [_article(1), _article(2), _article(1)]  # 같은 공고 중복
+        sent = {articles[1].url}
+
+        assert enrich(articles, {crawler.name: crawler}, sent, cache=None) == 1
+
+        assert crawler.fetch.call_count == 1
+        assert crawler.fetch.call_args.kwargs["kind"] == "detail"
+        assert articles[0].date == "2026-02-03"
+        assert articles[0].deadline == "2026-02-28"
+        assert articles[0].d_day is not None
+        assert articles[0].extra == {"agency": "창업진흥원", "budget": "최대 1억원"}
+        assert articles[1].date == "2026-02-10"  # 이미 보낸 항목은 건드리지 않음
+
+    def test_skips_sources_without_crawler(self):
+        crawler = self._crawler()
+        assert enrich([_article(1, source="기타")], {crawler.name: crawler}, cache=None) == 0
+        crawler.fetch.assert_not_called()
+
+    def test_failed_fetch_keeps_article(self):
+        crawler = self._crawler()
+        crawler.fetch.return_value = None
+        article = _article(1)
+        assert enrich([article], {crawler.name: crawler}, cache=None) == 0
+        assert article.date == "2026-02-10"
+
+    def test_limits_requests_per_host(self):
+        lock = threading.Lock()
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        def fetch(url, kind="list"):
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return _resp()
+
+        crawler = KisedCrawler()
+        crawler.fetch = fetch
+        articles = [_article(n, host="a.example") for n in range(6)] + [_article(n, host="b.example") for n in range(6, 12)]
+
+        assert enrich(articles, {crawler.name: crawler}, max_workers=6, per_host=2, cache=None) == 12
+        assert peak == {"a.example": 2, "b.example": 2}
+
+    def test_cache_avoids_refetch(self, tmp_path):
+        cache = DetailCache(str(tmp_path))
+        crawler = self._crawler()
+        enrich([_article(1)], {crawler.name: crawler}, cache=cache)
+
+        article = _article(1)
+        assert enrich([article], {crawler.name: crawler}, cache=cache) == 1
+        assert crawler.fetch.call_count == 1
+        assert article.extra["agency"] == "창업진흥원"
+
+    def test_cache_expires(self, tmp_path):
+        cache = DetailCache(str(tmp_path), ttl=10)
+        cache.put("u", "p", {"date": "2026-02-03"}, now=100)
+        assert cache.get("u", "p", now=105) == {"date": "2026-02-03"}
+        assert cache.get("u", "p", now=111) is None
+
+    def test_prune_removes_expired_files(self, tmp_path):
+        cache = DetailCache(str(tmp_path), ttl=10)
+        cache.put("old", "p", {})
+        cache.put("new", "p", {})
+        os.utime(cache.path("old"), (0, 0))
+
+        assert cache.prune() == 1
+        assert cache.get("old", "p") is None
+        assert cache.get("new", "p") == {}
+        assert cache.get("u", "other", now=105) is None
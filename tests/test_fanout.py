@@ -0,0 +1,47 @@
+"""전송 대상 설정과 동시 전송 테스트."""
+
+import json
+import threading
+
+from src.fanout import Destination, fan_out, parse_destinations
+from src.processor import CAT_NEWS, CAT_URGENT
+
+
+class TestParseDestinations:
+    def test_parses_entries(self):
+        raw = json.dumps(
+            [
+                {"name": "team", "token": "xoxb", "channel": "C1"},
+                {"webhook": "https://hooks.slack.com/x", "categories": ["news", CAT_URGENT, "bogus"]},
+            ]
+        )
+        team, hook = parse_destinations(raw)
+        assert team.uses_bot and team.categories == ()
+        assert hook.name == "dest2"
+        assert not hook.uses_bot
+        assert hook.categories == (CAT_NEWS, CAT_URGENT)
+
+    def test_skips_invalid_entries(self):
+        raw = json.dumps([{"name": "a", "channel": "C1"}, {"name": "b", "webhook": "x"}, {"name": "b", "webhook": "y"}])
+        assert [d.name for d in parse_destinations(raw)] == ["b"]
+
+    def test_bad_json(self):
+        assert parse_destinations("{") == []
+
+
+class TestFanOut:
+    def test_runs_concurrently_and_keeps_order(self):
+        barrier = threading.Barrier(3, timeout=2)
+
+        def send(dest):
+            barrier.wait()  # 셋이 동시에 실행되지 않으면 타임아웃
+            return dest.name != "b"
+
+        destinations = [Destination(n, webhook="x") for n in "abc"]
+        assert fan_out(destinations, send, max_workers=3) == {"a": True, "b": False, "c": True}
+
+    def test_exception_marks_failure(self):
+        def send(dest):
+            raise RuntimeError("boom")
+
+        assert fan_out([Destination("a", webhook="x")], send) == {"a": False}
@@ -0,0 +1,27 @@
+"""파일 쓰기 도우미 테스트."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.fsutil import write_atomic
+
+
+class TestWriteAtomic:
+    def test_writes_text_and_bytes(self, tmp_path):
+        path = tmp_path / "sub" / "state.json"
+        write_atomic(str(path), "한글")
+        assert path.read_text(encoding="utf-8") == "한글"
+
+        write_atomic(str(path), b"\x00\x01")
+        assert path.read_bytes() == b"\x00\x01"
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_failed_replace_keeps_old_file(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text("old", encoding="utf-8")
+
+        with patch("src.fsutil.os.replace", side_effect=OSError("disk full")), pytest.raises(OSError):
+            write_atomic(str(path), "new")
+        assert path.read_text(encoding="utf-8") == "old"
+        assert list(tmp_path.iterdir()) == [path]
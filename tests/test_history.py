@@ -0,0 +1,74 @@
+"""전송 이력 저장소 단위 테스트."""
+
+import json
+import time
+
+from src.crawlers.base import Article
+from src.history import HistoryStore
+
+
+def _article(url: str, source: str = "K-Startup") -> Article:
+    return Article(title="t", url=url, source=source, date="2026-02-10", category="📋 신규 공고")
+
+
+class TestHistoryStore:
+    def test_membership(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.db"), legacy_file=None)
+        store.add([_article("https://example.com/1")])
+        assert "https://example.com/1" in store
+        assert "https://example.com/2" not in store
+        assert len(store) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "h.db")
+        store = HistoryStore(path, legacy_file=None)
+        store.add([_article("https://example.com/1")])
+        store.close()
+
+        reopened = HistoryStore(path, legacy_file=None)
+        assert "https://example.com/1" in reopened
+        assert not (tmp_path / "h.db-wal").exists() or (tmp_path / "h.db-wal").stat().st_size == 0
+
+    def test_records_metadata(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.db"), legacy_file=None)
+        store.add([_article("https://example.com/1", source="기업마당")], sent_at=1_700_000_000)
+        row = store._conn.execute("SELECT url, source, category, sent_at FROM sent").fetchone()
+        assert row == ("https://example.com/1", "기업마당", "📋 신규 공고", 1_700_000_000)
+
+    def test_evicts_by_sent_time_not_url_order(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.db"), retention_days=30, legacy_file=None)
+        now = time.time()
+        # 알파벳 순으로는 뒤지만 오래된 항목
+        store.add([_article("https://example.com/zzz")], sent_at=now - 40 * 86400)
+        store.add([_article("https://example.com/aaa")], sent_at=now)
+
+        assert store.evict(now) == 1
+        assert "https://example.com/aaa" in store
+        assert "https://example.com/zzz" not in store
+
+    def test_imports_legacy_json_once(self, tmp_path):
+        legacy = tmp_path / "sent_history.json"
+        legacy.write_text(json.dumps(["https://example.com/old"]), encoding="utf-8")
+        path = str(tmp_path / "h.db")
+
+        store = HistoryStore(path, legacy_file=str(legacy))
+        assert "https://example.com/old" in store
+        store.close()
+
+        legacy.write_text(json.dumps(["https://example.com/other"]), encoding="utf-8")
+        reopened = HistoryStore(path, legacy_file=str(legacy))
+        assert "https://example.com/other" not in reopened
+
+    def test_matches_equivalent_urls(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.db"), legacy_file=None)
+        store.add([_article("https://www.example.com/news/1?utm_source=slack")])
+        assert "http://example.com/news/1/" in store
+
+    def test_marks_only_move_forward(self, tmp_path):
+        path = str(tmp_path / "h.db")
+        store = HistoryStore(path, legacy_file=None)
+        store.set_marks({"K-Startup": 176500, "기업마당": None})
+        store.set_marks({"K-Startup": 176400})
+        store.close()
+
+        assert HistoryStore(path, legacy_file=None).get_marks() == {"K-Startup": 176500}
@@ -0,0 +1,153 @@
+"""조건부 요청 캐시 테스트 (로컬 스텁 HTTP 서버 사용)."""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.archive import PageArchive
+from src.crawlers.base import Article, BaseCrawler
+from src.httpcache import HttpCache
+from src.ratelimit import RateLimiter
+
+PAGE = "<ul><li>첫 번째 공고</li><li>두 번째 공고</li></ul>".encode("utf-8")
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: list[str] = []
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == ETAG:
+            self.hits.append("304")
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.hits.append("200")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.hits = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def _make_crawler(cache: HttpCache, base_url: str, archive: PageArchive | None):
+    parsed: list[int] = []
+
+    class StubCrawler(BaseCrawler):
+        name = "stub"
+        rate_limiter = RateLimiter(rate=0, burst=1)
+        http_cache = cache
+
+        def crawl(self) -> list[Article]:
+            resp = self.fetch(f"{base_url}/list.do", params={"page": "1"})
+            return self.parse_cached(resp, self._parse_list)
+
+        def _parse_list(self, resp) -> list[Article]:
+            parsed.append(1)
+            resp.encoding = "utf-8"
+            titles = [t.split("</li>")[0] for t in resp.text.split("<li>")[1:]]
+            return [Article(title=t, url=f"{base_url}/{i}", source=self.name, date="2026-02-10") for i, t in enumerate(titles)]
+
+    crawler = StubCrawler()
+    crawler.archive = archive
+    return crawler, parsed
+
+
+class TestHttpCache:
+    def test_second_run_reuses_parsed_articles(self, server, tmp_path):
+        cache = HttpCache(str(tmp_path))
+        crawler, parsed = _make_crawler(cache, server, PageArchive(str(tmp_path / "archive")))
+
+        first = crawler.crawl()
+        second = crawler.crawl()
+
+        assert _Handler.hits == ["200", "304"]
+        assert len(parsed) == 1
+        assert [a.title for a in second] == [a.title for a in first] == ["첫 번째 공고", "두 번째 공고"]
+
+    def test_fresh_archive_reuses_cached_parse(self, server, tmp_path):
+        # 보관소가 비어 있어도 (새 러너) 304이면 HTTP 캐시에 저장된 파싱 결과를 쓴다
+        cache = HttpCache(str(tmp_path))
+        crawler, parsed = _make_crawler(cache, server, PageArchive(str(tmp_path / "archive")))
+        crawler.crawl()
+
+        crawler.archive = PageArchive(str(tmp_path / "fresh"))
+        second = crawler.crawl()
+
+        assert _Handler.hits == ["200", "304"]
+        assert len(parsed) == 1
+        assert [a.title for a in second] == ["첫 번째 공고", "두 번째 공고"]
+
+    def test_cached_parse_is_keyed_by_mark(self, server, tmp_path):
+        cache = HttpCache(str(tmp_path))
+        crawler, parsed = _make_crawler(cache, server, None)
+        crawler.crawl()
+
+        crawler.mark = 5
+        crawler.crawl()
+        assert len(parsed) == 2
+
+    def test_prune_keeps_recently_revalidated_entries(self, server, tmp_path):
+        cache = HttpCache(str(tmp_path), retention_days=1)
+        crawler, _ = _make_crawler(cache, server, None)
+        crawler.fetch(f"{server}/list.do")
+        crawler.fetch(f"{server}/other.do")
+        for path in tmp_path.glob("*.json"):
+            os.utime(path, (0, 0))
+
+        crawler.fetch(f"{server}/list.do")  # 304 — 최근에 쓴 항목이 된다
+        assert cache.prune() == 1
+        assert cache.get(f"{server}/list.do") is not None
+        assert cache.get(f"{server}/other.do") is None
+        assert len(list(tmp_path.glob("*.body"))) == 1
+
+    def test_304_returns_cached_body(self, server, tmp_path):
+        cache = HttpCache(str(tmp_path))
+        crawler, _ = _make_crawler(cache, server, PageArchive(str(tmp_path / "archive")))
+
+        crawler.fetch(f"{server}/list.do")
+        resp = crawler.fetch(f"{server}/list.do")
+
+        assert resp.status_code == 200
+        assert resp.from_cache is True
+        assert resp.content == PAGE
+
+    def test_parser_version_change_reparses(self, server, tmp_path):
+        cache = HttpCache(str(tmp_path))
+        crawler, parsed = _make_crawler(cache, server, PageArchive(str(tmp_path / "archive")))
+        crawler.crawl()
+
+        crawler.parse_version = 2
+        crawler.crawl()
+
+        assert _Handler.hits == ["200", "304"]
+        assert len(parsed) == 2
+
+    def test_missing_body_refetches(self, server, tmp_path):
+        cache = HttpCache(str(tmp_path))
+        crawler, _ = _make_crawler(cache, server, PageArchive(str(tmp_path / "archive")))
+        crawler.fetch(f"{server}/list.do")
+        for path in tmp_path.glob("*.body"):
+            path.unlink()
+
+        resp = crawler.fetch(f"{server}/list.do")
+
+        assert _Handler.hits == ["200", "304", "200"]
+        assert resp.content == PAGE
@@ -0,0 +1,95 @@
+"""학습한 행 선택자와 레이아웃 변화 감지 테스트."""
+
+from types import SimpleNamespace
+
+from src.crawlers import MSSCrawler
+from src.crawlers.layout import LayoutStore, PageLayout
+from src.metrics import metrics
+from tests.test_parsing import MSS_HTML, _resp
+
+GENERIC = "table tbody tr"
+
+
+class _Soup:
+    """선택자별 결과를 정해 두고 호출된 선택자를 기록하는 가짜 soup."""
+
+    def __init__(self, matches: dict[str, list]):
+        self.matches = matches
+        self.calls: list[str] = []
+
+    def select(self, selector: str) -> list:
+        self.calls.append(selector)
+        return self.matches.get(selector, [])
+
+
+def _rows(n: int, cols: int = 3) -> list:
+    return [SimpleNamespace(select=lambda sel: [None] * cols) for _ in range(n)]
+
+
+def _crawler(tmp_path) -> tuple[MSSCrawler, LayoutStore]:
+    store = LayoutStore(str(tmp_path / "layout.json"))
+    crawler = MSSCrawler()
+    crawler.layout_store = store
+    return crawler, store
+
+
+class TestSelectorMemory:
+    def test_tries_learned_selector_first(self, tmp_path):
+        crawler, store = _crawler(tmp_path)
+        store.observe(crawler.name, PageLayout(GENERIC, 10, 3, 1.0))
+        soup = _Soup({GENERIC: _rows(10)})
+
+        assert len(crawler._find_rows(soup)) == 10
+        assert soup.calls == [GENERIC]
+
+    def test_falls_back_when_learned_selector_misses(self, tmp_path):
+        crawler, store = _crawler(tmp_path)
+        store.observe(crawler.name, PageLayout("table.bbs_list tbody tr", 10, 3, 1.0))
+        soup = _Soup({GENERIC: _rows(10)})
+
+        assert len(crawler._find_rows(soup)) == 10
+        assert soup.calls[0] == "table.bbs_list tbody tr"
+        assert crawler.layout == PageLayout(GENERIC, 10, 3)
+
+    def test_learned_selector_persists(self, tmp_path):
+        crawler, store = _crawler(tmp_path)
+        store.observe(crawler.name, PageLayout(GENERIC, 10, 3, 1.0))
+        assert LayoutStore(store.path).selector(crawler.name) == GENERIC
+
+
+class TestLayoutDrift:
+    def test_stable_layout(self, tmp_path):
+        store = LayoutStore(str(tmp_path / "layout.json"))
+        store.observe("s", PageLayout("table.boardList tbody tr", 10, 5, 1.0))
+        assert store.observe("s", PageLayout("table.boardList tbody tr", 9, 5, 0.9)) == []
+
+    def test_detects_sharp_changes(self, tmp_path):
+        metrics.reset()
+        store = LayoutStore(str(tmp_path / "layout.json"))
+        store.observe("s", PageLayout("table.boardList tbody tr", 10, 5, 1.0))
+
+        reasons = store.observe("s", PageLayout(GENERIC, 2, 7, 0.5))
+        assert len(reasons) == 4
+        assert metrics.counter("layout_drift", source="s") == 1
+        # 바뀐 구조가 새 기준이 된다
+        assert store.observe("s", PageLayout(GENERIC, 2, 7, 0.5)) == []
+
+    def test_empty_page_is_not_baseline(self, tmp_path):
+        metrics.reset()
+        store = LayoutStore(str(tmp_path / "layout.json"))
+        store.observe("s", PageLayout("table.boardList tbody tr", 10, 5, 1.0))
+
+        assert store.observe("s", PageLayout("", 0)) != []
+        assert store.observe("s", PageLayout("", 0)) != []
+        assert store.get("s").rows == 10
+        assert metrics.counter("layout_drift", source="s") == 2
+
+    def test_crawl_records_first_page(self, tmp_path):
+        crawler, store = _crawler(tmp_path)
+        crawler.http_cache = None
+        crawler.archive = None
+        crawler.max_pages = 1
+        crawler._fetch_page = lambda page: _resp(MSS_HTML)
+
+        assert len(crawler.crawl()) == 1
+        assert store.get(crawler.name) == PageLayout("table.boardList tbody tr", 1, 3, 1.0)
@@ -0,0 +1,178 @@
+"""메인 수집 흐름 단위 테스트."""
+
+import threading
+import time
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from src.crawlers.base import Article, BaseCrawler, start_run
+from src.main import collect_all, load_crawlers, parse_args, stream, stream_all
+
+
+def _make_crawler(
+    name: str,
+    delay: float = 0.0,
+    fail: bool = False,
+    barrier: threading.Barrier | None = None,
+) -> type[BaseCrawler]:
+    class _Crawler(BaseCrawler):
+        def crawl(self) -> list[Article]:
+            time.sleep(delay)
+            if barrier is not None:
+                barrier.wait(5)
+            if fail:
+                raise RuntimeError("boom")
+            return [Article(title=name, url=f"https://example.com/{name}", source=name, date="2026-02-10")]
+
+    _Crawler.name = name
+    return _Crawler
+
+
+class TestCollectAll:
+    def test_keeps_crawler_order(self):
+        crawlers = [_make_crawler("slow", delay=0.2), _make_crawler("fast")]
+        with patch("src.main.CRAWLERS", crawlers):
+            articles = collect_all(max_workers=2, deadline=5)
+        assert [a.source for a in articles] == ["slow", "fast"]
+
+    def test_runs_concurrently(self):
+        # 넷이 동시에 돌지 않으면 barrier가 깨져 모두 실패한다
+        barrier = threading.Barrier(4)
+        crawlers = [_make_crawler(f"c{i}", barrier=barrier) for i in range(4)]
+        with patch("src.main.CRAWLERS", crawlers):
+            articles = collect_all(max_workers=4, deadline=10)
+        assert len(articles) == 4
+
+    def test_hung_source_does_not_block_others(self):
+        release = threading.Event()
+        finished = threading.Event()
+
+        class Hung(BaseCrawler):
+            name = "hung"
+
+            def crawl(self) -> list[Article]:
+                release.wait(5)
+                finished.set()
+                return [Article(title="late", url="u", source="hung", date="2026-02-10")]
+
+        with patch("src.main.CRAWLERS", [Hung, _make_crawler("ok")]):
+            articles = collect_all(max_workers=2, deadline=0.2)
+        returned_early = not finished.is_set()
+        release.set()
+
+        assert [a.source for a in articles] == ["ok"]
+        assert returned_early
+
+    def test_failing_source_is_skipped(self):
+        with patch("src.main.CRAWLERS", [_make_crawler("bad", fail=True), _make_crawler("ok")]):
+            articles = collect_all(max_workers=2, deadline=5)
+        assert [a.source for a in articles] == ["ok"]
+
+    def test_runs_selected_sources_only(self):
+        with patch("src.main.CRAWLERS", [_make_crawler("a"), _make_crawler("b")]):
+            articles = collect_all(sources=[_make_crawler("c")])
+        assert [a.source for a in articles] == ["c"]
+
+
+class _PagedSource(BaseCrawler):
+    """배치(페이지)를 하나씩 내보내는 테스트용 크롤러. gate가 있으면 첫 배치 뒤에 기다린다."""
+
+    name = "paged"
+
+    def __init__(self, pages: int = 3, gate: threading.Event | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.gate = gate
+        self.produced = 0
+
+    def crawl(self) -> list[Article]:
+        return [a for batch in self.iter_batches() for a in batch]
+
+    def iter_batches(self):
+        for page in range(self.pages):
+            if page == 1 and self.gate is not None:
+                self.gate.wait(5)
+            self.produced += 1
+            self.new_mark = page
+            yield [Article(title=f"p{page}", url=f"https://example.com/{page}", source=self.name, date="2026-02-10")]
+
+
+class TestStream:
+    def test_yields_batches_before_source_finishes(self):
+        gate = threading.Event()
+        events = stream([_PagedSource(gate=gate)], max_workers=1, deadline=5)
+
+        idx, batch = next(events)
+        assert [a.title for a in batch] == ["p0"]
+        gate.set()
+        assert [b and b[0].title for _, b in events] == ["p1", "p2", None]
+
+    def test_bounded_queue_holds_back_crawler(self):
+        source = _PagedSource(pages=20)
+        events = stream([source], max_workers=1, deadline=5, maxsize=2)
+        next(events)
+        time.sleep(0.3)
+        # 소비한 1개 + 큐 2개 + 넣으려고 기다리는 1개
+        assert source.produced <= 4
+        assert sum(1 for _, b in events if b is not None) == 19
+
+    def test_slow_consumer_does_not_expire_source(self):
+        # 소비하는 쪽이 배치마다 오래 걸려도 (상세 페이지 보강 등) 큐를 기다린 시간은 마감에 넣지 않는다
+        events = stream([_PagedSource(pages=5)], max_workers=1, deadline=0.3, maxsize=1)
+        batches = []
+        for _, batch in events:
+            batches.append(batch)
+            time.sleep(0.15)
+        assert [b and b[0].title for b in batches] == ["p0", "p1", "p2", "p3", "p4", None]
+
+    def test_stream_all_updates_marks_of_finished_sources(self):
+        release = threading.Event()
+
+        class Hung(_PagedSource):
+            name = "hung"
+
+            def __init__(self, **kwargs):
+                super().__init__(gate=release, **kwargs)
+
+        marks: dict[str, int] = {}
+        with patch("src.main.CRAWLERS", [_PagedSource, Hung]):
+            sources = [a.source for batch in stream_all(max_workers=2, deadline=0.3, marks=marks) for a in batch]
+        release.set()
+
+        # 멈춘 소스도 이미 받은 배치는 쓰지만 mark는 갱신하지 않는다
+        assert sorted(sources) == ["hung", "paged", "paged", "paged"]
+        assert marks == {"paged": 2}
+
+
+class TestLoadCrawlers:
+    def test_resolves_names_and_classes(self):
+        custom = _make_crawler("custom")
+        classes = load_crawlers(["NaverNewsCrawler", custom])
+        assert [c.__name__ for c in classes] == ["NaverNewsCrawler", "_Crawler"]
+        assert classes[1] is custom
+
+
+class TestParseArgs:
+    def test_defaults_to_all_sources(self):
+        args = parse_args([])
+        assert [s.key for s in args.specs] == ["kstartup", "mss", "kised", "bizinfo", "naver"]
+        assert args.lookback_days is None
+
+    def test_sources_and_exclude(self):
+        args = parse_args(["--sources", "kstartup, 네이버뉴스,mss", "--exclude", "mss"])
+        assert [s.key for s in args.specs] == ["kstartup", "naver"]
+
+    def test_since_days_or_date(self):
+        start_run(date(2026, 2, 10))
+        try:
+            assert parse_args(["--since", "14"]).lookback_days == 14
+            assert parse_args(["--since", "2026-02-01"]).lookback_days == 10
+        finally:
+            start_run()
+
+    @pytest.mark.parametrize("argv", [["--sources", "unknown"], ["--since", "yesterday"], ["--exclude", "kstartup,mss,kised,bizinfo,naver"]])
+    def test_rejects_invalid(self, argv):
+        with pytest.raises(SystemExit):
+            parse_args(argv)
@@ -0,0 +1,71 @@
+"""실행 지표 테스트."""
+
+import json
+import threading
+
+import pytest
+
+from src.metrics import Metrics
+
+
+@pytest.fixture
+def m():
+    return Metrics()
+
+
+class TestMetrics:
+    def test_span_records_count_total_max(self, m):
+        m.observe("fetch", 0.5, source="a")
+        m.observe("fetch", 1.5, source="a")
+        m.observe("fetch", 2.0, source="b")
+        spans = {s["labels"]["source"]: s for s in m.report()["spans"]}
+        assert spans["a"]["count"] == 2
+        assert spans["a"]["seconds"] == pytest.approx(2.0)
+        assert spans["a"]["max"] == pytest.approx(1.5)
+        assert m.span_total("fetch") == pytest.approx(4.0)
+        assert m.span_total("fetch", source="b") == pytest.approx(2.0)
+
+    def test_span_recorded_on_error(self, m):
+        with pytest.raises(ValueError):
+            with m.span("parse"):
+                raise ValueError
+        assert m.report()["spans"][0]["count"] == 1
+
+    def test_drain_and_merge(self, m):
+        m.observe("parse", 1.0, source="a")
+        m.incr("selector_misses", 2, source="a")
+        recorded = m.drain()
+        assert m.report()["spans"] == [] and m.report()["counters"] == []
+
+        m.observe("parse", 3.0, source="a")
+        m.merge(*recorded)
+        m.merge(*recorded)
+        spans = m.report()["spans"]
+        assert spans[0]["count"] == 3 and spans[0]["seconds"] == pytest.approx(5.0) and spans[0]["max"] == 3.0
+        assert m.counter("selector_misses", source="a") == 4
+
+    def test_counters_thread_safe(self, m):
+        def work():
+            for _ in range(1000):
+                m.incr("requests", source="x")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert m.counter("requests", source="x") == 4000
+
+    def test_write_json_and_prometheus(self, m, tmp_path):
+        m.incr("bytes_downloaded", 1024, source='K"Startup')
+        m.observe("process", 0.25)
+        json_path, prom_path = tmp_path / "run.json", tmp_path / "sub" / "digest.prom"
+        m.write(str(json_path), str(prom_path))
+
+        report = json.loads(json_path.read_text(encoding="utf-8"))
+        assert report["counters"] == [{"name": "bytes_downloaded", "labels": {"source": 'K"Startup'}, "value": 1024}]
+
+        prom = prom_path.read_text(encoding="utf-8")
+        assert 'startup_digest_bytes_downloaded{source="K\\"Startup"} 1024' in prom
+        assert 'startup_digest_span_seconds{span="process"} 0.25' in prom
+        assert "# TYPE startup_digest_span_count gauge" in prom
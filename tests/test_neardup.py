@@ -0,0 +1,55 @@
+"""근사 중복 탐지 단위 테스트."""
+
+from src.neardup import LSHIndex, normalize_title, numbers, signature, similarity
+
+
+class TestNormalizeTitle:
+    def test_strips_tags_punctuation_and_spaces(self):
+        assert normalize_title("[속보] 중기부, 창업 지원 확대!") == "중기부창업지원확대"
+
+    def test_fullwidth_is_folded(self):
+        assert normalize_title("ＡＩ 스타트업") == normalize_title("AI 스타트업")
+
+
+class TestSignature:
+    def test_identical_titles(self):
+        assert similarity(signature("창업 지원사업 공고"), signature("창업 지원사업 공고")) == 1.0
+
+    def test_rewritten_title_is_similar(self):
+        a = signature("중기부, 창업기업 지원 3000억 투입")
+        b = signature("[속보] 중기부, 창업기업 지원에 3000억 투입")
+        assert similarity(a, b) >= 0.6
+
+    def test_unrelated_titles(self):
+        a = signature("창업 지원사업 통합공고")
+        b = signature("수출바우처 사업 참여기업 모집")
+        assert similarity(a, b) < 0.2
+
+
+class TestLSHIndex:
+    def test_finds_near_duplicate(self):
+        index = LSHIndex(threshold=0.6)
+        title = "2026년 예비창업패키지 예비창업자 모집 공고"
+        index.insert("a", signature(title), numbers(title))
+        other = "2026년도 예비창업패키지 예비창업자 모집공고"
+        assert index.query(signature(other), numbers(other)) == "a"
+
+    def test_different_numbers_are_not_duplicates(self):
+        index = LSHIndex(threshold=0.6)
+        index.insert("a", signature("2026년 예비창업패키지 1차 모집"), numbers("2026년 예비창업패키지 1차 모집"))
+        title = "2026년 예비창업패키지 2차 모집"
+        assert index.query(signature(title), numbers(title)) is None
+
+    def test_unrelated_is_none(self):
+        index = LSHIndex(threshold=0.6)
+        index.insert("a", signature("창업 지원사업 통합공고"))
+        assert index.query(signature("수출바우처 사업 참여기업 모집")) is None
+
+    def test_removed_key_is_not_found(self):
+        index = LSHIndex(threshold=0.6)
+        title = "2026년 예비창업패키지 예비창업자 모집 공고"
+        index.insert("a", signature(title), numbers(title))
+        index.remove("a")
+        index.remove("a")  # 없는 키는 무시
+        assert len(index) == 0
+        assert index.query(signature(title), numbers(title)) is None
@@ -1,10 +1,30 @@
 """Slack 노티파이어 단위 테스트."""
 
+import json
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.crawlers.base import Article
-from src.notifier import _build_main_message, _build_thread_message, send_slack
+from src.notifier import (
+    MAX_BLOCKS,
+    SECTION_CHARS,
+    _build_main_message,
+    _build_thread_chunks,
+    resume_slack,
+    send_slack,
+)
 from src.processor import CAT_NEWS, CAT_NEW, CAT_URGENT
+from tests.conftest import slack_error
+
+
+@pytest.fixture(autouse=True)
+def slack_state(tmp_path):
+    """전송 상태 파일을 임시 경로로. 테스트마다 WebClient를 새로 만든다."""
+    path = tmp_path / "slack_state.json"
+    with patch("src.notifier.SLACK_STATE_FILE", str(path)), patch.dict("src.notifier._clients", clear=True):
+        yield path
 
 
 def _sample_data() -> dict[str, list[Article]]:
@@ -74,15 +94,75 @@ class TestBuildMainMessage:
         msg = _build_main_message(data)
         assert "외 2건" in msg
 
+    def test_shows_top_scored(self):
+        data = {
+            CAT_NEW: [
+                Article(
+                    title=f"공고 {i}",
+                    url=f"https://example.com/{i}",
+                    source="K-Startup",
+                    date="2026-02-10",
+                    category=CAT_NEW,
+                    extra={"score": 9 if i == 11 else 2},
+                )
+                for i in range(12)
+            ]
+        }
+        msg = _build_main_message(data)
+        assert "공고 11>" in msg
+        assert "공고 10>" not in msg
+
+
+def _many(n: int, category: str = CAT_NEW) -> dict[str, list[Article]]:
+    return {
+        category: [
+            Article(
+                title=f"2026년 창업 지원 공고 {i} " + "가" * 40,
+                url=f"https://example.com/{i}",
+                source="K-Startup",
+                date="2026-02-10",
+                category=category,
+            )
+            for i in range(n)
+        ]
+    }
+
 
-class TestBuildThreadMessage:
+class TestBuildThreadChunks:
     def test_contains_all_articles(self):
-        msg = _build_thread_message(_sample_data())
+        msg = "\n".join(m["text"] for m in _build_thread_chunks(_sample_data()))
         assert "전체 목록" in msg
         assert "마감 임박 공고" in msg
         assert "신규 공고" in msg
         assert "중기부 정책 발표" in msg
 
+    def test_small_digest_is_one_message(self):
+        chunks = _build_thread_chunks(_sample_data())
+        assert len(chunks) == 1
+        assert "중기부 정책 발표" in chunks[0]["text"]
+        assert chunks[0]["blocks"][-1]["type"] == "context"
+
+    def test_splits_within_limits(self):
+        chunks = _build_thread_chunks(_many(600), max_chars=10000)
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(chunk["blocks"]) <= MAX_BLOCKS
+            sections = [b["text"]["text"] for b in chunk["blocks"] if b["type"] == "section"]
+            assert all(len(t) <= SECTION_CHARS for t in sections)
+            assert sum(map(len, sections)) <= 10000
+        text = "".join(c["text"] for c in chunks)
+        assert all(f"공고 {i} " in text for i in range(600))
+        assert "(계속)" in chunks[1]["text"]
+
+    def test_long_title_keeps_link_closed(self):
+        article = Article(title="긴 제목 " * 1000, url="https://example.com/long", source="K-Startup", date="", category=CAT_NEW)
+        section = _build_thread_chunks({CAT_NEW: [article]})[0]["blocks"][1]["text"]["text"]
+        line = section.split("\n", 1)[1]
+        assert len(line) <= SECTION_CHARS // 2
+        assert line.startswith("• <https://example.com/long|긴 제목")
+        assert "…>" in line
+        assert line.endswith("K-Startup")
+
 
 class TestSendSlack:
     def test_empty_data_returns_true(self):
@@ -102,7 +182,7 @@ class TestSendSlack:
     @patch("src.notifier.SLACK_BOT_TOKEN", "")
     @patch("src.notifier.SLACK_CHANNEL_ID", "")
     @patch("src.notifier.SLACK_WEBHOOK_URL", "https://hooks.slack.com/test")
-    @patch("src.notifier.requests.post")
+    @patch("src.notifier.http.post")
     def test_webhook_fallback(self, mock_post):
         mock_post.return_value = MagicMock(status_code=200)
         mock_post.return_value.raise_for_status = MagicMock()
@@ -114,3 +194,133 @@ class TestSendSlack:
     @patch("src.notifier.SLACK_WEBHOOK_URL", "")
     def test_no_config_fails(self):
         assert send_slack(_sample_data()) is False
+
+    @patch("src.notifier.SLACK_BOT_TOKEN", "xoxb-test")
+    @patch("src.notifier.SLACK_CHANNEL_ID", "C123")
+    @patch("src.notifier.WebClient")
+    def test_bot_splits_large_thread(self, MockClient):
+        mock_client = MagicMock()
+        mock_client.chat_postMessage.return_value = {"ts": "1234.5678"}
+        MockClient.return_value = mock_client
+
+        with patch("src.delivery.time.sleep"):
+            assert send_slack(_many(600)) is True
+        calls = mock_client.chat_postMessage.call_args_list
+        assert len(calls) > 2
+        assert "thread_ts" not in calls[0].kwargs
+        assert all(c.kwargs["thread_ts"] == "1234.5678" and c.kwargs["blocks"] for c in calls[1:])
+
+    @patch("src.notifier.SLACK_BOT_TOKEN", "xoxb-test")
+    @patch("src.notifier.SLACK_CHANNEL_ID", "C123")
+    @patch("src.notifier.WebClient")
+    def test_join_state_is_cached(self, MockClient):
+        mock_client = MagicMock()
+        mock_client.chat_postMessage.return_value = {"ts": "1234.5678"}
+        MockClient.return_value = mock_client
+
+        assert send_slack(_sample_data()) is True
+        assert send_slack(_sample_data()) is True
+        assert mock_client.conversations_join.call_count == 1
+
+
+    @patch("src.notifier.SLACK_BOT_TOKEN", "xoxb-test")
+    @patch("src.notifier.SLACK_CHANNEL_ID", "C123")
+    @patch("src.notifier.WebClient")
+    def test_resumes_pending_thread_without_new_news(self, MockClient):
+        mock_client = MagicMock()
+
+        def post(**kwargs):
+            if "thread_ts" in kwargs:
+                raise slack_error("internal_error")
+            return {"ts": "1.0"}
+
+        mock_client.chat_postMessage.side_effect = post
+        MockClient.return_value = mock_client
+        with patch("src.delivery.time.sleep"):
+            assert send_slack(_sample_data()) is False
+
+        mock_client.chat_postMessage.side_effect = None
+        mock_client.chat_postMessage.return_value = {"ts": "2.0"}
+        mock_client.chat_postMessage.reset_mock()
+        assert resume_slack() is True
+        calls = mock_client.chat_postMessage.call_args_list
+        assert len(calls) == 1 and calls[0].kwargs["thread_ts"] == "1.0"
+        # 남은 작업이 없으면 아무것도 보내지 않는다
+        assert resume_slack() is True
+        assert mock_client.chat_postMessage.call_count == 1
+
+    @patch("src.notifier.http.post")
+    @patch("src.notifier.WebClient")
+    def test_webhook_fallback_drops_journalled_job(self, MockClient, mock_post, slack_state):
+        from src.fanout import Destination
+
+        # 지난 실행에서 남은 작업이 재시도할 수 없는 오류로 실패하면 이번 작업은 Webhook으로 보낸다
+        old = {"id": "old", "channel": "C123", "messages": [{"text": "old"}], "sent": 0, "thread_ts": None}
+        slack_state.write_text(json.dumps({"joined": ["C123"], "jobs": [{**old, "created": time.time()}]}))
+        mock_client = MagicMock()
+        mock_client.chat_postMessage.side_effect = slack_error("channel_not_found")
+        MockClient.return_value = mock_client
+        dest = Destination("default", token="xoxb-test", channel="C123", webhook="https://hooks.slack.com/x")
+
+        assert send_slack(_sample_data(), [dest]) is True
+        mock_post.assert_called_once()
+        assert json.loads(slack_state.read_text())["jobs"] == []
+
+        # 다음 실행에서 같은 다이제스트를 봇으로 다시 보내지 않는다
+        mock_client.chat_postMessage.reset_mock()
+        assert resume_slack([dest]) is True
+        mock_client.chat_postMessage.assert_not_called()
+
+
+class TestFanOut:
+    @patch("src.notifier.http.post")
+    @patch("src.notifier.WebClient")
+    def test_renders_once_and_reuses_clients(self, MockClient, mock_post):
+        from src.fanout import Destination
+
+        mock_client = MagicMock()
+        mock_client.chat_postMessage.return_value = {"ts": "1.0"}
+        MockClient.return_value = mock_client
+        destinations = [
+            Destination("a", token="xoxb-1", channel="C1"),
+            Destination("b", token="xoxb-1", channel="C2"),
+            Destination("news", webhook="https://hooks.slack.com/x", categories=(CAT_NEWS,)),
+        ]
+
+        with patch("src.notifier._build_main_message", wraps=_build_main_message) as build:
+            assert send_slack(_sample_data(), destinations) is True
+        assert build.call_count == 2  # 전체 + 정책 동향
+        MockClient.assert_called_once_with(token="xoxb-1")
+        channels = {c.kwargs["channel"] for c in mock_client.chat_postMessage.call_args_list}
+        assert channels == {"C1", "C2"}
+        text = mock_post.call_args.kwargs["json"]["text"]
+        assert "중기부 정책 발표" in text and "마감 임박 공고" not in text
+
+    @patch("src.notifier.http.post")
+    def test_failing_destination_does_not_block_others(self, mock_post):
+        import threading
+
+        import requests
+
+        from src.fanout import Destination
+
+        done = threading.Event()
+        overlapped = []
+
+        def post(url, **kwargs):
+            if url.endswith("slow"):
+                # 대상별로 동시에 보내면 느린 대상이 끝나기 전에 빠른 대상이 끝난다
+                overlapped.append(done.wait(5))
+            if url.endswith("bad"):
+                raise requests.ConnectionError("down")
+            if url.endswith("fast"):
+                done.set()
+            return MagicMock()
+
+        mock_post.side_effect = post
+        destinations = [
+            Destination(name, webhook=f"https://hooks.slack.com/{name}") for name in ("slow", "bad", "fast")
+        ]
+        assert send_slack(_sample_data(), destinations) is False
+        assert done.is_set()
+        assert overlapped == [True]
@@ -0,0 +1,76 @@
+"""파서 프로세스 풀 테스트."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.crawlers import KisedCrawler, KStartupCrawler, MSSCrawler, parsepool
+from src.crawlers.base import Article, start_run
+from src.crawlers.layout import LayoutStore, PageLayout
+from src.crawlers.parsepool import RawPage
+from src.metrics import metrics
+
+from .test_parsing import KISED_HTML, KSTARTUP_HTML, MSS_HTML
+
+
+def _resp(html: str):
+    return SimpleNamespace(text=html, content=html.encode("utf-8"), encoding="utf-8", apparent_encoding="utf-8", url="")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def parser_pool():
+    parsepool.pool(2)
+    yield
+    parsepool.shutdown()
+
+
+class TestParsePool:
+    @pytest.mark.parametrize("crawler_cls, html", [(KStartupCrawler, KSTARTUP_HTML), (KisedCrawler, KISED_HTML)])
+    def test_matches_inline_parsing(self, crawler_cls, html):
+        inline = crawler_cls()._parse_list(RawPage(html.encode("utf-8"), "utf-8"))
+        crawler = crawler_cls()
+        pooled = parsepool.parse_list(crawler, _resp(html))
+        assert [a.to_dict() for a in pooled] == [a.to_dict() for a in inline]
+        assert pooled and crawler.new_mark == 176543
+
+    def test_mark_state_round_trips(self):
+        crawler = KStartupCrawler(mark=176543)
+        assert parsepool.parse_list(crawler, _resp(KSTARTUP_HTML)) == []  # 이미 본 번호
+        assert crawler.new_mark == 176543
+
+    def test_worker_uses_caller_today(self):
+        start_run(date(2026, 2, 10))
+        try:
+            articles = parsepool.parse_list(KisedCrawler(), _resp(KISED_HTML))
+        finally:
+            start_run()
+        assert articles[0].date == "2026-02-10"
+
+    def test_worker_uses_caller_selector_and_returns_metrics(self, tmp_path):
+        crawler = MSSCrawler()
+        crawler.layout_store = LayoutStore(str(tmp_path / "layout.json"))
+        crawler.layout_store.observe(crawler.name, PageLayout("table tbody tr", 10, 3, 1.0))
+        parsepool.parse_list(crawler, _resp(MSS_HTML))
+        assert crawler.layout.selector == "table tbody tr"
+
+        # 학습한 선택자가 빗나가면 워커에서 센 selector_misses가 부른 쪽 지표에 더해진다
+        crawler.layout_store.observe(crawler.name, PageLayout("table.bbs_list tbody tr", 10, 3, 1.0))
+        before = metrics.counter("selector_misses", source=crawler.name)
+        parsepool.parse_list(crawler, _resp(MSS_HTML))
+        assert crawler.layout.selector == "table.boardList tbody tr"
+        assert metrics.counter("selector_misses", source=crawler.name) == before + 1
+
+    def test_falls_back_for_unimportable_crawler(self):
+        class Local(KisedCrawler):
+            pass
+
+        articles = parsepool.parse_list(Local(), _resp(KISED_HTML))
+        assert [a.title for a in articles] == ["2026년 예비창업패키지 모집"]
+
+
+class TestArticleTuple:
+    def test_round_trip(self):
+        a = Article(title="t", url="u", source="s", date="2026-02-10", deadline="2026-03-01", extra={"score": 2})
+        b = Article.from_tuple(a.to_tuple())
+        assert b == a and b.deadline_ord == a.deadline_ord
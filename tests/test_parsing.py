@@ -0,0 +1,131 @@
+"""HTML 목록 파싱 테스트 (모든 파서 백엔드)."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.crawlers import BizinfoCrawler, KisedCrawler, KStartupCrawler, MSSCrawler
+from src.crawlers.base import start_run
+from src.crawlers.parsing import PARSERS, make_soup, resolve_parser
+
+KSTARTUP_HTML = """
+<html><body>
+<div class="gnb"><ul><li>메뉴</li></ul></div>
+<div id="bizPbancList"><ul>
+  <li>
+    <div class="middle"><a href="javascript:go_view(176543);">
+      <div class="tit_wrap"><p class="tit">2026년 예비창업패키지 모집</p></div>
+    </a></div>
+    <div class="bottom">
+      <span class="list">등록일자 2026-02-10</span>
+      <span class="list">마감일자 2026-03-05</span>
+    </div>
+  </li>
+  <li><div class="middle"><a href="#">제목 없음</a></div></li>
+</ul></div>
+</body></html>
+"""
+
+KISED_HTML = """
+<html><body>
+<ul class="gnb"><li>메뉴</li></ul>
+<ul class="lstyle_list">
+  <li>
+    <a href="https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?schM=view&amp;pbancSn=176543">
+      <b class="ls_tit">2026년 예비창업패키지 모집</b>
+    </a>
+    <dl class="clearfix"><dt>기관명</dt><dd>창업진흥원</dd><dt>마감일자</dt><dd>2026-03-05</dd></dl>
+    <span class="state">진행중</span>
+  </li>
+</ul>
+</body></html>
+"""
+
+MSS_HTML = """
+<html><body>
+<table class="boardList"><tbody>
+  <tr>
+    <td>1234</td>
+    <td><a href="#" onclick="fn_detail('86', '1054321'); return false;">중기부, 창업기업 지원 확대</a></td>
+    <td>2026.02.11</td>
+  </tr>
+</tbody></table>
+</body></html>
+"""
+
+BIZINFO_HTML = """
+<html><body>
+<table class="tbl_type1"><tbody>
+  <tr>
+    <td>1</td>
+    <td><a href="/web/lay1/bbs/S1T122C128/AS/74/view.do?pblancId=PBLN_000000000012345">2026년 스마트공장 지원</a></td>
+    <td>2026-02-12</td>
+  </tr>
+</tbody></table>
+</body></html>
+"""
+
+
+def _resp(html: str) -> SimpleNamespace:
+    return SimpleNamespace(text=html, encoding=None)
+
+
+@pytest.fixture(params=PARSERS)
+def parser(request):
+    return request.param
+
+
+class TestMakeSoup:
+    def test_parse_only_limits_tree(self, parser):
+        soup = make_soup(KISED_HTML, parser, "ul.lstyle_list")
+        assert len(soup.select("li")) == 1
+
+    def test_unknown_parser(self):
+        with pytest.raises(ValueError):
+            resolve_parser("html5")
+
+
+class TestListParsing:
+    def test_kstartup(self, parser):
+        crawler = KStartupCrawler()
+        crawler.html_parser = parser
+        articles = crawler._parse_list(_resp(KSTARTUP_HTML))
+        assert len(articles) == 1
+        a = articles[0]
+        assert a.title == "2026년 예비창업패키지 모집"
+        assert a.url.endswith("?schM=view&pbancSn=176543")
+        assert (a.date, a.deadline) == ("2026-02-10", "2026-03-05")
+
+    def test_kised(self, parser):
+        crawler = KisedCrawler()
+        crawler.html_parser = parser
+        articles = crawler._parse_list(_resp(KISED_HTML))
+        assert [a.title for a in articles] == ["2026년 예비창업패키지 모집"]
+        assert articles[0].url.endswith("pbancSn=176543")
+        assert articles[0].deadline == "2026-03-05"
+
+    def test_missing_date_uses_run_today(self, parser):
+        start_run(date(2026, 2, 10))
+        try:
+            crawler = KisedCrawler()
+            crawler.html_parser = parser
+            assert crawler._parse_list(_resp(KISED_HTML))[0].date == "2026-02-10"
+        finally:
+            start_run()
+
+    def test_mss(self, parser):
+        crawler = MSSCrawler()
+        crawler.html_parser = parser
+        articles = crawler._parse_list(_resp(MSS_HTML))
+        assert [a.title for a in articles] == ["중기부, 창업기업 지원 확대"]
+        assert articles[0].url.endswith("cbIdx=86&bcIdx=1054321")
+        assert articles[0].date == "2026-02-11"
+
+    def test_bizinfo(self, parser):
+        crawler = BizinfoCrawler()
+        crawler.html_parser = parser
+        articles = crawler._parse_list(_resp(BIZINFO_HTML))
+        assert [a.title for a in articles] == ["2026년 스마트공장 지원"]
+        assert articles[0].url.endswith("pblancId=PBLN_000000000012345")
+        assert articles[0].date == "2026-02-12"
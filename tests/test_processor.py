@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from src.crawlers.base import Article
-from src.processor import CAT_NEWS, CAT_NEW, CAT_URGENT, classify, process
+from src.processor import CAT_NEWS, CAT_NEW, CAT_URGENT, Processor, classify, process
 
 
 def _make_article(
@@ -86,12 +86,76 @@ class TestProcess:
         assert "중복 기사" not in all_titles
         assert "신규 기사" in all_titles
 
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_removes_cross_source_duplicates(self, mock_save, mock_load):
+        articles = [
+            _make_article(
+                "예비창업패키지",
+                url="https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?schM=view&pbancSn=176543",
+            ),
+            _make_article(
+                "예비창업패키지 (창업진흥원)",
+                url="http://k-startup.go.kr/web/contents/bizpbanc-ongoing.do?pbancSn=176543&schM=view",
+                source="창업진흥원",
+            ),
+        ]
+        result = process(articles)
+        all_titles = [a.title for cat in result.values() for a in cat]
+        assert all_titles == ["예비창업패키지"]
+
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_clusters_near_duplicate_news(self, mock_save, mock_load):
+        articles = [
+            _make_article("중기부, 창업기업 지원 3000억 투입", source="네이버뉴스"),
+            _make_article("[속보] 중기부, 창업기업 지원에 3000억 투입", source="네이버뉴스"),
+            _make_article("스타트업 정책 간담회 개최", source="네이버뉴스"),
+        ]
+        result = process(articles)
+        news = result[CAT_NEWS]
+        assert sorted(a.title for a in news) == ["스타트업 정책 간담회 개최", "중기부, 창업기업 지원 3000억 투입"]
+        rep = next(a for a in news if a.title.startswith("중기부"))
+        assert rep.extra["duplicates"] == 1
+
+    @patch("src.processor.save_history")
+    def test_near_duplicate_of_sent_item_is_dropped(self, mock_save, tmp_path):
+        from src.history import HistoryStore
+
+        history = HistoryStore(str(tmp_path / "h.db"), legacy_file=None)
+        history.add([_make_article("중기부, 창업기업 지원 3000억 투입", source="네이버뉴스")])
+        articles = [
+            _make_article(
+                "[단독] 중기부 창업기업 지원에 3000억 투입",
+                source="네이버뉴스",
+                url="https://other.example.com/1",
+            ),
+        ]
+        assert process(articles, history) == {}
+
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_counts_dropped_articles(self, mock_save, mock_load):
+        from src.metrics import Metrics
+
+        metrics = Metrics()
+        articles = [
+            _make_article("공고 A", url="https://example.com/a"),
+            _make_article("공고 A (재게시)", url="https://example.com/a?utm_source=x"),
+            _make_article("지난 공고", url="https://example.com/b", deadline_days=-1),
+        ]
+        with patch("src.processor.metrics", metrics):
+            process(articles)
+        assert metrics.counter("dropped", reason="duplicate") == 1
+        assert metrics.counter("dropped", reason="expired") == 1
+        assert metrics.span_total("process") > 0
+
     @patch("src.processor.load_history", return_value=set())
     @patch("src.processor.save_history")
     def test_categorizes_correctly(self, mock_save, mock_load):
         articles = [
             _make_article("마감 임박", deadline_days=3, source="K-Startup"),
-            _make_article("일반 공고", deadline_days=30, source="기업마당"),
+            _make_article("창업 지원 공고", deadline_days=30, source="기업마당"),
             _make_article("정책 뉴스", source="네이버뉴스"),
         ]
         result = process(articles)
@@ -99,8 +163,74 @@ class TestProcess:
         assert CAT_NEW in result
         assert CAT_NEWS in result
 
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_drops_irrelevant_titles(self, mock_save, mock_load):
+        articles = [
+            _make_article("2026 창업도약패키지 모집", source="기업마당"),
+            _make_article("정보시스템 유지보수 입찰 공고", source="기업마당"),
+            _make_article("중기부 장관 동정", source="중소벤처기업부"),
+        ]
+        result = process(articles)
+        assert [a.title for cat in result.values() for a in cat] == ["2026 창업도약패키지 모집"]
+        assert result[CAT_NEW][0].extra["score"] == 4
+
     @patch("src.processor.load_history", return_value=set())
     @patch("src.processor.save_history")
     def test_empty_input(self, mock_save, mock_load):
         result = process([])
         assert result == {}
+
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_feeds_in_batches(self, mock_save, mock_load):
+        articles = [
+            _make_article("창업 지원 공고", deadline_days=30, source="기업마당"),
+            _make_article("창업 지원 공고", deadline_days=30, source="창업진흥원"),
+            _make_article("스타트업 정책 뉴스", source="네이버뉴스"),
+        ]
+        processor = Processor()
+        assert processor.feed(articles[:1]) == 1
+        # 다른 배치에서 온 같은 공고도 중복 — 레지스트리에서 앞선 창업진흥원의 것으로 바뀐다
+        assert processor.feed(articles[1:]) == 1
+        result = processor.finish()
+
+        assert [a.source for cat in result.values() for a in cat] == ["창업진흥원", "네이버뉴스"]
+        assert processor.received == 3
+        mock_save.assert_called_once()
+
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_duplicate_winner_ignores_arrival_order(self, mock_save, mock_load):
+        url = "https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?schM=view&pbancSn=176543"
+        kstartup = _make_article("예비창업패키지", url=url, deadline_days=30)
+        kised = _make_article("예비창업패키지 (창업진흥원)", url=url, deadline_days=30, source="창업진흥원")
+
+        for articles in ([kstartup, kised], [kised, kstartup]):
+            result = process([Article.from_dict(a.to_dict()) for a in articles])
+            assert [a.source for cat in result.values() for a in cat] == ["K-Startup"]
+
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_near_duplicate_representative_ignores_arrival_order(self, mock_save, mock_load):
+        articles = [
+            _make_article("2026년 예비창업패키지 모집 공고", deadline_days=30, source="기업마당"),
+            _make_article("[공고] 2026년 예비창업패키지 모집 공고", deadline_days=30),
+            _make_article("2026년 예비창업패키지 모집 공고 안내", deadline_days=30, source="창업진흥원"),
+        ]
+
+        for ordered in (articles, articles[::-1]):
+            result = process([Article.from_dict(a.to_dict()) for a in ordered])
+            kept = [a for cat in result.values() for a in cat]
+            assert [a.source for a in kept] == ["K-Startup"]
+            assert kept[0].extra["duplicates"] == 2
+
+    @patch("src.processor.load_history", return_value=set())
+    @patch("src.processor.save_history")
+    def test_same_day_order_follows_source_order(self, mock_save, mock_load):
+        articles = [
+            _make_article("청년 창업 지원 공고", deadline_days=30, source="기업마당"),
+            _make_article("재창업 지원 사업 공고", deadline_days=30),
+        ]
+        result = process(articles)
+        assert [a.source for a in result[CAT_NEW]] == ["K-Startup", "기업마당"]
@@ -0,0 +1,55 @@
+"""호스트별 요청 속도 제한 단위 테스트."""
+
+import asyncio
+
+from src.ratelimit import RateLimiter, TokenBucket, host_of
+
+
+class TestHostOf:
+    def test_strips_www_and_lowercases(self):
+        assert host_of("https://WWW.K-Startup.go.kr/web/list.do") == "k-startup.go.kr"
+
+
+class TestTokenBucket:
+    def test_burst_is_free(self):
+        bucket = TokenBucket(rate=1.0, burst=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+
+    def test_waits_after_burst(self):
+        bucket = TokenBucket(rate=2.0, burst=1)
+        assert bucket.reserve() == 0.0
+        assert 0.4 < bucket.reserve() <= 0.5
+        # 예약이 누적되어 다음 요청은 더 뒤로 밀린다
+        assert 0.9 < bucket.reserve() <= 1.0
+
+    def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket(rate=0, burst=1)
+        assert all(bucket.reserve() == 0.0 for _ in range(10))
+
+
+class TestRateLimiter:
+    def test_hosts_are_independent(self):
+        limiter = RateLimiter(rate=0.1, burst=1)
+        assert limiter.acquire("https://a.example.com/1") == 0.0
+        assert limiter.acquire("https://b.example.com/1") == 0.0
+
+    def test_same_host_is_throttled(self):
+        limiter = RateLimiter(rate=0.1, burst=1)
+        limiter.acquire("https://a.example.com/1")
+        assert limiter.bucket("a.example.com").reserve() > 9
+
+    def test_host_override(self):
+        limiter = RateLimiter(rate=0.1, burst=1, overrides={"api.example.com": (100.0, 5)})
+        waits = [limiter.acquire("https://api.example.com/x") for _ in range(5)]
+        assert waits == [0.0] * 5
+
+    def test_acquire_async(self):
+        limiter = RateLimiter(rate=50.0, burst=1)
+
+        async def run() -> list[float]:
+            return [await limiter.acquire_async("https://a.example.com") for _ in range(3)]
+
+        waits = asyncio.run(run())
+        assert waits[0] == 0.0
+        assert all(w <= 0.02 for w in waits)
@@ -0,0 +1,38 @@
+"""크롤러 레지스트리 테스트."""
+
+import pytest
+
+from src.crawlers import registry
+from src.crawlers.registry import CrawlerSpec
+from src.processor import NEWS_SOURCES
+from src.ratelimit import limiter
+
+
+class TestRegistry:
+    def test_specs_match_crawler_classes(self):
+        for spec in registry.REGISTRY.values():
+            cls = spec.load()
+            assert cls.__name__ == spec.class_name
+            assert cls.name == spec.name
+
+    def test_lookup_by_key_name_or_class(self):
+        spec = registry.REGISTRY["naver"]
+        assert registry.get("naver") is spec
+        assert registry.get("네이버뉴스") is spec
+        assert registry.get("NaverNewsCrawler") is spec
+        with pytest.raises(KeyError):
+            registry.get("없는소스")
+
+    def test_select_keeps_registry_order(self):
+        assert [s.key for s in registry.select(["naver", "K-Startup"])] == ["kstartup", "naver"]
+        assert [s.key for s in registry.select(exclude=["naver", "mss"])] == ["kstartup", "kised", "bizinfo"]
+
+    def test_metadata_feeds_limiter_and_processor(self):
+        assert limiter.overrides["openapi.naver.com"] == registry.REGISTRY["naver"].rate
+        assert NEWS_SOURCES == {"네이버뉴스", "중소벤처기업부"}
+
+    def test_register_plugin(self, monkeypatch):
+        monkeypatch.setattr(registry, "REGISTRY", dict(registry.REGISTRY))
+        spec = registry.register(CrawlerSpec("plugin", "플러그인", "src.crawlers.kised:KisedCrawler", host="example.com"))
+        assert registry.select(["plugin"]) == [spec]
+        assert spec.load().__name__ == "KisedCrawler"
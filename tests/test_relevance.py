@@ -0,0 +1,42 @@
+"""제목 관련도 점수 테스트."""
+
+import pytest
+
+from src.relevance import Matcher, RelevanceProfile, normalize
+
+
+class TestMatcher:
+    def test_finds_overlapping_patterns(self):
+        matcher = Matcher({"he": 0, "she": 1, "his": 2, "hers": 3})
+        assert matcher.find("ushers") == {0, 1, 3}
+        assert matcher.find("xyz") == set()
+
+    def test_normalizes_text(self):
+        matcher = Matcher({"예비창업": 0, "R&D": 1})
+        assert normalize("예비 창업 ＲＮＤ") == "예비창업rnd"
+        assert matcher.find("2026 예비 창업패키지 (Ｒ＆Ｄ)") == {0, 1}
+
+
+class TestRelevanceProfile:
+    @pytest.fixture
+    def profile(self):
+        return RelevanceProfile(
+            keywords={"창업": 3, "스타트업": 3, "TIPS": 2},
+            synonyms={"startup": "스타트업", "팁스": "TIPS"},
+            negative={"채용": 3},
+            source_weights={"K-Startup": 2},
+        )
+
+    def test_scores_terms_once(self, profile):
+        assert profile.score("창업 창업 창업") == 3
+        assert profile.score("창업 스타트업 팁스") == 8
+        assert profile.matches("Startup 팁스 프로그램") == ["스타트업", "TIPS"]
+
+    def test_negative_terms_and_source_weight(self, profile):
+        assert profile.score("스타트업 채용 공고") == 0
+        assert profile.score("일반 공고", "K-Startup") == 2
+        assert profile.score("일반 공고", "기업마당") == 0
+
+    def test_unknown_synonym_target(self):
+        with pytest.raises(ValueError):
+            RelevanceProfile({"창업": 1}, synonyms={"startup": "스타트업"})
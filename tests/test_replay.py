@@ -0,0 +1,44 @@
+"""응답 녹화/재생 테스트."""
+
+import pytest
+import requests
+
+from src import replay
+from src.crawlers import KStartupCrawler
+from tests.test_parsing import KSTARTUP_HTML
+
+
+class TestFixtures:
+    def test_roundtrip(self, tmp_path):
+        url = "https://example.com/list?page=2"
+        replay.save_fixture(str(tmp_path), "get", url, 200, {"Content-Type": "text/html", "Set-Cookie": "x"}, b"ok")
+        record = replay.load_fixture(str(tmp_path), "GET", url)
+        assert record["body"] == b"ok"
+        assert record["headers"] == {"Content-Type": "text/html"}
+        assert replay.load_fixture(str(tmp_path), "GET", "https://example.com/list?page=3") is None
+
+    def test_version_mismatch_ignored(self, tmp_path, monkeypatch):
+        url = "https://example.com/"
+        replay.save_fixture(str(tmp_path), "GET", url, 200, {}, b"ok")
+        monkeypatch.setattr(replay, "FIXTURE_VERSION", replay.FIXTURE_VERSION + 1)
+        assert replay.load_fixture(str(tmp_path), "GET", url) is None
+
+
+class TestReplay:
+    def test_crawler_replays_fixtures(self, tmp_path):
+        crawler = KStartupCrawler(lookback_days=10**6)
+        url, params = crawler.page_request(1)
+        full = requests.Request("GET", url, params=params or None).prepare().url
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        replay.save_fixture(str(tmp_path), "GET", full, 200, headers, KSTARTUP_HTML.encode("utf-8"))
+
+        replay.attach(crawler, replay_dir=str(tmp_path))
+        articles = crawler.crawl()
+        assert [a.title for a in articles] == ["2026년 예비창업패키지 모집"]
+        assert crawler.http_cache is None
+
+    def test_missing_fixture_raises(self, tmp_path):
+        session = requests.Session()
+        replay.install(session, replay_dir=str(tmp_path))
+        with pytest.raises(requests.ConnectionError):
+            session.get("https://example.com/")
@@ -0,0 +1,80 @@
+"""공유 HTTP 전송 계층 테스트."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import transport
+from src.crawlers.kised import KisedCrawler
+from src.crawlers.naver_news import NaverNewsCrawler
+
+
+@pytest.fixture
+def server():
+    """처음 한 번은 503, 그다음부터 200을 돌려주는 로컬 서버."""
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            calls.append(self.command)
+            status = 503 if len(calls) == 1 else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        do_GET = _reply
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self._reply()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}/", calls
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestTransport:
+    def test_retries_transient_status(self, server):
+        url, calls = server
+        resp = transport.session().get(url, timeout=transport.timeout_for(url))
+        assert resp.status_code == 200
+        assert calls == ["GET", "GET"]
+
+    def test_retry_takes_host_token(self, server):
+        url, calls = server
+        with patch("src.transport.limiter") as limiter:
+            transport.session().get(url, timeout=transport.timeout_for(url))
+        assert calls == ["GET", "GET"]
+        limiter.acquire.assert_called_once_with("127.0.0.1")
+
+    def test_caps_retry_after(self):
+        response = MagicMock(headers={"Retry-After": "3600"})
+        assert transport.retry_policy().get_retry_after(response) == transport.HTTP_RETRY_AFTER_MAX
+        response.headers = {"Retry-After": "2"}
+        assert transport.retry_policy().get_retry_after(response) == 2
+
+    def test_does_not_resend_post_after_response(self, server):
+        url, calls = server
+        resp = transport.session().post(url, json={}, timeout=transport.timeout_for(url))
+        assert resp.status_code == 503
+        assert calls == ["POST"]
+
+    def test_sessions_share_connection_pool(self):
+        a, b = KisedCrawler().session, NaverNewsCrawler().session
+        assert a is not b
+        assert a.get_adapter("https://example.com") is b.get_adapter("https://example.com") is transport.adapter
+        assert "X-Naver-Client-Id" not in a.headers
+
+    def test_per_host_timeout(self):
+        with patch.dict("src.transport.HOST_TIMEOUTS", {"slow.example": 60}):
+            assert transport.timeout_for("https://www.slow.example/a")[1] == 60
+            assert transport.timeout_for("https://fast.example/a")[1] == transport.REQUEST_TIMEOUT
@@ -0,0 +1,53 @@
+"""URL 정규화/지문 단위 테스트."""
+
+from src.urlnorm import canonicalize, fingerprint
+
+
+class TestCanonicalize:
+    def test_scheme_host_and_trailing_slash(self):
+        assert canonicalize("http://WWW.Example.com/news/1/") == canonicalize("https://example.com/news/1")
+
+    def test_drops_tracking_params(self):
+        assert canonicalize("https://example.com/a?utm_source=x&id=3&fbclid=y") == "example.com/a?id=3"
+
+    def test_sorts_params(self):
+        assert canonicalize("https://example.com/a?b=2&a=1") == canonicalize("https://example.com/a?a=1&b=2")
+
+    def test_drops_fragment(self):
+        assert canonicalize("https://example.com/a#top") == "example.com/a"
+
+    def test_host_whitelist(self):
+        url = "https://www.mss.go.kr/site/smba/ex/bbs/List.do?cbIdx=86&pageIndex=2&searchKey=x"
+        assert canonicalize(url) == "mss.go.kr/site/smba/ex/bbs/List.do?cbIdx=86"
+
+    def test_kised_link_matches_kstartup(self):
+        kstartup = "https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?schM=view&pbancSn=176543"
+        kised = "https://k-startup.go.kr/web/contents/bizpbanc-ongoing.do?pbancSn=176543&schM=view&page=1"
+        assert canonicalize(kstartup) == canonicalize(kised) == "k-startup.go.kr/pbanc/176543"
+
+    def test_bizinfo_pblanc_id(self):
+        url = "https://www.bizinfo.go.kr/web/lay1/bbs/S1T122C128/AS/74/view.do?pblancId=PBLN_000000000012345"
+        assert canonicalize(url) == "bizinfo.go.kr/pblanc/PBLN_000000000012345"
+
+    def test_mss_article(self):
+        a = "https://www.mss.go.kr/site/smba/ex/bbs/View.do?cbIdx=86&bcIdx=1054321&parentSeq=1054321"
+        b = "http://mss.go.kr/site/smba/ex/bbs/View.do?bcIdx=1054321&cbIdx=86"
+        assert canonicalize(a) == canonicalize(b)
+
+    def test_naver_news_forms(self):
+        a = "https://n.news.naver.com/mnews/article/015/0005012345?sid=101"
+        b = "https://news.naver.com/main/read.naver?mode=LSD&oid=015&aid=0005012345"
+        assert canonicalize(a) == canonicalize(b)
+
+
+class TestFingerprint:
+    def test_fixed_size_int(self):
+        fp = fingerprint("https://example.com/a")
+        assert isinstance(fp, int)
+        assert -(2**63) <= fp < 2**63
+
+    def test_equal_for_equivalent_urls(self):
+        assert fingerprint("http://example.com/a/?utm_medium=x") == fingerprint("https://www.example.com/a")
+
+    def test_differs_for_different_urls(self):
+        assert fingerprint("https://example.com/a") != fingerprint("https://example.com/b")